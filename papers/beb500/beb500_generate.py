@@ -225,8 +225,7 @@ def run(args):
     reporting.initialize(__file__)
     metadata = reporting.create_metadata_dict()
 
-    tracks = DataLoadUtils.getTrackWithAnalysis()
-    tracks = tracks.query('site == "BEB" and level == "500"').copy()
+    tracks = DataLoadUtils.getTrackWithAnalysis(site='BEB', level='500')
     tracks['number'] = tracks['number'].str.zfill(4)
 
     for trackwayNumber in tracks['trackwayNumber'].unique():
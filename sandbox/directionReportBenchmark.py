@@ -0,0 +1,91 @@
+# directionReportBenchmark.py
+# (C)2016
+# Scott Ernst
+
+# Runs the DirectionAnalyzer and reports the time spent writing pages into its PDF reports, the
+# peak disk use of the analyzer's temporary folder during the run, and the size and page count of
+# each PDF report that was written. The raster threshold for dense plot layers can be specified,
+# where a threshold of 0 disables rasterization so that the two report sizes can be compared.
+#
+#   python directionReportBenchmark.py [RASTER_THRESHOLD]
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import os
+import sys
+import threading
+import time
+
+from pyglass.app.PyGlassEnvironment import PyGlassEnvironment
+PyGlassEnvironment.initializeFromInternalPath(__file__)
+
+from cadence.analysis.AnalysisStage import AnalysisStage
+from cadence.analysis.direction.DirectionAnalyzer import DirectionAnalyzer
+from cadence.analysis.shared.plotting.PdfReport import PdfReport
+
+RASTER_THRESHOLD = int(sys.argv[1]) if len(sys.argv) > 1 else PdfReport.DEFAULT_RASTER_THRESHOLD
+POLL_INTERVAL = 0.05
+
+timings = dict()
+peakTempSize = [0]
+
+#___________________________________________________________________________________________________
+def timed(name, method):
+    def wrapper(self, *args, **kwargs):
+        start = time.time()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            timings[self.path] = timings.get(self.path, 0.0) + time.time() - start
+    wrapper.__name__ = name
+    return wrapper
+
+#___________________________________________________________________________________________________
+def getReport(self, fileName =None, **kwargs):
+    kwargs.setdefault('rasterThreshold', RASTER_THRESHOLD)
+    return createReport(self, fileName, **kwargs)
+
+#___________________________________________________________________________________________________
+def getFolderSize(path):
+    out = 0
+    for folder, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                out += os.path.getsize(os.path.join(folder, name))
+            except OSError:
+                pass
+    return out
+
+#___________________________________________________________________________________________________
+def pollTempFolder(path, done):
+    while not done.is_set():
+        peakTempSize[0] = max(peakTempSize[0], getFolderSize(path))
+        done.wait(POLL_INTERVAL)
+
+#___________________________________________________________________________________________________
+createReport = AnalysisStage.getReport
+AnalysisStage.getReport = getReport
+PdfReport.addFigure = timed('addFigure', PdfReport.addFigure)
+PdfReport.close = timed('close', PdfReport.close)
+
+analyzer = DirectionAnalyzer()
+
+finished = threading.Event()
+poller = threading.Thread(target=pollTempFolder, args=(analyzer.tempPath, finished))
+poller.daemon = True
+poller.start()
+
+start = time.time()
+analyzer.run()
+elapsed = time.time() - start
+
+finished.set()
+poller.join()
+
+print('[RUN]: %.2f seconds (raster threshold %s)' % (elapsed, RASTER_THRESHOLD))
+print('[TEMP]: %.1f KB peak' % (peakTempSize[0]/1024.0))
+for path in sorted(timings.keys()):
+    with open(path, 'rb') as f:
+        pages = f.read().count(b'/Type /Page') - 1
+    print('[REPORT]: %s\n    %s pages, %.1f KB, %.2f seconds' % (
+        os.path.basename(path), pages, os.path.getsize(path)/1024.0, timings[path]))
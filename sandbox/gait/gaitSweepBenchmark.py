@@ -0,0 +1,54 @@
+# gaitSweepBenchmark.py
+# (C)2016
+# Scott Ernst
+
+# Generates a parameter sweep over the phase and fore and hind duty factors of the default gait,
+# first one gait at a time with the GaitGenerator and then with the GaitBatchGenerator, both within
+# this process and across a pool of worker processes. Reports the wall time of each method and
+# whether every batch generated gait is identical to its single-gait output.
+#
+#   python gaitSweepBenchmark.py [STEP_SIZE] [PROCESS_COUNT]
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import multiprocessing
+import sys
+import time
+
+from cadence.config.enum.GaitConfigEnum import GaitConfigEnum
+from cadence.generator.gait.GaitBatchGenerator import GaitBatchGenerator
+from cadence.generator.gait.GaitGenerator import GaitGenerator
+
+STEP_SIZE     = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+PROCESS_COUNT = int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count()
+
+#___________________________________________________________________________________________________
+def getChannels(generator):
+    return [channel.toDict() for channel in generator.toCadenceData().channels]
+
+#___________________________________________________________________________________________________
+if __name__ == '__main__':
+    configs = GaitBatchGenerator.createSweepConfigs({
+        GaitConfigEnum.PHASE:list(range(0, 100, STEP_SIZE)),
+        GaitConfigEnum.DUTY_FACTOR_FORE:list(range(STEP_SIZE, 100, STEP_SIZE)),
+        GaitConfigEnum.DUTY_FACTOR_HIND:list(range(STEP_SIZE, 100, STEP_SIZE)) })
+    print('[SWEEP]: %s gaits' % len(configs))
+
+    start = time.time()
+    expected = []
+    for config in configs:
+        generator = GaitGenerator(**config)
+        generator.run()
+        expected.append(getChannels(generator))
+    print('[SINGLE]: %.3f seconds' % (time.time() - start))
+
+    for label, processes in [('BATCH', None), ('BATCH x%s' % PROCESS_COUNT, PROCESS_COUNT)]:
+        start = time.time()
+        batch = GaitBatchGenerator(configs)
+        batch.run(processes=processes)
+        print('[%s]: %.3f seconds' % (label, time.time() - start))
+
+        identical = all([
+            getChannels(generator) == channels
+            for generator, channels in zip(batch.generators, expected) ])
+        print('[%s IDENTICAL]: %s' % (label, identical))
@@ -0,0 +1,133 @@
+# incrementalAnalysisCheck.py
+# (C)2016
+# Scott Ernst
+
+# Verifies incremental analysis of a partial change against a clean run. The analyzer is run once
+# in incremental mode to record its manifest, then a single track is moved slightly, which changes
+# only the sitemap in which that track resides. The analyzer is run incrementally once more and its
+# output folder is copied aside before a clean run of the same analyzer. The two output folders
+# are then compared file by file and the track is moved back. Log files and the incremental
+# folder are excluded from the comparison, as are the creation dates and ids of PDF files.
+#
+#   python incrementalAnalysisCheck.py [AnalyzerName] [TrackUid]
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import hashlib
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+from pyglass.app.PyGlassEnvironment import PyGlassEnvironment
+PyGlassEnvironment.initializeFromInternalPath(__file__)
+
+from cadence.analysis.AnalyzeAll import AnalyzeAll
+from cadence.analysis.AnalyzerBase import AnalyzerBase
+from cadence.analysis.TrackGraph import TrackGraph
+from cadence.analysis.shared import DataLoadUtils
+from cadence.models.tracks.Tracks_Track import Tracks_Track
+
+ANALYZER_NAME = sys.argv[1] if len(sys.argv) > 1 else 'StatusAnalyzer'
+TRACK_UID = sys.argv[2] if len(sys.argv) > 2 else None
+IGNORED_EXTENSIONS = ['.log', '.txt']
+PDF_VOLATILE_PATTERN = re.compile(br'/(CreationDate|ModDate) *\([^)]*\)|/ID *\[[^\]]*\]')
+TRACK_OFFSET = 1.0
+
+#___________________________________________________________________________________________________
+def getAnalyzerClass(name):
+    for AnalyzerClass in AnalyzeAll.ANALYZERS:
+        if AnalyzerClass.__name__ == name:
+            return AnalyzerClass
+    raise ValueError('Unknown analyzer "%s"' % name)
+
+#___________________________________________________________________________________________________
+def getTrackUid():
+    """ Returns the uid of the first track in the first series of the analyzed sitemaps. """
+    graph = TrackGraph(
+        sitemapFilters=DataLoadUtils.getAnalysisSettings().get('SITEMAP_FILTERS', []))
+    try:
+        for sitemap in graph.getSitemaps():
+            for trackway in graph.getTrackways(sitemap):
+                for series in graph.getSeriesBundle(trackway).asList():
+                    if series.tracks:
+                        return series.tracks[0].uid
+    finally:
+        graph.close()
+    raise ValueError('No tracks found to change')
+
+#___________________________________________________________________________________________________
+def moveTrack(uid, offset):
+    model = Tracks_Track.MASTER
+    session = model.createSession()
+    try:
+        track = session.query(model).filter(model.uid == uid).one()
+        track.x += offset
+        session.commit()
+    finally:
+        session.close()
+
+#___________________________________________________________________________________________________
+def runAnalyzer(**kwargs):
+    analyzer = AnalyzerClass(**kwargs)
+    analyzer.run()
+    if not analyzer.success:
+        raise Exception('Analysis failed: %s' % analyzer.errorMessage)
+    return analyzer
+
+#___________________________________________________________________________________________________
+def getDigests(rootPath):
+    out = dict()
+    for folder, dirs, files in os.walk(rootPath):
+        if AnalyzerBase.INCREMENTAL_FOLDER_NAME in dirs:
+            dirs.remove(AnalyzerBase.INCREMENTAL_FOLDER_NAME)
+
+        for name in files:
+            extension = os.path.splitext(name)[-1].lower()
+            if extension in IGNORED_EXTENSIONS:
+                continue
+
+            path = os.path.join(folder, name)
+            with open(path, 'rb') as f:
+                data = f.read()
+            if extension == '.pdf':
+                data = PDF_VOLATILE_PATTERN.sub(b'', data)
+            out[os.path.relpath(path, rootPath)] = hashlib.sha1(data).hexdigest()
+    return out
+
+#___________________________________________________________________________________________________
+AnalyzerClass = getAnalyzerClass(ANALYZER_NAME)
+trackUid = TRACK_UID if TRACK_UID else getTrackUid()
+
+print('[BASELINE RUN]: %s' % runAnalyzer(incremental=True).runMode)
+
+incrementalPath = tempfile.mkdtemp()
+shutil.rmtree(incrementalPath)
+
+moveTrack(trackUid, TRACK_OFFSET)
+try:
+    analyzer = runAnalyzer(incremental=True)
+    print('[CHANGED TRACK]: %s' % trackUid)
+    print('[INCREMENTAL RUN]: %s' % analyzer.runMode)
+    shutil.copytree(analyzer.getPath(isDir=True), incrementalPath)
+
+    analyzer = runAnalyzer()
+    incremental = getDigests(incrementalPath)
+    clean = getDigests(analyzer.getPath(isDir=True))
+finally:
+    moveTrack(trackUid, -TRACK_OFFSET)
+    if os.path.exists(incrementalPath):
+        shutil.rmtree(incrementalPath)
+
+missing = sorted(set(clean.keys()) - set(incremental.keys()))
+extra = sorted(set(incremental.keys()) - set(clean.keys()))
+different = sorted(k for k in clean if k in incremental and clean[k] != incremental[k])
+
+for label, items in [('MISSING', missing), ('EXTRA', extra), ('DIFFERENT', different)]:
+    for item in items:
+        print('[%s]: %s' % (label, item))
+
+matched = not (missing or extra or different)
+print('[RESULT]: %s' % ('MATCH' if matched else 'MISMATCH'))
+sys.exit(0 if matched else 1)
@@ -0,0 +1,66 @@
+# cadenceBinaryBenchmark.py
+# (C)2016
+# Scott Ernst
+
+# Generates a long gait with the GaitGenerator and writes it in the JSON and binary Cadence data
+# formats to a temporary folder. Reports the file size of each format, the time taken to load each
+# file with all of its channels or with a single channel, and whether the binary file converts
+# losslessly back to the JSON format.
+#
+#   python cadenceBinaryBenchmark.py [CYCLE_COUNT] [REPEAT_COUNT]
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from cadence.config.enum.GaitConfigEnum import GaitConfigEnum
+from cadence.generator.gait.GaitGenerator import GaitGenerator
+from cadence.shared.enum.ChannelsEnum import ChannelsEnum
+from cadence.shared.io.CadenceData import CadenceData
+
+CYCLE_COUNT  = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+REPEAT_COUNT = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+#___________________________________________________________________________________________________
+def timeLoad(path, loadAll):
+    start = time.time()
+    for i in range(REPEAT_COUNT):
+        cd = CadenceData()
+        cd.loadFile(path)
+        if loadAll:
+            cd.channels
+        else:
+            cd.getChannelsByKind(ChannelsEnum.POSITION)[0]
+    return (time.time() - start)/REPEAT_COUNT
+
+#___________________________________________________________________________________________________
+generator = GaitGenerator(overrides={GaitConfigEnum.CYCLES:CYCLE_COUNT})
+generator.run()
+data = generator.toCadenceData()
+
+outputPath = tempfile.mkdtemp()
+expected = json.loads(data.write(outputPath, name='gait'))
+paths = {
+    'JSON':os.path.join(outputPath, 'gait' + CadenceData.EXTENSION),
+    'BINARY':data.writeBinary(outputPath, name='gait') }
+
+print('[GAIT]: %s cycles, %s keys' % (
+    CYCLE_COUNT, sum([len(c.keys) for c in data.channels])))
+
+for label in ['JSON', 'BINARY']:
+    print('[%s]: %.1f KB, %.4f seconds (all channels), %.4f seconds (one channel)' % (
+        label,
+        os.path.getsize(paths[label])/1024.0,
+        timeLoad(paths[label], True),
+        timeLoad(paths[label], False) ))
+
+converted = CadenceData()
+converted.loadFile(paths['BINARY'])
+print('[LOSSLESS]: %s' % (json.loads(converted.write()) == expected))
+
+shutil.rmtree(outputPath)
@@ -0,0 +1,102 @@
+# parallelAnalysisCheck.py
+# (C)2016
+# Scott Ernst
+
+# Verifies parallel sitemap analysis against a serial run and reports the time taken by each. The
+# analyzer is run serially and its output folder is copied aside before the same analyzer is run
+# with the specified number of worker processes. The two output folders are then compared file by
+# file. Log files and the incremental folder are excluded from the comparison, as are the creation
+# dates and ids of PDF files. The worker count defaults to the number of CPU cores.
+#
+#   python parallelAnalysisCheck.py [AnalyzerName] [WorkerCount]
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import hashlib
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+from pyglass.app.PyGlassEnvironment import PyGlassEnvironment
+PyGlassEnvironment.initializeFromInternalPath(__file__)
+
+from cadence.analysis.AnalyzeAll import AnalyzeAll
+from cadence.analysis.AnalyzerBase import AnalyzerBase
+
+ANALYZER_NAME = sys.argv[1] if len(sys.argv) > 1 else 'CurvatureAnalyzer'
+WORKER_COUNT = int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count()
+IGNORED_EXTENSIONS = ['.log', '.txt']
+PDF_VOLATILE_PATTERN = re.compile(br'/(CreationDate|ModDate) *\([^)]*\)|/ID *\[[^\]]*\]')
+
+#___________________________________________________________________________________________________
+def getAnalyzerClass(name):
+    for AnalyzerClass in AnalyzeAll.ANALYZERS:
+        if AnalyzerClass.__name__ == name:
+            return AnalyzerClass
+    raise ValueError('Unknown analyzer "%s"' % name)
+
+#___________________________________________________________________________________________________
+def runAnalyzer(**kwargs):
+    start = time.time()
+    analyzer = AnalyzerClass(**kwargs)
+    analyzer.run()
+    if not analyzer.success:
+        raise Exception('Analysis failed: %s' % analyzer.errorMessage)
+    return analyzer, time.time() - start
+
+#___________________________________________________________________________________________________
+def getDigests(rootPath):
+    out = dict()
+    for folder, dirs, files in os.walk(rootPath):
+        if AnalyzerBase.INCREMENTAL_FOLDER_NAME in dirs:
+            dirs.remove(AnalyzerBase.INCREMENTAL_FOLDER_NAME)
+
+        for name in files:
+            extension = os.path.splitext(name)[-1].lower()
+            if extension in IGNORED_EXTENSIONS:
+                continue
+
+            path = os.path.join(folder, name)
+            with open(path, 'rb') as f:
+                data = f.read()
+            if extension == '.pdf':
+                data = PDF_VOLATILE_PATTERN.sub(b'', data)
+            out[os.path.relpath(path, rootPath)] = hashlib.sha1(data).hexdigest()
+    return out
+
+#___________________________________________________________________________________________________
+AnalyzerClass = getAnalyzerClass(ANALYZER_NAME)
+
+serialPath = tempfile.mkdtemp()
+shutil.rmtree(serialPath)
+
+try:
+    analyzer, serialTime = runAnalyzer(parallel=False)
+    print('[SERIAL RUN]: %.2fs' % serialTime)
+    shutil.copytree(analyzer.getPath(isDir=True), serialPath)
+
+    analyzer, parallelTime = runAnalyzer(parallel=WORKER_COUNT)
+    print('[PARALLEL RUN]: %.2fs (%s workers)' % (parallelTime, analyzer.parallelWorkerCount))
+    print('[SPEEDUP]: %.2fx' % (serialTime/max(parallelTime, 1.0e-6)))
+
+    serial = getDigests(serialPath)
+    parallel = getDigests(analyzer.getPath(isDir=True))
+finally:
+    if os.path.exists(serialPath):
+        shutil.rmtree(serialPath)
+
+missing = sorted(set(serial.keys()) - set(parallel.keys()))
+extra = sorted(set(parallel.keys()) - set(serial.keys()))
+different = sorted(k for k in serial if k in parallel and serial[k] != parallel[k])
+
+for label, items in [('MISSING', missing), ('EXTRA', extra), ('DIFFERENT', different)]:
+    for item in items:
+        print('[%s]: %s' % (label, item))
+
+matched = not (missing or extra or different)
+print('[RESULT]: %s' % ('MATCH' if matched else 'MISMATCH'))
+sys.exit(0 if matched else 1)
@@ -0,0 +1,76 @@
+# seriesLoadBenchmark.py
+# (C)2016
+# Scott Ernst
+
+# Compares loading the TrackSeriesBundle of every trackway by following each series link with
+# its own query against the bulk sitemap loader, verifying that both produce identical series
+# and reporting the query count and wall time of each approach on the full tracks database.
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import time
+
+import sqlalchemy as sqla
+from pyglass.app.PyGlassEnvironment import PyGlassEnvironment
+PyGlassEnvironment.initializeFromInternalPath(__file__)
+
+from cadence.analysis.TrackSeriesBundle import TrackSeriesBundle
+from cadence.models.tracks.Tracks_SiteMap import Tracks_SiteMap
+
+model = Tracks_SiteMap.MASTER
+
+#___________________________________________________________________________________________________
+def createQueryCounter(session):
+    counter = {'count':0}
+
+    def onExecute(*args, **kwargs):
+        counter['count'] += 1
+
+    sqla.event.listen(session.bind, 'before_cursor_execute', onExecute)
+    return counter
+
+#___________________________________________________________________________________________________
+def loadLinked(session):
+    out = dict()
+    for sitemap in session.query(model).all():
+        for trackway in sitemap.getTrackways():
+            bundle = TrackSeriesBundle(trackway)
+            bundle.load()
+            out[trackway.uid] = bundle
+    return out
+
+#___________________________________________________________________________________________________
+def loadBulk(session):
+    out = dict()
+    for sitemap in session.query(model).all():
+        out.update(sitemap.getTrackwaySeriesBundles())
+    return out
+
+#___________________________________________________________________________________________________
+def runLoader(loader):
+    session = model.createSession()
+    counter = createQueryCounter(session)
+
+    start = time.time()
+    bundles = loader(session)
+    elapsed = time.time() - start
+
+    result = dict()
+    for uid, bundle in bundles.items():
+        result[uid] = [(
+            [t.uid for t in series.tracks],
+            [t.uid for t in series.incompleteTracks]) for series in bundle.asList()]
+
+    session.close()
+    return result, counter['count'], elapsed
+
+#___________________________________________________________________________________________________
+linked, linkedQueries, linkedTime = runLoader(loadLinked)
+bulk, bulkQueries, bulkTime = runLoader(loadBulk)
+
+mismatches = [uid for uid in linked if linked[uid] != bulk.get(uid)]
+
+print('[TRACKWAYS]: %s' % len(linked))
+print('[LINKED]: %s queries in %.3f seconds' % (linkedQueries, linkedTime))
+print('[BULK]: %s queries in %.3f seconds' % (bulkQueries, bulkTime))
+print('[MISMATCHES]: %s' % (', '.join(mismatches) if mismatches else 'None'))
@@ -0,0 +1,115 @@
+# streamingDrawingBenchmark.py
+# (C)2016
+# Scott Ernst
+
+# Compares the svgwrite and streaming CadenceDrawing backends on the sitemap with the most tracks,
+# drawing the grid, track labels and uncertainty rectangles the way the uncertainty stages do.
+# Reports the wall time and peak traced memory of each backend and whether their SVG output is
+# byte-identical. The drawings are written to a temporary folder that is removed afterwards.
+#
+#   python streamingDrawingBenchmark.py [REPEAT_COUNT]
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+import sqlalchemy as sqla
+from pyglass.app.PyGlassEnvironment import PyGlassEnvironment
+PyGlassEnvironment.initializeFromInternalPath(__file__)
+
+from cadence.models.tracks.Tracks_SiteMap import Tracks_SiteMap
+from cadence.models.tracks.Tracks_Track import Tracks_Track
+from cadence.svg.CadenceDrawing import CadenceDrawing
+
+REPEAT_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+#___________________________________________________________________________________________________
+def getLargestSitemap(session):
+    model = Tracks_Track.MASTER
+    site, level, count = session.query(
+        model.site, model.level, sqla.func.count(model.i)
+    ).group_by(model.site, model.level).order_by(sqla.func.count(model.i).desc()).first()
+
+    sitemaps = Tracks_SiteMap.MASTER
+    sitemap = session.query(sitemaps).filter(
+        sitemaps.name == site).filter(sitemaps.level == level).first()
+    return sitemap, count
+
+#___________________________________________________________________________________________________
+def draw(path, sitemap, tracks, session, streaming):
+    drawing = CadenceDrawing(path, sitemap, session=session, streaming=streaming)
+    drawing.grid()
+    drawing.federalCoordinates()
+
+    drawing.createGroup('rect1')
+    drawing.rect((0, 0), 100, 100, scene=True, groupId='rect1')
+
+    for track in tracks:
+        drawing.use(
+            'rect1',
+            (track.x, track.z),
+            scene=True,
+            rotation=track.rotation,
+            scale=track.width,
+            scaleY=track.length,
+            fill='none',
+            stroke='blue',
+            stroke_width=1)
+
+    drawing.save(toPDF=False)
+
+#___________________________________________________________________________________________________
+def runBackend(path, sitemap, tracks, session, streaming):
+    gc.collect()
+    if tracemalloc:
+        tracemalloc.start()
+
+    start = time.time()
+    for i in range(REPEAT_COUNT):
+        draw(path, sitemap, tracks, session, streaming)
+    elapsed = (time.time() - start)/REPEAT_COUNT
+
+    peak = None
+    if tracemalloc:
+        peak = tracemalloc.get_traced_memory()[1]/float(1 << 20)
+        tracemalloc.stop()
+    return elapsed, peak
+
+#___________________________________________________________________________________________________
+session = Tracks_SiteMap.MASTER.createSession()
+sitemap, trackCount = getLargestSitemap(session)
+
+model = Tracks_Track.MASTER
+tracks = session.query(model).filter(
+    model.site == sitemap.name).filter(model.level == sitemap.level).all()
+
+print('[SITEMAP]: %s-%s (%s tracks)' % (sitemap.name, sitemap.level, trackCount))
+
+outputPath = tempfile.mkdtemp()
+paths = dict()
+for label, streaming in [('SVGWRITE', False), ('STREAMING', True)]:
+    paths[label] = os.path.join(outputPath, '%s.svg' % label)
+    elapsed, peak = runBackend(paths[label], sitemap, tracks, session, streaming)
+    print('[%s]: %.3f seconds, %s peak' % (
+        label, elapsed, '%.1f MB' % peak if peak is not None else 'unknown'))
+
+with open(paths['SVGWRITE'], 'rb') as f:
+    expected = f.read()
+with open(paths['STREAMING'], 'rb') as f:
+    actual = f.read()
+
+print('[SIZE]: %.1f MB' % (len(expected)/float(1 << 20)))
+print('[IDENTICAL]: %s' % (expected == actual))
+
+shutil.rmtree(outputPath)
+session.close()
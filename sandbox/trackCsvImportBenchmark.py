@@ -0,0 +1,119 @@
+# trackCsvImportBenchmark.py
+# (C)2016
+# Scott Ernst
+
+# Times the TrackCsvImporter against a synthetic catalog spreadsheet, 50,000 rows by default,
+# reporting the query count and wall time of the import. Pass --legacy to also time the per-row
+# reconciliation, where each row scans the remaining tracks and queries for existing tracks, for
+# comparison. Both sessions are rolled back so the database is not modified.
+#
+#   python trackCsvImportBenchmark.py [ROW_COUNT] [--legacy]
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+import sqlalchemy as sqla
+from pyaid.debug.Logger import Logger
+from pyaid.reflection.Reflection import Reflection
+from pyglass.app.PyGlassEnvironment import PyGlassEnvironment
+PyGlassEnvironment.initializeFromInternalPath(__file__)
+
+from cadence.data.TrackCsvImporter import TrackCsvImporter
+from cadence.enums.TrackCsvColumnEnum import TrackCsvColumnEnum
+from cadence.models.analysis.Analysis_Track import Analysis_Track
+from cadence.models.tracks.Tracks_Track import Tracks_Track
+
+ARGS = [a for a in sys.argv[1:] if not a.startswith('--')]
+ROW_COUNT = int(ARGS[0]) if ARGS else 50000
+LEGACY = '--legacy' in sys.argv
+
+TCCE = TrackCsvColumnEnum
+
+#*************************************************************************************************** LegacyTrackCsvImporter
+class LegacyTrackCsvImporter(TrackCsvImporter):
+    """ Disables the existing track indexes to reconcile each row with per-row searches. """
+
+    def loadExistingTracks(self, session):
+        super(LegacyTrackCsvImporter, self).loadExistingTracks(session)
+        self._existingTracks = None
+
+#___________________________________________________________________________________________________
+def createQueryCounter(session):
+    counter = {'count':0}
+
+    def onExecute(*args, **kwargs):
+        counter['count'] += 1
+
+    sqla.event.listen(session.bind, 'before_cursor_execute', onExecute)
+    return counter
+
+#___________________________________________________________________________________________________
+def createCsvFile(path, count):
+    columns = Reflection.getReflectionList(TrackCsvColumnEnum)
+    width = max(c.index for c in columns) + 1
+
+    with open(path, 'w') as f:
+        writer = csv.writer(f)
+        header = [''] * width
+        for column in columns:
+            header[column.index] = column.name
+        writer.writerow(header)
+
+        for i in range(count):
+            row = [''] * width
+            limb = ['LP', 'RP', 'LM', 'RM'][i % 4]
+            row[TCCE.INDEX.index] = i + 1
+            row[TCCE.TRACKSITE.index] = 'BEB'
+            row[TCCE.LEVEL.index] = '500'
+            row[TCCE.TRACKWAY.index] = 'S%s' % (i // 400 + 1)
+            row[TCCE.SECTOR.index] = 'A'
+            row[TCCE.TRACK_NAME.index] = '%s%s' % (limb, (i // 4) % 100 + 1)
+            row[TCCE.MEASURED_BY.index] = 'BENCHMARK'
+            row[TCCE.MEASURED_DATE.index] = '2014'
+
+            prefix = 'PES' if limb.endswith('P') else 'MANUS'
+            row[getattr(TCCE, prefix + '_LENGTH').index] = round(random.uniform(20, 80), 1)
+            row[getattr(TCCE, prefix + '_WIDTH').index] = round(random.uniform(20, 80), 1)
+            row[getattr(TCCE, prefix + '_STRIDE').index] = round(random.uniform(100, 300), 1)
+            writer.writerow(row)
+
+#___________________________________________________________________________________________________
+def runImport(ImporterClass, path):
+    session = Tracks_Track.MASTER.createSession()
+    aSession = Analysis_Track.MASTER.createSession()
+    counter = createQueryCounter(session)
+
+    importer = ImporterClass(path=path, logger=Logger('benchmark', printOut=False))
+    start = time.time()
+    importer.read(session, aSession)
+    elapsed = time.time() - start
+
+    result = (len(importer.created), len(importer.modified), counter['count'], elapsed)
+
+    session.rollback()
+    session.close()
+    aSession.rollback()
+    aSession.close()
+    return result
+
+#___________________________________________________________________________________________________
+random.seed(1234)
+csvPath = os.path.join(tempfile.mkdtemp(), 'benchmark-tracks.csv')
+createCsvFile(csvPath, ROW_COUNT)
+
+print('[ROWS]: %s' % ROW_COUNT)
+print('[INDEXED]: %s created, %s modified, %s queries in %.3f seconds' % runImport(
+    TrackCsvImporter, csvPath))
+
+if LEGACY:
+    print('[LEGACY]: %s created, %s modified, %s queries in %.3f seconds' % runImport(
+        LegacyTrackCsvImporter, csvPath))
+
+os.remove(csvPath)
+os.rmdir(os.path.dirname(csvPath))
@@ -13,6 +13,8 @@ from pyaid.string.StringUtils import StringUtils
 from pyaid.system.SystemUtils import SystemUtils
 from pyaid.time.TimeUtils import TimeUtils
 from cadence.analysis.AnalyzerBase import AnalyzerBase
+from cadence.analysis.SitemapWorker import SitemapWorkerLogger
+from cadence.analysis.shared.plotting.PdfReport import PdfReport
 from cadence.svg.CadenceDrawing import CadenceDrawing
 
 try:
@@ -28,6 +30,38 @@ class AnalysisStage(object):
 #===============================================================================
 #                                                                                       C L A S S
 
+    # Stages that can reuse the analysis of unchanged sitemaps in an incremental analyzer run.
+    # Each sitemap is analyzed by a new instance of the stage with the same rules as PARALLEL
+    # stages, and the value returned by _getSitemapResult() is stored. In later partial runs
+    # the stored values of the unchanged sitemaps are passed to _mergeSitemapResult() instead
+    # of analyzing those sitemaps again, so the values cannot reference model instances, and
+    # the per-sitemap files of unchanged sitemaps must not be removed by the stage.
+    INCREMENTAL = False
+
+    # The analysis values this stage reads, as lists of analysis model property names keyed by
+    # 'sitemap', 'trackway' or 'track', e.g. {'track':['curvePosition']}. Incremental runs
+    # analyze a sitemap again when any of these values that are written by other analyzers
+    # change. See AnalyzerBase.getStageFingerprints().
+    ANALYSIS_INPUTS = dict()
+
+    # The analysis values this stage writes, in the same format as ANALYSIS_INPUTS
+    ANALYSIS_OUTPUTS = dict()
+
+    # Stages that can analyze each sitemap independently in a separate worker process when the
+    # owning analyzer runs in parallel mode. Such stages may only change analysis values and write
+    # per-sitemap files within _analyzeSitemap(). Any other data needed after the sitemaps are
+    # analyzed must be returned by _getSitemapResult() and folded back in by _mergeSitemapResult().
+    PARALLEL = False
+
+#_______________________________________________________________________________
+    def __new__(cls, *args, **kwargs):
+        """ Stores the constructor arguments on each new instance, which are used to create
+            the isolated instances of the stage. See _getIsolatedSitemapResult(). """
+
+        out = super(AnalysisStage, cls).__new__(cls)
+        out._constructorArgs = (args, kwargs)
+        return out
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, label =None, **kwargs):
         """Creates a new instance of AnalysisStage.
@@ -41,6 +75,8 @@ class AnalysisStage(object):
         self._cache = ConfigsDict()
         self._label = label if label else self.__class__.__name__
         self._startTime = None
+        self._reports   = dict()
+        self._logger    = None
 
 #===============================================================================
 #                                                                                   G E T / S E T
@@ -72,8 +108,9 @@ class AnalysisStage(object):
     @property
     def logger(self):
         """ The Logger instance for writing all analysis process information. This logger
-            instance is owned by the AnalyzerBase and shared across stages. """
-        return self.owner.logger
+            instance is owned by the AnalyzerBase and shared across stages, except for isolated
+            instances of a stage, which record their log output. """
+        return self._logger if self._logger else self.owner.logger
 
 #_______________________________________________________________________________
     @property
@@ -98,11 +135,13 @@ class AnalysisStage(object):
 #_______________________________________________________________________________
     def initializeFolder(self, *args):
         """ Initializes a folder within the root analysis path by removing any existing contents
-            and then creating a new folder if it does not already exist. """
+            and then creating a new folder if it does not already exist. The contents are kept
+            in partial incremental runs, where they include the files of unchanged sitemaps. """
         path = self.getPath(*args, isDir=True)
-        if os.path.exists(path):
+        if os.path.exists(path) and self.owner.runMode != AnalyzerBase.PARTIAL_RUN:
             SystemUtils.remove(path)
-        os.makedirs(path)
+        if not os.path.exists(path):
+            os.makedirs(path)
         return path
 
 #_______________________________________________________________________________
@@ -150,11 +189,54 @@ class AnalysisStage(object):
 
         self._startTime = TimeUtils.getNowDatetime()
         self._writeHeader()
-        self._preAnalyze()
-        self._analyze()
-        self._postAnalyze()
+        try:
+            self._preAnalyze()
+            self._analyze()
+            self._postAnalyze()
+        finally:
+            self._closeReports()
         self._writeFooter()
 
+#_______________________________________________________________________________
+    # noinspection PyMethodMayBeStatic
+    def getIncrementalInputs(self):
+        """ A hook method that returns a JSON-serializable value describing the data this stage
+            reads other than the sitemaps, trackways and tracks provided by the analyzer, such as
+            tracks queried directly from the database. Incremental runs are not skipped when
+            this value changes. As such data is read again in every run that is not skipped, it
+            must not be used within _analyzeSitemap() by INCREMENTAL stages. """
+        return None
+
+#_______________________________________________________________________________
+    # noinspection PyMethodMayBeStatic
+    def getIncrementalSitemapInputs(self, sitemap):
+        """ A hook method that returns a JSON-serializable value describing the data used by
+            _analyzeSitemap() for the specified sitemap that is derived from other sitemaps,
+            such as statistics gathered by an earlier stage over every sitemap. INCREMENTAL stages
+            only reuse the stored result of a sitemap while this value is unchanged. It is called
+            within the parent analyzer after the earlier stages have completed. """
+        return None
+
+#_______________________________________________________________________________
+    def getReport(self, fileName =None, **kwargs):
+        """ Returns the PdfReport with the given file name within the root analysis path, creating
+            it if it does not already exist. Plots added to the report are written directly into
+            the report file as new pages, and the report is closed when the analysis process for
+            this stage completes.
+
+            [fileName] :: String :: None
+                The name of the report file. If not specified, a file name will be created using
+                the name of this class.
+
+            [kwargs]
+                Arguments passed to the PdfReport constructor when the report is created, such as
+                the rasterThreshold for dense plot layers. """
+
+        fileName = self._getReportFileName(fileName)
+        if fileName not in self._reports:
+            self._reports[fileName] = PdfReport(self.getPath(fileName, isFile=True), **kwargs)
+        return self._reports[fileName]
+
 #_______________________________________________________________________________
     def mergePdfs(self, paths, fileName =None):
         """ Takes a list of paths to existing PDF files and merges them into a single pdf with
@@ -169,11 +251,7 @@ class AnalysisStage(object):
             with open(p, 'rb') as f:
                 merger.append(PdfFileReader(f))
 
-        if not fileName:
-            fileName = '%s-Report.pdf' % self.__class__.__name__
-        if not StringUtils.toStr2(fileName).endswith('.pdf'):
-            fileName += '.pdf'
-
+        fileName = self._getReportFileName(fileName)
         with open(self.getPath(fileName, isFile=True), 'wb') as f:
             merger.write(f)
 
@@ -209,9 +287,158 @@ class AnalysisStage(object):
             this method will iterate through the sitemaps in the database and call the
             _analyzeSitemap() method on each one. """
 
-        for sitemap in self.owner.getSitemaps():
-            if sitemap.isReady:
-                self._analyzeSitemap(sitemap)
+        sitemaps = [sitemap for sitemap in self.owner.getSitemaps() if sitemap.isReady]
+
+        if self.INCREMENTAL and self.owner.incremental:
+            self._analyzeIncremental(sitemaps)
+            return
+
+        if self.PARALLEL and self.owner.parallelWorkerCount > 1 and len(sitemaps) > 1:
+            for sitemap, result, log in self.owner.runParallelSitemaps(self, sitemaps):
+                self._writeSitemapLog(log)
+                self._mergeSitemapResult(sitemap, result)
+            return
+
+        for sitemap in sitemaps:
+            self._analyzeSitemap(sitemap)
+
+#_______________________________________________________________________________
+    def _analyzeIncremental(self, sitemaps):
+        """ Analyzes the sitemaps of an incremental run. The sitemaps that changed since the
+            last incremental run are analyzed separately, in worker processes if this is also a
+            PARALLEL stage, and their results are stored along with their log output. Then the
+            new and stored results of every sitemap are merged and their log output is written in
+            sitemap order, as they would be after a parallel run. """
+
+        results = dict()
+        changed = []
+        for sitemap in sitemaps:
+            stored = self.owner.loadSitemapResult(self, sitemap)
+            if stored is None:
+                changed.append(sitemap)
+            else:
+                results[sitemap.uid] = stored
+
+        if self.PARALLEL and self.owner.parallelWorkerCount > 1 and len(changed) > 1:
+            analyzed = self.owner.runParallelSitemaps(self, changed)
+        else:
+            analyzed = (self._getIsolatedSitemapResult(sitemap) for sitemap in changed)
+
+        for sitemap, result, log in analyzed:
+            self.owner.storeSitemapResult(self, sitemap, result, log)
+            results[sitemap.uid] = {'result':result, 'log':log}
+
+        for sitemap in sitemaps:
+            self._writeSitemapLog(results[sitemap.uid].get('log'))
+            self._mergeSitemapResult(sitemap, results[sitemap.uid]['result'])
+
+#_______________________________________________________________________________
+    def _getIsolatedSitemapResult(self, sitemap):
+        """ Analyzes the specified sitemap with a new instance of this stage, which is created
+            with the constructor arguments of this stage and prepared by _preAnalyzeSitemapTask()
+            as it would be in a sitemap worker process. The log output of that instance is
+            recorded instead of written, unless the analysis fails.
+
+            @return: A (sitemap, result, log) tuple like those of runParallelSitemaps() """
+
+        args, kwargs = self._constructorArgs
+        stage = self.__class__(*args, **kwargs)
+        stage._logger = SitemapWorkerLogger()
+        try:
+            stage._preAnalyzeSitemapTask()
+            stage._analyzeSitemap(sitemap)
+        except Exception:
+            self._writeSitemapLog(stage._logger.records)
+            raise
+        return sitemap, stage._getSitemapResult(sitemap), stage._logger.records
+
+#_______________________________________________________________________________
+    def _writeSitemapLog(self, log):
+        """ Writes the (message, kwargs) log calls recorded while a sitemap was analyzed by a
+            sitemap worker process or an isolated instance of this stage. """
+
+        for message, kwargs in log or []:
+            self.logger.write(message, **kwargs)
+
+#_______________________________________________________________________________
+    def _preAnalyzeSitemapTask(self):
+        """ A hook method called within a parallel sitemap worker process before the sitemap is
+            analyzed, which should initialize the stage the same way _preAnalyze() does without
+            modifying the shared output files or folders. By default _preAnalyze() is called. """
+        self._preAnalyze()
+
+#_______________________________________________________________________________
+    # noinspection PyMethodMayBeStatic
+    def _getSitemapResult(self, sitemap):
+        """ A hook method called within a parallel sitemap worker process after the sitemap has
+            been analyzed, which returns the picklable stage data gathered for that sitemap. """
+        return None
+
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        """ A hook method called in sitemap order with the value returned by _getSitemapResult()
+            within the worker process, or the stage instance of an incremental run, that analyzed
+            the sitemap. It should fold the result into this stage as if the sitemap had been
+            analyzed serially. """
+        pass
+
+#_______________________________________________________________________________
+    def _getSitemapTracksByUid(self, sitemap):
+        """ Returns a dictionary of the tracks in the series of every trackway in the specified
+            sitemap keyed by uid, which is used to resolve the track uids within sitemap
+            results. """
+
+        out = dict()
+        for trackway in self.owner.getTrackways(sitemap):
+            for series in self.owner.getSeriesBundle(trackway).asList():
+                for track in series.tracks:
+                    out[track.uid] = track
+        return out
+
+#_______________________________________________________________________________
+    @classmethod
+    def _readFiles(cls, paths):
+        """ Returns a list with the binary contents of each of the specified files, which is
+            used to return temporary plot files within sitemap results, as the temporary files of
+            worker processes and earlier incremental runs do not persist. """
+
+        out = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                out.append(f.read())
+        return out
+
+#_______________________________________________________________________________
+    def _createTempFiles(self, contents, extension =None):
+        """ Writes each of the binary contents returned by _readFiles() to a new temporary file
+            and returns the list of paths to those files. """
+
+        out = []
+        for data in contents:
+            path = self.getTempFilePath(extension=extension)
+            with open(path, 'wb') as f:
+                f.write(data)
+            out.append(path)
+        return out
+
+#_______________________________________________________________________________
+    def _getReportFileName(self, fileName =None):
+        """ Returns the specified report file name with a pdf extension, or a file name created
+            using the name of this class if no file name is specified. """
+
+        if not fileName:
+            fileName = '%s-Report.pdf' % self.__class__.__name__
+        if not StringUtils.toStr2(fileName).endswith('.pdf'):
+            fileName += '.pdf'
+        return fileName
+
+#_______________________________________________________________________________
+    def _closeReports(self):
+        """ Closes each of the reports created by getReport() during the analysis process. """
+
+        for report in self._reports.values():
+            report.close()
+        self._reports = dict()
 
 #_______________________________________________________________________________
     def _createDrawing(self, sitemap, suffix, folder):
@@ -220,7 +447,9 @@ class AnalysisStage(object):
             self.getPath(
                 folder,
                 '%s-%s-%s.svg' % (sitemap.name, sitemap.level, suffix), isFile=True),
-            sitemap)
+            sitemap,
+            renderService=self.owner.renderService,
+            streaming=True)
 
         drawing.grid()
         drawing.federalCoordinates()
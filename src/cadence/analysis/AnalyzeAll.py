@@ -7,8 +7,15 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import sys
+
 from pyaid.time.TimeUtils import TimeUtils
 
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
 from cadence.analysis.comparison.ComparisonAnalyzer import ComparisonAnalyzer
 from cadence.analysis.curvature.CurvatureAnalyzer import CurvatureAnalyzer
 from cadence.analysis.direction.DirectionAnalyzer import DirectionAnalyzer
@@ -16,6 +23,8 @@ from cadence.analysis.gauge.GaugeAnalyzer import GaugeAnalyzer
 from cadence.analysis.stats.StatisticsAnalyzer import StatisticsAnalyzer
 from cadence.analysis.status.StatusAnalyzer import StatusAnalyzer
 from cadence.analysis.validation.ValidationAnalyzer import ValidationAnalyzer
+from cadence.analysis.TrackGraph import TrackGraph
+from cadence.analysis.shared import DataLoadUtils
 
 class AnalyzeAll(object):
     """A class for..."""
@@ -30,26 +39,78 @@ class AnalyzeAll(object):
         StatisticsAnalyzer
     ]
 
-    def __init__(self):
-        """Creates a new instance of AnalyzeAll."""
+    def __init__(self, incremental =False, parallel =False):
+        """Creates a new instance of AnalyzeAll.
+
+        [incremental] ~ Boolean
+            When True each analyzer is run in incremental mode, which skips
+            analyzers when nothing they read has changed since their last
+            incremental run. Analyzers with only INCREMENTAL stages analyze
+            just the changed sitemaps, while the others run in full.
+
+        [parallel] ~ Boolean | Integer
+            Passed to each analyzer to run the stages that support it on
+            multiple sitemaps at once in worker processes.
+        """
         self.analyzers = []
+        self.incremental = incremental
+        self.parallel = parallel
+        self.trackGraph = None
 
     def run(self):
-        """run doc..."""
+        """ Loads the track graph once and runs each analyzer on that shared graph, reporting
+            the elapsed time and the peak memory allocated by each analyzer. """
+
+        startTime = TimeUtils.getNowDatetime()
+        settings = DataLoadUtils.getAnalysisSettings()
+        self.trackGraph = TrackGraph(
+            sitemapFilters=settings.get('SITEMAP_FILTERS', [])).load()
+        graphTime = TimeUtils.getElapsedTime(
+            startDateTime=startTime,
+            endDateTime=TimeUtils.getNowDatetime(),
+            toUnit=TimeUtils.MILLISECONDS)
 
         for AnalyzerClass in self.ANALYZERS:
-            a = AnalyzerClass()
+            a = AnalyzerClass(
+                incremental=self.incremental,
+                parallel=self.parallel,
+                trackGraph=self.trackGraph)
+            self._startMemoryTrace()
             a.run()
-            self.analyzers.append([a.elapsedTime, a])
+            self.analyzers.append([a.elapsedTime, self._stopMemoryTrace(), a])
 
             print('\n\n%s\n%s\n\n' % (80*'#', 80*'#'))
 
+        self.trackGraph.close()
+
         print('%s\nANALYSIS COMPLETE:' % (80*'-'))
+        print('  [TRACK GRAPH]: %s' % TimeUtils.toPrettyElapsedTime(graphTime))
         for a in self.analyzers:
-            print('  [%s]: %s (%s)' % (
+            print('  [%s]: %s %s (%s%s)' % (
                 'SUCCESS' if a[-1].success else 'FAILED',
                 TimeUtils.toPrettyElapsedTime(a[0]),
-                a[-1].__class__.__name__))
+                ('[PEAK %.1f MB]' % (a[1]/1048576.0)) if a[1] is not None else '',
+                a[-1].__class__.__name__,
+                (' %s' % a[-1].runMode.upper()) if self.incremental else ''))
+
+    @classmethod
+    def _startMemoryTrace(cls):
+        """ Starts tracing the memory allocated by Python, so that the peak reported for an
+            analyzer excludes the memory held by the shared track graph and earlier analyzers. """
+        if tracemalloc is not None:
+            tracemalloc.start()
+
+    @classmethod
+    def _stopMemoryTrace(cls):
+        """ Stops tracing memory and returns the peak memory in bytes allocated by Python since
+            _startMemoryTrace() was called, or None if tracemalloc is not available. Memory used
+            by parallel worker processes is not included. """
+        if tracemalloc is None:
+            return None
+
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
 
     def __repr__(self):
         return self.__str__()
@@ -61,5 +122,7 @@ class AnalyzeAll(object):
 ################################################################################
 
 if __name__ == '__main__':
-    r = AnalyzeAll()
+    r = AnalyzeAll(
+        incremental='--incremental' in sys.argv,
+        parallel='--parallel' in sys.argv)
     r.run()
@@ -7,7 +7,11 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import hashlib
+import json
+import multiprocessing
 import os
+import pickle
 
 import sqlalchemy as sqla
 from pyaid.config.ConfigsDict import ConfigsDict
@@ -19,6 +23,8 @@ from pyaid.time.TimeUtils import TimeUtils
 from pyglass.alembic.AlembicUtils import AlembicUtils
 from pyglass.app.PyGlassEnvironment import PyGlassEnvironment
 
+import cadence
+from cadence.analysis.SitemapWorker import runSitemapTask
 from cadence.analysis.shared import DataLoadUtils
 
 PyGlassEnvironment.initializeFromInternalPath(__file__)
@@ -34,7 +40,13 @@ myRevision = AlembicUtils.getCurrentDatabaseRevision(databaseUrl=analysis.DATABA
 analysisStamp = '[ANALYSIS]: %s [HEAD %s]' % (myRevision, headRevision)
 
 from cadence.models.tracks.Tracks_SiteMap import Tracks_SiteMap
+from cadence.models.tracks.Tracks_Track import Tracks_Track
+from cadence.models.tracks.Tracks_Trackway import Tracks_Trackway
 from cadence.models.analysis.Analysis_Sitemap import Analysis_Sitemap
+from cadence.models.analysis.Analysis_Track import Analysis_Track
+from cadence.models.analysis.Analysis_Trackway import Analysis_Trackway
+from cadence.analysis.TrackGraph import TrackGraph
+from cadence.svg.SvgRenderService import SvgRenderService
 
 try:
     # TODO: Working with Matplotlib in Virtual environments' in the Matplotlib FAQ
@@ -52,6 +64,23 @@ class AnalyzerBase(object):
     objects with the common functionality for that particular Analyzer.
     """
 
+    # Name of the folder within the analyzer output folder where incremental
+    # runs store their manifest and the sitemap results of INCREMENTAL stages.
+    # It is removed along with the other outputs by every full run.
+    INCREMENTAL_FOLDER_NAME = '.incremental'
+
+    # Name of the file within the incremental folder that records the
+    # fingerprints read by each stage in the last successful incremental run
+    INCREMENTAL_MANIFEST_FILENAME = 'manifest.json'
+
+    # Folders of the cadence package whose source code is included in the
+    # version of incremental outputs. See the getIncrementalVersion() method.
+    INCREMENTAL_SOURCE_FOLDERS = ['analysis', 'enums', 'models', 'svg', 'util']
+
+    FULL_RUN = 'full'
+    PARTIAL_RUN = 'partial'
+    SKIPPED_RUN = 'skipped'
+
     def __init__(self, **kwargs):
         """
         Creates a new instance of AnalyzerBase.
@@ -68,22 +97,59 @@ class AnalyzerBase(object):
             If no logger was specified for the analyzer, this is the absolute
             path to the folder where the log file should be written. This
             value is ignored if you specify a logger.
+
+        [prefetchAnalysisPairs] ~ Boolean
+            When True, which is the default, the analysis pairs for every
+            sitemap, trackway and track are loaded in bulk before the first
+            stage runs. See the prefetchAnalysisPairs() method.
+
+        [incremental] ~ Boolean
+            When True, the fingerprints read by each stage in the last
+            successful incremental run are compared to the current data. The
+            analyzer is skipped when nothing changed, and INCREMENTAL stages
+            only analyze the sitemaps that changed. See the
+            createIncrementalPlan() method.
+
+        [parallel] ~ Boolean | Integer
+            When True, or an integer larger than one specifying the number of
+            worker processes, stages that support it are run on each sitemap
+            in a separate worker process. A value of True uses one worker per
+            CPU core. See the runParallelSitemaps() method.
+
+        [trackGraph] ~ TrackGraph
+            A track graph shared with other analyzers from which the sitemaps,
+            trackways and series bundles are retrieved instead of loading
+            them from the database. The shared graph and its session are not
+            closed by this analyzer. If not specified, the analyzer creates
+            and owns its own graph.
+
+        [renderService] ~ SvgRenderService
+            The service to which the stages submit saved sitemap drawings for
+            conversion to PDF. If not specified, a service is created on
+            demand using the 'SVG_RENDER_COMMAND' and 'SVG_RENDER_WORKERS'
+            analysis settings. See the renderService property.
         """
 
-        self._tracksSession     = None
         self._analysisSession   = None
         self._cache             = ConfigsDict(kwargs.get('cacheData'))
         self._logger            = kwargs.get('logger')
         self._tempPath          = kwargs.get('tempPath')
         self._stages            = []
-        self._sitemaps          = []
-        self._trackways         = dict()
-        self._seriesBundles     = dict()
+        self._trackGraph        = kwargs.get('trackGraph')
+        self._sharedGraph       = self._trackGraph is not None
         self._plotFigures       = dict()
         self._currentStage      = None
         self._success           = False
         self._errorMessage      = None
         self._startTime         = None
+        self._prefetchPairs     = kwargs.get('prefetchAnalysisPairs', True)
+        self._incremental       = kwargs.get('incremental', False)
+        self._incrementalPlan   = None
+        self._stageReads        = dict()
+        self._sitemapFilter     = None
+        self._runMode           = self.FULL_RUN
+        self._parallel          = kwargs.get('parallel', False)
+        self._renderService     = kwargs.get('renderService')
 
         if not self._logger:
             self._logger = Logger(
@@ -116,6 +182,31 @@ class AnalyzerBase(object):
     def success(self):
         return self._success
 
+#_______________________________________________________________________________
+    @property
+    def runMode(self):
+        """ Whether the last run was a full, partial (incremental) or skipped run, as one of the
+            FULL_RUN, PARTIAL_RUN or SKIPPED_RUN class constants. """
+        return self._runMode
+
+#_______________________________________________________________________________
+    @property
+    def incremental(self):
+        """ Whether this analyzer runs in incremental mode. """
+        return self._incremental
+
+#_______________________________________________________________________________
+    @property
+    def parallelWorkerCount(self):
+        """ The number of worker processes used to analyze sitemaps in parallel, which is zero
+            when parallel execution is disabled. """
+
+        if self._parallel is True:
+            return multiprocessing.cpu_count()
+        if not self._parallel or self._parallel < 2:
+            return 0
+        return int(self._parallel)
+
 #_______________________________________________________________________________
     @property
     def errorMessage(self):
@@ -130,6 +221,31 @@ class AnalyzerBase(object):
 
         return self._settings.get('SITEMAP_FILTERS', [])
 
+#_______________________________________________________________________________
+    @property
+    def trackGraph(self):
+        """ The TrackGraph from which this analyzer retrieves sitemaps, trackways and series
+            bundles, which is created on demand unless a shared graph was specified. """
+
+        if self._trackGraph is None:
+            self._trackGraph = TrackGraph(sitemapFilters=self.sitemapFilters)
+        return self._trackGraph
+
+#_______________________________________________________________________________
+    @property
+    def renderService(self):
+        """ The SvgRenderService that converts the sitemap drawings saved by the stages into PDF
+            files while analysis continues. The renderer command and the number of concurrent
+            conversions are loaded from the analysis.json file with the 'SVG_RENDER_COMMAND' and
+            'SVG_RENDER_WORKERS' keys, which default to Inkscape and two workers. """
+
+        if self._renderService is None:
+            self._renderService = SvgRenderService(
+                command=self._settings.get('SVG_RENDER_COMMAND'),
+                workerCount=self._settings.get('SVG_RENDER_WORKERS'),
+                logger=self.logger)
+        return self._renderService
+
 #_______________________________________________________________________________
     @property
     def plotFigures(self):
@@ -285,8 +401,13 @@ class AnalyzerBase(object):
 
         self._startTime = TimeUtils.getNowDatetime()
 
+        plan = self.createIncrementalPlan() if self._incremental else None
+        self._incrementalPlan = plan
+        self._stageReads = dict()
+        self._runMode = plan['mode'] if plan else self.FULL_RUN
+
         myRootPath = self.getPath(isDir=True)
-        if os.path.exists(myRootPath):
+        if self._runMode == self.FULL_RUN and os.path.exists(myRootPath):
             FileUtils.emptyFolder(myRootPath)
         if not os.path.exists(myRootPath):
             os.makedirs(myRootPath)
@@ -299,20 +420,31 @@ class AnalyzerBase(object):
         if not self.logger.loggingPath:
             self.logger.loggingPath = myRootPath
 
-        try:
-            session = self.getAnalysisSession()
-            self._preAnalyze()
-            for stage in self._stages:
-                self._currentStage = stage
-                stage.analyze()
-            self._currentStage = None
-            self._postAnalyze()
+        if plan:
+            self.logger.write(plan['messages'], indent=False)
+
+        if self._sharedGraph:
+            # Clear the data stored on the shared graph by any previous analyzer
+            self.trackGraph.resetCaches()
 
+        session = self.getAnalysisSession()
+        try:
+            if self._runMode != self.SKIPPED_RUN:
+                if self._prefetchPairs:
+                    self.prefetchAnalysisPairs()
+                self._preAnalyze()
+                for stage in self._stages:
+                    self._currentStage = stage
+                    stage.analyze()
+                self._currentStage = None
+                self._postAnalyze()
+
+            # Skipped runs are committed as well to end any transaction opened while the
+            # incremental plan was created
             session.commit()
             session.close()
             self._success = True
         except Exception as err:
-            session = self.getAnalysisSession()
             session.close()
             msg = [
                 '[ERROR]: Failed to execute analysis',
@@ -320,8 +452,15 @@ class AnalyzerBase(object):
             self._errorMessage = Logger.createErrorMessage(msg, err)
             self.logger.writeError(msg, err)
 
-        session = self.getTracksSession()
-        session.close()
+        if plan and plan['fingerprints'] and self._success and self._runMode != self.SKIPPED_RUN:
+            try:
+                self._writeIncrementalManifest(plan)
+            except Exception as err:
+                self.logger.writeError('[WARNING]: Unable to write incremental manifest', err)
+        self._incrementalPlan = None
+
+        self.closeTracksSession()
+        self._closeRenderService()
 
         self._cleanup()
         SystemUtils.remove(tempPath)
@@ -408,68 +547,45 @@ class AnalyzerBase(object):
     def getTracksSession(self):
         """ Returns a managed session to the tracks database. Used for shared session access across
             analysis stages, which is used to increase performance by eliminating the overhead in
-            loading large segments of the database multiple times. """
+            loading large segments of the database multiple times. This is the session of the
+            analyzer's TrackGraph. """
 
-        if self._tracksSession is None:
-            self._tracksSession = Tracks_SiteMap.MASTER.createSession()
-        return self._tracksSession
+        return self.trackGraph.session
 
 #_______________________________________________________________________________
     def closeTracksSession(self, commit =False):
         """ Closes the shared track database session. By default no commit is made because the
-            analyzers should not be writing to the tracks database. """
+            analyzers should not be writing to the tracks database. The session of a TrackGraph
+            shared with other analyzers is left open for those analyzers. """
 
-        if not self._tracksSession:
+        if self._sharedGraph or self._trackGraph is None:
             return
-
-        if commit:
-            self._tracksSession.commit()
-        self._tracksSession.close()
-        self._tracksSession = None
+        self._trackGraph.close(commit=commit)
 
 #_______________________________________________________________________________
     def getSitemaps(self):
         """ Retrieves a list of sitemap model instances from the tracks database for use in
             analysis. These sitemaps are cached for the remainder of the analysis process for
-            data persistence and performance reasons. """
+            data persistence and performance reasons. Within a sitemap worker process only the
+            sitemap analyzed by that worker is returned. """
 
-        if self._sitemaps:
-            return self._sitemaps
+        sitemaps = self._loadSitemaps()
+        if self._sitemapFilter is None:
+            return sitemaps
+        return [sm for sm in sitemaps if sm.uid in self._sitemapFilter]
 
-        model   = Tracks_SiteMap.MASTER
-        session = self.getTracksSession()
-        query   = session.query(model)
-
-        orFilters = []
-        for sf in self.sitemapFilters:
-            # If filters exist for sitemaps then create a collection of OR clauses to only load
-            # sitemaps that match the filter list.
-            sf = sf.split('-')
-            filterArg = model.name.like('%s%%' % sf[0].upper())
-            if len(sf) > 1:
-                filterArg = sqla.and_(filterArg, model.level == sf[1])
-            orFilters.append(filterArg)
-
-        if orFilters:
-            query = query.filter(sqla.or_(*orFilters))
-
-        self._sitemaps = []
-        for sitemap in query.all():
-            if sitemap.isReady:
-                self._sitemaps.append(sitemap)
-        return self._sitemaps
+#_______________________________________________________________________________
+    def _loadSitemaps(self):
+        """ Loads and caches the list of ready sitemaps that match the sitemap filters. """
+        return self.trackGraph.getSitemaps()
 
 #_______________________________________________________________________________
     def getTrackways(self, sitemap):
         """ Retrieves a list of trackway model instances for the specified sitemap. These trackways
             are cached for data persistence and performance reasons. """
 
-        if sitemap.uid in self._trackways:
-            return self._trackways[sitemap.uid]
-
-        trackways = sitemap.getTrackways()
-        self._trackways[sitemap.uid] = trackways
-        return trackways
+        self._recordStageRead(sitemap.uid)
+        return self.trackGraph.getTrackways(sitemap)
 
 #_______________________________________________________________________________
     def getSeriesBundle(self, trackway):
@@ -478,12 +594,435 @@ class AnalyzerBase(object):
 
             @return: TrackSeriesBundle """
 
-        if trackway.uid in self._seriesBundles:
-            return self._seriesBundles[trackway.uid]
+        self._recordStageRead(trackwayUid=trackway.uid)
+        return self.trackGraph.getSeriesBundle(trackway)
+
+#_______________________________________________________________________________
+    def getSitemapFingerprints(self):
+        """ Creates a dictionary keyed by sitemap uid of the content digests for each sitemap
+            and its trackways, which decide what an incremental run must analyze again. The
+            trackway digests cover the trackway name, its series fingerprints
+            (TrackSeries.fingerprint) and the property values of every track in those series.
+            The sitemap digests cover the sitemap properties, every track within the sitemap,
+            including hidden and orphaned tracks, and the digests of its trackways. Analysis
+            values are added for each stage by getStageFingerprints(). """
+
+        tracksSession = self.getTracksSession()
+
+        out = dict()
+        for sitemap in self._loadSitemaps():
+            tracks = dict(
+                (t.uid, self._createDigest(t.toDict()))
+                for t in sitemap.getAllTracks(tracksSession) or [])
+
+            trackways = dict()
+            for trackway in self.trackGraph.getTrackways(sitemap):
+                entries = [trackway.name, trackway.firstTracksList]
+                for series in self.trackGraph.getSeriesBundle(trackway).asList():
+                    entries.append(series.fingerprint)
+                    for t in series.tracks:
+                        entries.append(tracks.get(t.uid) or self._createDigest(t.toDict()))
+
+                trackways[trackway.uid] = {
+                    'name':trackway.name,
+                    'digest':self._createDigest(entries) }
+
+            out[sitemap.uid] = {
+                'digest':self._createDigest([
+                    sitemap.name, sitemap.level, sitemap.filename, sitemap.scale,
+                    sitemap.left, sitemap.top, sitemap.width, sitemap.height,
+                    sitemap.xFederal, sitemap.yFederal, sitemap.xTranslate, sitemap.zTranslate,
+                    sitemap.xRotate, sitemap.yRotate, sitemap.zRotate,
+                    sorted(tracks.items()),
+                    sorted((uid, tw['digest']) for uid, tw in trackways.items()) ]),
+                'trackways':trackways }
+        return out
+
+#_______________________________________________________________________________
+    def getStageAnalysisInputs(self, stage):
+        """ Returns the analysis values declared in the ANALYSIS_INPUTS of the specified stage
+            that are not declared in the ANALYSIS_OUTPUTS of any stage of this analyzer, in the
+            same format. Values written by this analyzer are excluded because they are written
+            again whenever the sitemaps they belong to are analyzed, and would otherwise differ
+            in the run after the one that changed them without anything else changing.
+
+            @return: Dict """
+
+        written = dict()
+        for s in self._stages:
+            for kind, names in s.ANALYSIS_OUTPUTS.items():
+                written.setdefault(kind, set()).update(names)
+
+        out = dict()
+        for kind, names in stage.ANALYSIS_INPUTS.items():
+            names = sorted(set(names) - written.get(kind, set()))
+            if names:
+                out[kind] = names
+        return out
+
+#_______________________________________________________________________________
+    def getStageFingerprints(self, stage, fingerprints):
+        """ Returns the fingerprints of the specified stage, which add the analysis values
+            returned by getStageAnalysisInputs() for the stage to the specified sitemap
+            fingerprints created by getSitemapFingerprints(). The trackway digests add the values
+            of the trackway and its series tracks and the sitemap digests add the values of the
+            sitemap. The sitemap fingerprints are returned when the stage has no such inputs. """
+
+        columns = self.getStageAnalysisInputs(stage)
+        if not columns:
+            return fingerprints
+
+        session = self.getAnalysisSession()
+        out = dict()
+        for sitemap in self._loadSitemaps():
+            fingerprint = fingerprints[sitemap.uid]
+
+            trackways = dict()
+            for trackway in self.trackGraph.getTrackways(sitemap):
+                entries = [
+                    fingerprint['trackways'][trackway.uid]['digest'],
+                    self._getAnalysisValues(
+                        trackway, Analysis_Trackway.MASTER, columns.get('trackway'), session) ]
+                for series in self.trackGraph.getSeriesBundle(trackway).asList():
+                    for t in series.tracks:
+                        entries.append(self._getAnalysisValues(
+                            t, Analysis_Track.MASTER, columns.get('track'), session))
+
+                trackways[trackway.uid] = {
+                    'name':trackway.name,
+                    'digest':self._createDigest(entries) }
+
+            out[sitemap.uid] = {
+                'digest':self._createDigest([
+                    fingerprint['digest'],
+                    self._getAnalysisValues(
+                        sitemap, Analysis_Sitemap.MASTER, columns.get('sitemap'), session),
+                    sorted((uid, tw['digest']) for uid, tw in trackways.items()) ]),
+                'trackways':trackways }
+        return out
+
+#_______________________________________________________________________________
+    def getIncrementalVersion(self):
+        """ Returns a digest of the source code within the INCREMENTAL_SOURCE_FOLDERS of the
+            cadence package, the revisions of the tracks and analysis databases and the analysis
+            settings file. An incremental run only reuses the outputs of a previous run that was
+            made with the same version. """
+
+        rootPath = os.path.dirname(os.path.abspath(cadence.__file__))
+        entries = [tracksStamp, analysisStamp]
+
+        for folder in self.INCREMENTAL_SOURCE_FOLDERS:
+            for directory, folders, files in os.walk(os.path.join(rootPath, folder)):
+                folders.sort()
+                for name in sorted(files):
+                    if not name.endswith('.py'):
+                        continue
+                    path = os.path.join(directory, name)
+                    with open(path, 'rb') as f:
+                        entries.append((
+                            os.path.relpath(path, rootPath).replace(os.sep, '/'),
+                            hashlib.sha1(f.read()).hexdigest() ))
+
+        path = FileUtils.makeFilePath(self._defaultRootPath, 'analysis.json')
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                entries.append(hashlib.sha1(f.read()).hexdigest())
+
+        return self._createDigest(entries)
+
+#_______________________________________________________________________________
+    def createIncrementalPlan(self):
+        """ Compares the current fingerprints with those read by each stage in the last
+            successful incremental run and decides how this analyzer should run:
+
+            * SKIPPED_RUN when nothing read by any of the stages has changed, in which case the
+              existing outputs are reused.
+            * PARTIAL_RUN when every stage is an INCREMENTAL stage, in which case each stage
+              analyzes the sitemaps that changed among those it read and merges the results it
+              stored for the others. See AnalysisStage.INCREMENTAL for details.
+            * FULL_RUN in all other cases, including a missing manifest, a manifest written by
+              a different version (see getIncrementalVersion()), removed sitemaps and stages
+              that are not INCREMENTAL.
+
+            Each stage is compared with its own fingerprints, which include the analysis values
+            it reads that are written by other analyzers. See getStageFingerprints(). The
+            analysis pairs are loaded without creating missing pairs, so the analysis database
+            is not changed by runs that are skipped.
+
+            @return: dict with the mode, the changed sitemap uids in total and for each stage,
+                the sitemap and stage fingerprints, version and stage input digests to record,
+                the stage reads of the last run and the log messages """
+
+        plan = {
+            'mode':self.FULL_RUN,
+            'changed':set(),
+            'stages':dict(),
+            'fingerprints':None,
+            'stageFingerprints':dict(),
+            'trackwaySitemaps':dict(),
+            'version':None,
+            'inputs':dict(),
+            'reads':dict(),
+            'messages':[] }
+        messages = plan['messages']
+
+        try:
+            plan['version'] = self.getIncrementalVersion()
+            fingerprints = self.getSitemapFingerprints()
+            self.prefetchAnalysisPairs(createIfMissing=False)
+            for stage in self._stages:
+                plan['inputs'][stage.key] = self._createDigest(stage.getIncrementalInputs())
+                plan['stageFingerprints'][stage.key] = self.getStageFingerprints(
+                    stage, fingerprints)
+        except Exception as err:
+            self.logger.writeError('[WARNING]: Unable to fingerprint analysis inputs', err)
+            messages.append('[INCREMENTAL]: Fingerprinting failed. Running full analysis.')
+            return plan
+
+        plan['fingerprints'] = fingerprints
+        for sitemapUid, fp in fingerprints.items():
+            for trackwayUid in fp['trackways']:
+                plan['trackwaySitemaps'][trackwayUid] = sitemapUid
+
+        manifest = self._readIncrementalManifest()
+        if not manifest:
+            messages.append('[INCREMENTAL]: No previous manifest. Running full analysis.')
+            return plan
+
+        if manifest.get('version') != plan['version']:
+            messages.append(
+                '[INCREMENTAL]: Analysis code, settings or databases changed since the last run.'
+                + ' Running full analysis.')
+            return plan
+
+        previous = manifest.get('sitemaps', dict())
+        removed = set(previous.keys()) - set(fingerprints.keys())
+        if removed:
+            messages.append('[INCREMENTAL]: Sitemaps removed since the last run (%s).' %
+                ', '.join(sorted(removed)) + ' Running full analysis.')
+            return plan
+
+        for uid, fp in sorted(fingerprints.items()):
+            prior = previous.get(uid, dict())
+            if prior.get('digest') == fp['digest']:
+                continue
+
+            priorTrackways = prior.get('trackways', dict())
+            for trackwayUid, trackway in sorted(fp['trackways'].items()):
+                if priorTrackways.get(trackwayUid, dict()).get('digest') != trackway['digest']:
+                    messages.append('[INCREMENTAL]: Changed trackway %s' % trackway['name'])
+
+        records = manifest.get('stages', dict())
+        plan['reads'] = dict((key, r.get('sitemaps', dict())) for key, r in records.items())
+        inputsChanged = []
+
+        for stage in self._stages:
+            record = records.get(stage.key)
+            if record is None:
+                messages.append('[INCREMENTAL]: Stage "%s" has no record.' % stage.key
+                    + ' Running full analysis.')
+                return plan
+
+            if record.get('inputs') != plan['inputs'][stage.key]:
+                inputsChanged.append(stage.key)
+
+            # Only the sitemaps the stage read in the last run, and any new sitemaps, can change
+            # the outputs of the stage
+            changed = set()
+            reads = record.get('sitemaps', dict())
+            for uid, fp in plan['stageFingerprints'][stage.key].items():
+                read = reads.get(uid)
+                if read is None:
+                    if uid not in previous:
+                        changed.add(uid)
+                elif read['digest'] != fp['digest']:
+                    changed.add(uid)
+
+            plan['stages'][stage.key] = changed
+            plan['changed'].update(changed)
+
+        if not plan['changed'] and not inputsChanged:
+            plan['mode'] = self.SKIPPED_RUN
+            messages.append('[INCREMENTAL]: No changes since the last run. Reusing outputs.')
+            return plan
+
+        fullStages = [stage.key for stage in self._stages if not stage.INCREMENTAL]
+        if fullStages:
+            messages.append(
+                '[INCREMENTAL]: Stages are not incremental (%s).' % ', '.join(fullStages)
+                + ' Running full analysis.')
+            return plan
+
+        plan['mode'] = self.PARTIAL_RUN
+        for stage in self._stages:
+            messages.append('[INCREMENTAL]: Stage "%s" re-analyzes %s of %s sitemaps%s' % (
+                stage.key, len(plan['stages'][stage.key]), len(fingerprints),
+                ' (inputs changed)' if stage.key in inputsChanged else ''))
+        return plan
+
+#_______________________________________________________________________________
+    def loadSitemapResult(self, stage, sitemap):
+        """ Returns the sitemap result stored for the specified stage and sitemap by the last
+            incremental run, or None if the sitemap must be analyzed again, which is the case
+            outside of partial runs, when anything the stage read for the sitemap has changed,
+            when the stage's getIncrementalSitemapInputs() value for the sitemap has changed or
+            when no result was stored. The result is returned in a dictionary with a 'result'
+            key, as results can be None, and a 'log' key with the log output of the sitemap. The
+            reads the stage made for the sitemap in the run that stored the result are recorded
+            again for the manifest of this run.
+
+            @return: Dict """
+
+        plan = self._incrementalPlan
+        if not plan or plan['mode'] != self.PARTIAL_RUN:
+            return None
+        if sitemap.uid in plan['stages'].get(stage.key, set()):
+            return None
+
+        path = self._getIncrementalPath(stage.key, '%s.pickle' % sitemap.uid)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                stored = pickle.load(f)
+        except Exception as err:
+            self.logger.writeError('[WARNING]: Unable to load stored sitemap result', err)
+            return None
+
+        if stored.get('inputs') != self._createDigest(stage.getIncrementalSitemapInputs(sitemap)):
+            return None
+
+        read = plan['reads'].get(stage.key, dict()).get(sitemap.uid)
+        if read is None:
+            self._recordStageRead(sitemap.uid, stage=stage)
+        else:
+            self._stageReads.setdefault(stage.key, dict())[sitemap.uid] = read
+        return stored
 
-        bundle = trackway.getTrackwaySeriesBundle()
-        self._seriesBundles[trackway.uid] = bundle
-        return bundle
+#_______________________________________________________________________________
+    def storeSitemapResult(self, stage, sitemap, result, log =None):
+        """ Stores the result of the specified stage for the specified sitemap during an
+            incremental run along with the log output of the sitemap and the digest of the
+            stage's getIncrementalSitemapInputs() value, so that later partial runs can merge it
+            and replay the log instead of analyzing the sitemap again. The sitemap is recorded as
+            read by the stage. """
+
+        if not self._incrementalPlan or not self._incrementalPlan['fingerprints']:
+            return
+
+        self._recordStageRead(sitemap.uid, stage=stage)
+        path = self._getIncrementalPath(stage.key, '%s.pickle' % sitemap.uid)
+        with open(path, 'wb') as f:
+            pickle.dump({
+                'result':result,
+                'log':log,
+                'inputs':self._createDigest(stage.getIncrementalSitemapInputs(sitemap)) },
+                f, pickle.HIGHEST_PROTOCOL)
+
+#_______________________________________________________________________________
+    def prefetchAnalysisPairs(self, createIfMissing =True):
+        """ Loads the Analysis_Sitemap, Analysis_Trackway and Analysis_Track rows for all of the
+            sitemaps, trackways and series tracks in this analysis with a few bulk queries and
+            attaches them to the transient cache of each model instance, so that stages calling
+            getAnalysisPair() do not query the analysis database for each track. Any missing rows
+            are created together in a single flush when createIfMissing is True. """
+
+        session   = self.getAnalysisSession()
+        sitemaps  = self.getSitemaps()
+        trackways = []
+        tracks    = []
+
+        for sitemap in sitemaps:
+            for trackway in self.getTrackways(sitemap):
+                trackways.append(trackway)
+                for series in self.getSeriesBundle(trackway).asList():
+                    tracks.extend(series.tracks)
+
+        Tracks_SiteMap.prefetchAnalysisPairs(sitemaps, session, createIfMissing)
+        Tracks_Trackway.prefetchAnalysisPairs(trackways, session, createIfMissing)
+        Tracks_Track.prefetchAnalysisPairs(tracks, session, createIfMissing)
+
+#_______________________________________________________________________________
+    def runParallelSitemaps(self, stage, sitemaps):
+        """ Analyzes each of the specified sitemaps with the specified stage in a pool of worker
+            processes. Each worker creates a new instance of this analyzer with its own database
+            sessions and runs the stage's _analyzeSitemap() method on a single sitemap. Any
+            missing analysis pairs are created and the analysis session is committed first so
+            that the workers see the values written by earlier stages.
+
+            This is a generator that yields (sitemap, result, log) tuples in the order of the
+            sitemaps list, regardless of the order in which the workers finish. Before each tuple
+            is yielded, the analysis values changed by that sitemap are applied to the analysis
+            session, so that the merged output matches a serial run. The result is the value
+            returned by the stage's _getSitemapResult() method within the worker and the log is
+            the list of (message, kwargs) calls the worker made to its logger, which the stage
+            writes when it merges the result. """
+
+        tasks = [{
+            'module':self.__class__.__module__,
+            'analyzer':self.__class__.__name__,
+            'stage':stage.key,
+            'sitemap':sitemap.uid,
+            'tempPath':self.tempPath } for sitemap in sitemaps]
+
+        session = self.getAnalysisSession()
+        self.prefetchAnalysisPairs()
+        session.commit()
+
+        context = multiprocessing.get_context('spawn') \
+            if hasattr(multiprocessing, 'get_context') \
+            else multiprocessing
+        pool = context.Pool(min(self.parallelWorkerCount, len(tasks)))
+
+        try:
+            for sitemap, result in zip(sitemaps, pool.imap(runSitemapTask, tasks)):
+                if 'error' in result:
+                    for message, kwargs in result['log']:
+                        self.logger.write(message, **kwargs)
+                    raise Exception(result['error'])
+
+                self._applyAnalysisChanges(session, result['changes'])
+                yield sitemap, result['result'], result['log']
+        finally:
+            pool.terminate()
+            pool.join()
+
+#_______________________________________________________________________________
+    def runSitemapTask(self, stageKey, sitemapUid):
+        """ Runs the stage specified by its key on the single sitemap specified by its uid. This
+            method is called within the worker processes created by runParallelSitemaps() and
+            should not be called otherwise. No changes are committed to the analysis database.
+            Instead the changed analysis values are returned along with the stage's sitemap
+            result for the parent analyzer to apply.
+
+            @return: Dict """
+
+        self._sitemapFilter = set([sitemapUid])
+        stage = self.getStage(stageKey)
+        session = self.getAnalysisSession()
+        session.autoflush = False
+
+        try:
+            self.prefetchAnalysisPairs()
+            snapshot = self._getAnalysisSnapshot(session)
+
+            stage.cache.unload()
+            stage._preAnalyzeSitemapTask()
+
+            result = None
+            for sitemap in self.getSitemaps():
+                stage._analyzeSitemap(sitemap)
+                result = stage._getSitemapResult(sitemap)
+
+            return {
+                'result':result,
+                'changes':self._getAnalysisChanges(session, snapshot) }
+        finally:
+            session.rollback()
+            session.close()
+            self.closeTracksSession()
+            self._closeRenderService()
 
 #===============================================================================
 #                                                                               P R O T E C T E D
@@ -506,6 +1045,191 @@ class AnalyzerBase(object):
 
         pass
 
+#_______________________________________________________________________________
+    def _readIncrementalManifest(self):
+        """ Returns the manifest written by the last successful incremental run or None if no
+            valid manifest exists. """
+
+        path = self._getIncrementalPath(self.INCREMENTAL_MANIFEST_FILENAME)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'r') as f:
+                manifest = json.load(f)
+        except Exception:
+            return None
+
+        if manifest.get('analyzer') != self.__class__.__name__:
+            return None
+        return manifest
+
+#_______________________________________________________________________________
+    def _writeIncrementalManifest(self, plan):
+        """ Writes the manifest with the version and fingerprints of this run, and the digests
+            of the sitemaps and trackways read by each stage along with the digest of the other
+            inputs of the stage. """
+
+        manifest = {
+            'analyzer':self.__class__.__name__,
+            'version':plan['version'],
+            'sitemaps':plan['fingerprints'],
+            'stages':dict((stage.key, {
+                'inputs':plan['inputs'].get(stage.key),
+                'sitemaps':self._stageReads.get(stage.key, dict()) }) for stage in self._stages) }
+
+        path = self._getIncrementalPath(self.INCREMENTAL_MANIFEST_FILENAME)
+        with open(path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+#_______________________________________________________________________________
+    def _getIncrementalPath(self, *args):
+        """ Returns the path of a file within the incremental folder of this analyzer, creating
+            its parent folders if they do not already exist. """
+
+        path = self.getPath(self.INCREMENTAL_FOLDER_NAME, *args, isFile=True)
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        return path
+
+#_______________________________________________________________________________
+    def _recordStageRead(self, sitemapUid =None, trackwayUid =None, stage =None):
+        """ Records that the specified stage, or the current stage if no stage is specified,
+            read the sitemap or trackway with the specified uid along with its current digest
+            within the fingerprints of the stage. Reads are only recorded during incremental runs
+            and are written to the manifest. """
+
+        stage = stage if stage else self._currentStage
+        plan = self._incrementalPlan
+        if stage is None or not plan or not plan['fingerprints']:
+            return
+
+        if trackwayUid is not None:
+            sitemapUid = plan['trackwaySitemaps'].get(trackwayUid)
+
+        fingerprints = plan['stageFingerprints'].get(stage.key, plan['fingerprints'])
+        fingerprint = fingerprints.get(sitemapUid)
+        if fingerprint is None:
+            return
+
+        reads = self._stageReads.setdefault(stage.key, dict())
+        read = reads.setdefault(sitemapUid, {'digest':fingerprint['digest'], 'trackways':dict()})
+        if trackwayUid in fingerprint['trackways']:
+            read['trackways'][trackwayUid] = fingerprint['trackways'][trackwayUid]['digest']
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getAnalysisSnapshot(cls, session):
+        """ Returns the column values of every analysis model instance loaded in the specified
+            session keyed by table name and primary key, which is used by sitemap workers to
+            determine which values were changed by a stage. """
+
+        out = dict()
+        for item in session.identity_map.values():
+            out[(item.__tablename__, item.i)] = cls._getColumnValues(item)
+        return out
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getAnalysisChanges(cls, session, snapshot):
+        """ Compares the analysis model instances in the session with the snapshot and returns a
+            list of (table name, primary key, changed values) tuples. Instances missing from the
+            snapshot were created during analysis and are returned with all of their values and a
+            primary key of None. """
+
+        out = []
+        for item in list(session.identity_map.values()) + list(session.new):
+            values = cls._getColumnValues(item)
+            key = (item.__tablename__, item.i)
+            if item.i is None or key not in snapshot:
+                values.pop('i', None)
+                out.append((item.__tablename__, None, values))
+                continue
+
+            previous = snapshot[key]
+            changes = dict((k, v) for k, v in values.items() if previous.get(k) != v)
+            if changes:
+                out.append((item.__tablename__, item.i, changes))
+        return out
+
+#_______________________________________________________________________________
+    @classmethod
+    def _applyAnalysisChanges(cls, session, changes):
+        """ Applies the analysis changes returned by a sitemap worker to the specified session. """
+
+        models = dict((model.__tablename__, model) for model in [
+            Analysis_Sitemap.MASTER, Analysis_Trackway.MASTER, Analysis_Track.MASTER])
+
+        for tableName, key, values in changes:
+            model = models[tableName]
+            if key is None:
+                item = model()
+                session.add(item)
+            else:
+                item = session.query(model).get(key)
+
+            for name, value in values.items():
+                setattr(item, name, value)
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getColumnValues(cls, item):
+        """ Returns a dictionary of the column attribute values of a model instance. """
+        return dict(
+            (attr.key, getattr(item, attr.key))
+            for attr in sqla.inspect(item).mapper.column_attrs)
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getAnalysisValues(cls, item, model, names, session):
+        """ Returns a dictionary of the specified analysis values of the analysis pair of a
+            tracks model instance, or None if no names are specified. No analysis pair is created
+            for the instance if it does not already exist. Instead the default values of the
+            columns of the specified analysis model are returned, which are the values such a
+            pair is created with. """
+
+        if not names:
+            return None
+
+        pair = item.getAnalysisPair(session, createIfMissing=False)
+        if pair is not None:
+            return dict((name, getattr(pair, name)) for name in names)
+
+        attrs = sqla.inspect(model).column_attrs
+        out = dict()
+        for name in names:
+            default = attrs['_' + name].columns[0].default
+            out[name] = default.arg if default is not None and default.is_scalar else None
+        return out
+
+#_______________________________________________________________________________
+    @classmethod
+    def _createDigest(cls, value):
+        """ Returns a stable SHA1 hex digest of a JSON-serializable value. """
+        data = json.dumps(value, sort_keys=True, default=str)
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+#_______________________________________________________________________________
+    def _closeRenderService(self):
+        """ Waits for the render service, if one was created, to finish converting every
+            submitted drawing, which logs the render latency of each file, before stopping its
+            worker threads. """
+
+        if self._renderService is None:
+            return
+
+        try:
+            results = self._renderService.close()
+        except Exception as err:
+            self.logger.writeError('[WARNING]: Unable to complete drawing renders', err)
+            return
+
+        failed = [r for r in results if r['error']]
+        if failed:
+            self.logger.write('[WARNING]: %s of %s drawing renders failed' % (
+                len(failed), len(results)))
+
 #_______________________________________________________________________________
     # noinspection PyMethodMayBeStatic
     def _cleanup(self):
@@ -10,6 +10,8 @@ from cadence.analysis.AnalysisStage import AnalysisStage
 class CurveOrderedAnalysisStage(AnalysisStage):
     """A class for..."""
 
+    ANALYSIS_INPUTS = {'track':['curveIndex']}
+
     def __init__(self, key, owner, label =None, **kwargs):
         """
         Creates a new instance of CurveOrderedAnalysisStage.
@@ -0,0 +1,77 @@
+# SitemapWorker.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import importlib
+
+from pyaid.debug.Logger import Logger
+
+#*************************************************************************************************** SitemapWorkerLogger
+class SitemapWorkerLogger(object):
+    """ A stand-in for the analyzer Logger used within sitemap worker processes. Instead of writing
+        output, each log call is recorded so that the owning analyzer can replay the log output of
+        every sitemap in a fixed order once the worker results are merged. """
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def __init__(self):
+        """Creates a new instance of SitemapWorkerLogger."""
+        self.loggingPath = None
+        self.records = []
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def write(self, message, **kwargs):
+        self.records.append((message, kwargs))
+
+#_______________________________________________________________________________
+    def writeError(self, message, error):
+        self.records.append((Logger.createErrorMessage(message, error), {'indent':False}))
+
+#===============================================================================
+#                                                                               I N T R I N S I C
+
+#_______________________________________________________________________________
+    def __repr__(self):
+        return self.__str__()
+
+#_______________________________________________________________________________
+    def __str__(self):
+        return '<%s>' % self.__class__.__name__
+
+#___________________________________________________________________________________________________
+def runSitemapTask(task):
+    """ The process pool entry point for parallel sitemap analysis. Creates a new instance of the
+        analyzer specified by the task, with its own database sessions, and runs the specified
+        stage on the specified sitemap. See AnalyzerBase.runParallelSitemaps() for details.
+
+        task :: Dict
+            The task created by AnalyzerBase.runParallelSitemaps() with the analyzer module and
+            class names, the stage key, the sitemap uid and the shared temporary path.
+
+        @return: Dict """
+
+    logger = SitemapWorkerLogger()
+
+    try:
+        AnalyzerClass = getattr(importlib.import_module(task['module']), task['analyzer'])
+        analyzer = AnalyzerClass(
+            logger=logger,
+            tempPath=task['tempPath'],
+            parallel=False,
+            prefetchAnalysisPairs=True)
+        out = analyzer.runSitemapTask(task['stage'], task['sitemap'])
+    except Exception as err:
+        out = {'error':Logger.createErrorMessage([
+            '[ERROR]: Parallel sitemap analysis failed',
+            'STAGE: %s' % task['stage'],
+            'SITEMAP: %s' % task['sitemap'] ], err)}
+
+    out['log'] = logger.records
+    return out
@@ -0,0 +1,175 @@
+# TrackGraph.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import sqlalchemy as sqla
+
+from cadence.models.tracks.Tracks_SiteMap import Tracks_SiteMap
+
+#*************************************************************************************************** TrackGraph
+class TrackGraph(object):
+    """ A read-mostly snapshot of the sitemaps, trackways, track series bundles and tracks loaded
+        from the tracks database through a single session. Every AnalyzerBase uses a TrackGraph to
+        load and cache this data. A single instance can be shared by multiple analyzers, like
+        those run by AnalyzeAll, so that the track graph is only loaded from the database once. """
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def __init__(self, sitemapFilters =None, session =None):
+        """ Creates a new instance of TrackGraph.
+
+            [sitemapFilters] :: [String] :: None
+                A list of sitemap filtering strings, which match the beginning of the sitemap
+                name and optionally the level, e.g. ["BEB", "TCH-500"].
+
+            [session] :: Session :: None
+                The tracks database session from which to load. If not specified, a session is
+                created when first needed. """
+
+        self._session        = session
+        self._sitemapFilters = sitemapFilters if sitemapFilters else []
+        self._sitemaps       = None
+        self._trackways      = dict()
+        self._seriesBundles  = dict()
+
+#===============================================================================
+#                                                                                   G E T / S E T
+
+#_______________________________________________________________________________
+    @property
+    def session(self):
+        """ The tracks database session from which the graph is loaded. """
+        if self._session is None:
+            self._session = Tracks_SiteMap.MASTER.createSession()
+        return self._session
+
+#_______________________________________________________________________________
+    @property
+    def sitemapFilters(self):
+        return self._sitemapFilters
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def load(self):
+        """ Loads every sitemap, trackway and series bundle in the graph, which is used to
+            populate a graph before sharing it. """
+
+        for sitemap in self.getSitemaps():
+            for trackway in self.getTrackways(sitemap):
+                self.getSeriesBundle(trackway)
+        return self
+
+#_______________________________________________________________________________
+    def getSitemaps(self):
+        """ Returns the cached list of ready sitemap model instances that match the sitemap
+            filters, loading them on the first call. """
+
+        if self._sitemaps is not None:
+            return self._sitemaps
+
+        model   = Tracks_SiteMap.MASTER
+        query   = self.session.query(model)
+
+        orFilters = []
+        for sf in self._sitemapFilters:
+            # If filters exist for sitemaps then create a collection of OR clauses to only load
+            # sitemaps that match the filter list.
+            sf = sf.split('-')
+            filterArg = model.name.like('%s%%' % sf[0].upper())
+            if len(sf) > 1:
+                filterArg = sqla.and_(filterArg, model.level == sf[1])
+            orFilters.append(filterArg)
+
+        if orFilters:
+            query = query.filter(sqla.or_(*orFilters))
+
+        self._sitemaps = []
+        for sitemap in query.all():
+            if sitemap.isReady:
+                self._sitemaps.append(sitemap)
+        return self._sitemaps
+
+#_______________________________________________________________________________
+    def getTrackways(self, sitemap):
+        """ Returns the cached list of trackway model instances for the specified sitemap. """
+
+        if sitemap.uid in self._trackways:
+            return self._trackways[sitemap.uid]
+
+        trackways = sitemap.getTrackways()
+        self._trackways[sitemap.uid] = trackways
+        return trackways
+
+#_______________________________________________________________________________
+    def getSeriesBundle(self, trackway):
+        """ Returns the cached TrackSeriesBundle for the specified trackway.
+
+            @return: TrackSeriesBundle """
+
+        if trackway.uid in self._seriesBundles:
+            return self._seriesBundles[trackway.uid]
+
+        sitemap = trackway.sitemap
+        if not sitemap:
+            bundle = trackway.getTrackwaySeriesBundle()
+            self._seriesBundles[trackway.uid] = bundle
+            return bundle
+
+        # Load the bundles for every trackway in the sitemap at once from a single bulk track
+        # query, which is far cheaper than following each series link with its own query
+        trackways = [trackway]
+        for tw in self.getTrackways(sitemap):
+            if tw.uid != trackway.uid and tw.uid not in self._seriesBundles:
+                trackways.append(tw)
+
+        self._seriesBundles.update(sitemap.getTrackwaySeriesBundles(
+            trackways=trackways,
+            session=trackway.mySession))
+        return self._seriesBundles[trackway.uid]
+
+#_______________________________________________________________________________
+    def resetCaches(self):
+        """ Empties the transient analysis caches of every loaded sitemap, trackway, series and
+            track, which keeps the data one analyzer stores on the shared graph from leaking into
+            the next analyzer that uses it. """
+
+        for sitemap in self._sitemaps or []:
+            sitemap.cache.unload()
+            for trackway in self._trackways.get(sitemap.uid, []):
+                trackway.cache.unload()
+
+        for bundle in self._seriesBundles.values():
+            for series in bundle.asList():
+                series.cache.unload()
+                for track in series.tracks + series.incompleteTracks:
+                    track.cache.unload()
+
+#_______________________________________________________________________________
+    def close(self, commit =False):
+        """ Closes the tracks database session. By default no commit is made because analyzers
+            should not be writing to the tracks database. The loaded data remains cached. """
+
+        if self._session is None:
+            return
+
+        if commit:
+            self._session.commit()
+        self._session.close()
+        self._session = None
+
+#===============================================================================
+#                                                                               I N T R I N S I C
+
+#_______________________________________________________________________________
+    def __repr__(self):
+        return self.__str__()
+
+#_______________________________________________________________________________
+    def __str__(self):
+        return '<%s>' % self.__class__.__name__
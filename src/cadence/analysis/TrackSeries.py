@@ -176,8 +176,15 @@ class TrackSeries(object):
 #                                                                                     P U B L I C
 
 #_______________________________________________________________________________
-    def load(self):
-        """load doc..."""
+    def load(self, tracksByUid =None):
+        """ Loads the tracks in this series by following the next uid links from the first track
+            in the series.
+
+            [tracksByUid] :: Dict :: None
+                An optional dictionary of pre-fetched tracks keyed by their uid. When specified,
+                the series is assembled from this index in memory and the database is only
+                queried for tracks that are missing from it. """
+
         if not self._firstTrackUid:
             return True
 
@@ -186,7 +193,9 @@ class TrackSeries(object):
 
         nextTrackUid = self._firstTrackUid
         while nextTrackUid:
-            track = session.query(model).filter(model.uid == nextTrackUid).first()
+            track = tracksByUid.get(nextTrackUid) if tracksByUid else None
+            if track is None:
+                track = session.query(model).filter(model.uid == nextTrackUid).first()
             track.trackSeries = self
             self.tracks.append(track)
             if not track.isComplete:
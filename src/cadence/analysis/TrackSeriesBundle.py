@@ -161,11 +161,13 @@ class TrackSeriesBundle(object):
         return out
 
 #_______________________________________________________________________________
-    def load(self):
-        """load doc..."""
+    def load(self, tracksByUid =None):
+        """ Loads the tracks for each of the series in the bundle. The optional tracksByUid
+            dictionary of pre-fetched tracks is passed along to each series for in-memory
+            loading. """
 
         for series in self.asList():
-            series.load()
+            series.load(tracksByUid=tracksByUid)
 
         return True
 
@@ -19,6 +19,8 @@ class DrawLengthWidthStage(AnalysisStage):
 
     DRAWING_FOLDER_NAME = 'Spatial-Comparison-Maps'
 
+    INCREMENTAL = True
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of LengthWidthStage."""
@@ -38,6 +40,18 @@ class DrawLengthWidthStage(AnalysisStage):
         """ This returns a dictionary of deviation data: track uid, wSigma, and lSigma. """
         return self.owner.getStage('lengthWidth').trackDeviations
 
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def getIncrementalSitemapInputs(self, sitemap):
+        """ The deviations of the sitemap tracks are computed by the lengthWidth stage from the
+            entries of every sitemap, so the drawing changes when they do. """
+        deviations = self.trackDeviations
+        return sorted(
+            [uid, deviations[uid]] for uid in self._getSitemapTracksByUid(sitemap)
+            if uid in deviations)
+
 #===============================================================================
 #                                                                               P R O T E C T E D
 
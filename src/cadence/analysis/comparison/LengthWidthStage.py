@@ -22,6 +22,8 @@ class LengthWidthStage(AnalysisStage):
         measurements for length and width track parameters and the map measured
         values. """
 
+    INCREMENTAL = True
+
     #___________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of LengthWidthStage."""
@@ -74,6 +76,25 @@ class LengthWidthStage(AnalysisStage):
         self.cache.set('noWidth', 0)
         self.cache.set('noLength', 0)
 
+    #___________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        """ Returns the entries of the sitemap with the uid of each track in place of the
+            track. """
+        out = []
+        for entry in self.entries:
+            entry = dict(entry)
+            entry['trackUid'] = entry.pop('track').uid
+            out.append(entry)
+        return out
+
+    #___________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        tracks = self._getSitemapTracksByUid(sitemap)
+        for entry in result:
+            entry = dict(entry)
+            entry['track'] = tracks[entry.pop('trackUid')]
+            self.entries.append(entry)
+
     #___________________________________________________________________________
     def _calculateDeviation(
             self, track, value, uncertainty, highMeasuredUncertainty, measured,
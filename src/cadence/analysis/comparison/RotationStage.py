@@ -27,6 +27,8 @@ class RotationStage(AnalysisStage):
 
     DRAWING_FOLDER_NAME = 'Rotation-Comparison-Maps'
 
+    INCREMENTAL = True
+
     #___________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of RotationStage."""
@@ -81,7 +83,8 @@ class RotationStage(AnalysisStage):
         # start a drawing for the SVG and PDF files
         fileName = sitemap.name + "_" + sitemap.level + '_rotation.svg'
         path = self.getPath(self.DRAWING_FOLDER_NAME, fileName, isFile=True)
-        self._currentDrawing = CadenceDrawing(path, sitemap)
+        self._currentDrawing = CadenceDrawing(
+            path, sitemap, renderService=self.owner.renderService)
 
         # create a group to be instanced for the map annotations
         self._currentDrawing.createGroup('pointer')
@@ -100,6 +103,33 @@ class RotationStage(AnalysisStage):
         if self._currentDrawing:
             self._currentDrawing.save()
 
+    #___________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        data = []
+        for entry in self._data:
+            entry = dict(entry)
+            del entry['track']
+            data.append(entry)
+
+        return {
+            'rows':self._csv.rows,
+            'diffs':self._diffs,
+            'deviations':self.deviations,
+            'data':data }
+
+    #___________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        for row in result['rows']:
+            self._csv.addRow(row)
+        self._diffs.extend(result['diffs'])
+        self.deviations.update(result['deviations'])
+
+        tracks = self._getSitemapTracksByUid(sitemap)
+        for entry in result['data']:
+            entry = dict(entry)
+            entry['track'] = tracks[entry['uid']]
+            self._data.append(entry)
+
     #___________________________________________________________________________
     def _analyzeTrackSeries(self, series, trackway, sitemap):
 
@@ -18,6 +18,11 @@ class CurveCorrelationStage(CurveOrderedAnalysisStage):
 #===============================================================================
 #                                                                                       C L A S S
 
+    PARALLEL = True
+
+    INCREMENTAL = True
+
+    ANALYSIS_INPUTS = {'track':['curveIndex', 'curvePosition']}
 
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
@@ -36,6 +41,18 @@ class CurveCorrelationStage(CurveOrderedAnalysisStage):
 #_______________________________________________________________________________
     def _preAnalyze(self):
         self._paths = []
+        self._pesPaths = []
+
+#_______________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        return {
+            'paths':self._readFiles(self._paths),
+            'pesPaths':self._readFiles(self._pesPaths) }
+
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        self._paths.extend(self._createTempFiles(result['paths'], extension='pdf'))
+        self._pesPaths.extend(self._createTempFiles(result['pesPaths'], extension='pdf'))
 
 #_______________________________________________________________________________
     def _analyzeTrackway(self, trackway, sitemap):
@@ -22,6 +22,16 @@ class CurveProjectionLinkStage(AnalysisStage):
     EXTENSION_LENGTH      = 10.0
     CURVE_MAP_FOLDER_NAME = 'Projection-Linkage-Maps'
 
+    PARALLEL = True
+
+    INCREMENTAL = True
+
+    ANALYSIS_INPUTS = {
+        'trackway':['curveSeries'],
+        'track':['curvePosition', 'segmentPosition']}
+
+    ANALYSIS_OUTPUTS = {'track':['curveIndex', 'nextCurveTrack']}
+
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of CurveProjectionLinkStage."""
         super(CurveProjectionLinkStage, self).__init__(
@@ -34,6 +44,12 @@ class CurveProjectionLinkStage(AnalysisStage):
     def _preAnalyze(self):
         self._paths = []
 
+    def _getSitemapResult(self, sitemap):
+        return self._readFiles(self._paths)
+
+    def _mergeSitemapResult(self, sitemap, result):
+        self._paths.extend(self._createTempFiles(result, extension='pdf'))
+
     def _analyzeSitemap(self, sitemap):
         """_analyzeSitemap doc..."""
 
@@ -21,6 +21,16 @@ class CurveProjectionStage(AnalysisStage):
 
     CURVE_MAP_FOLDER_NAME = 'Projection-Maps'
 
+    PARALLEL = True
+
+    INCREMENTAL = True
+
+    ANALYSIS_INPUTS = {'trackway':['curveSeries']}
+
+    ANALYSIS_OUTPUTS = {
+        'trackway':['curveLength'],
+        'track':['curveSegment', 'segmentPosition', 'curvePosition']}
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of CurveProjectionStage."""
@@ -48,6 +58,19 @@ class CurveProjectionStage(AnalysisStage):
 
         self.initializeFolder(self.CURVE_MAP_FOLDER_NAME)
 
+#_______________________________________________________________________________
+    def _preAnalyzeSitemapTask(self):
+        self._paths = []
+
+#_______________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        return [(uid, self.data[uid]) for uid in sorted(self.data)]
+
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        for uid, ratios in result:
+            self.data[uid] = ratios
+
 #_______________________________________________________________________________
     def _analyzeSitemap(self, sitemap):
         """_analyzeSitemap doc..."""
@@ -93,35 +116,45 @@ class CurveProjectionStage(AnalysisStage):
                 'SITEMAP: %s' % sitemap.name], err)
             raise
 
-        self.data[trackway.uid] = curve
+        self.data[trackway.uid] = self._getProjectionRatios(curve)
         for error in curve.errors:
             self.logger.write(error)
         curve.draw(sitemap.cache.get('drawing'))
         #print(curve.getDebugReport())
 
 #_______________________________________________________________________________
-    def _postAnalyze(self):
-        """_postAnalyze doc..."""
+    @classmethod
+    def _getProjectionRatios(cls, curve):
+        """ Returns the list of projection to stride length ratios, as percentages, for each of
+            the track pairs in the segments of the specified CurveSeries. """
 
         ratios = []
+        segments = curve.segments
 
-        for name, curve in DictUtils.iter(self.data):
-            segments = curve.segments
+        for i in ListUtils.rangeOn(segments):
+            segment = segments[i]
+            segmentLine = segment.line
 
-            for i in ListUtils.rangeOn(segments):
-                segment = segments[i]
-                segmentLine = segment.line
+            # If this is an extrapolated segment, use the length from the neighboring segment
+            # instead of the artificial length of this segment.
+            if segment == segments[0]:
+                segmentLine = segments[i + 1].line
+            elif segment == segments[-1]:
+                segmentLine = segments[i - 1].line
 
-                # If this is an extrapolated segment, use the length from the neighboring segment
-                # instead of the artificial length of this segment.
-                if segment == segments[0]:
-                    segmentLine = segments[i + 1].line
-                elif segment == segments[-1]:
-                    segmentLine = segments[i - 1].line
+            for pairData in segment.pairs:
+                projectionLine = pairData['line']
+                ratios.append(100.0*projectionLine.length.raw/segmentLine.length.raw)
 
-                for pairData in segment.pairs:
-                    projectionLine = pairData['line']
-                    ratios.append(100.0*projectionLine.length.raw/segmentLine.length.raw)
+        return ratios
+
+#_______________________________________________________________________________
+    def _postAnalyze(self):
+        """_postAnalyze doc..."""
+
+        ratios = []
+        for name, values in DictUtils.iter(self.data):
+            ratios.extend(values)
 
         h = Histogram(
             data=ratios,
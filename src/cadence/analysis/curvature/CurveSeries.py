@@ -9,6 +9,7 @@ from pyaid.list.ListUtils import ListUtils
 from pyaid.number.NumericUtils import NumericUtils
 from cadence.analysis.curvature.CurveProjectionSegment import CurveProjectionSegment
 from cadence.analysis.shared.LineSegment2D import LineSegment2D
+from cadence.analysis.shared.LineSegmentIndex import LineSegmentIndex
 
 #*************************************************************************************************** CurveSeries
 class CurveSeries(object):
@@ -33,6 +34,7 @@ class CurveSeries(object):
         self._length = 0.0
         self._errors = []
         self._segments = []
+        self._segmentIndex = None
 
 #===============================================================================
 #                                                                                   G E T / S E T
@@ -112,6 +114,7 @@ class CurveSeries(object):
         self._populated = True
 
         self._generateSegments()
+        self._segmentIndex = LineSegmentIndex([s.line for s in self.segments])
         self._populate()
         self._process()
 
@@ -226,7 +229,7 @@ class CurveSeries(object):
             the projection results data, and then drawing the projection to a sitemap drawing for
             reference. """
 
-        result = self._findSegmentMatch(track, self.segments)
+        result = self._findSegmentMatch(track, self.segments, self._segmentIndex)
         segment = result['segment']
         segment.pairs.append(result)
 
@@ -324,26 +327,38 @@ class CurveSeries(object):
 
 #_______________________________________________________________________________
     @classmethod
-    def _findSegmentMatch(cls, track, segments):
+    def _findSegmentMatch(cls, track, segments, segmentIndex =None):
+        """ Finds the segment onto which the track should be projected. If a LineSegmentIndex of
+            the segments is specified, only the segments near enough to the track to produce the
+            shortest projection are tested. Otherwise every segment is tested. In both cases the
+            segments are tested in list order so the same segment is chosen when multiple segments
+            have equal projection lengths. """
+
         position = track.positionValue
-        pair = dict(track=track)
 
-        for segment in segments:
-            # Attempt to project the track position onto each of the available segments. The data
-            # dictionary is updated if the projection was successful
-            segment.project(track, pair)
+        if segmentIndex is None:
+            pair = dict(track=track)
+            for segment in segments:
+                # Attempt to project the track position onto each of the available segments. The
+                # data dictionary is updated if the projection was successful
+                segment.project(track, pair)
+        else:
+            pair = cls._projectWithIndex(track, segments, segmentIndex)
 
         if not pair.get('segment'):
             # If no segments projections were successful, the track resides at a kink in the curve
             # series curve and should be matched to a specific track instead of a segment
-            distanceTo = 1e10
-            for segment in segments:
-                line = segment.line
-                p = line.start.clone()
-                d = p.distanceTo(position)
-                if d.raw < distanceTo:
-                    distanceTo = d.raw
-                    pair['segment'] = segment
+            if segmentIndex is None:
+                distanceTo = 1e10
+                for segment in segments:
+                    line = segment.line
+                    p = line.start.clone()
+                    d = p.distanceTo(position)
+                    if d.raw < distanceTo:
+                        distanceTo = d.raw
+                        pair['segment'] = segment
+            else:
+                pair['segment'] = segments[segmentIndex.getNearestVertex(position.x, position.y)]
 
             p = pair['segment'].line.start.clone()
             p.update(xUnc=position.xUnc, yUnc=position.yUnc)
@@ -352,6 +367,28 @@ class CurveSeries(object):
 
         return pair
 
+#_______________________________________________________________________________
+    @classmethod
+    def _projectWithIndex(cls, track, segments, segmentIndex):
+        """ Projects the track onto the segments found within a search radius that doubles until
+            the shortest successful projection lies within that radius, at which point no segment
+            outside the radius could produce an equal or shorter projection. """
+
+        position = track.positionValue
+        radius = segmentIndex.cellSize
+        maxDistance = segmentIndex.getMaxDistance(position.x, position.y)
+
+        while True:
+            pair = dict(track=track)
+            for index in segmentIndex.getCandidates(position.x, position.y, radius):
+                segments[index].project(track, pair)
+
+            if pair.get('segment') and pair['projectionLength'] <= radius:
+                return pair
+            if radius >= maxDistance:
+                return pair
+            radius *= 2.0
+
 #===============================================================================
 #                                                                               I N T R I N S I C
 
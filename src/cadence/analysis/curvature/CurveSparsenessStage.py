@@ -21,6 +21,12 @@ class CurveSparsenessStage(AnalysisStage):
 #===============================================================================
 #                                                                                       C L A S S
 
+    PARALLEL = True
+
+    INCREMENTAL = True
+
+    ANALYSIS_OUTPUTS = {'trackway':['curveSeries']}
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of CurveSparsenessStage."""
@@ -89,7 +95,28 @@ class CurveSparsenessStage(AnalysisStage):
             trackway=trackway,
             manus=manusSpacings,
             pes=pesSpacings,
-            dense=denseSeries)
+            curveSeries=denseSeries.firstTrackUid if denseSeries else '')
+
+#_______________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        """ Returns the sparseness data of the sitemap trackways, in analysis order, without
+            the trackway instances. """
+        out = []
+        for trackway in self.owner.getTrackways(sitemap):
+            if trackway.uid not in self.data:
+                continue
+            data = dict(self.data[trackway.uid])
+            del data['trackway']
+            out.append((trackway.uid, data))
+        return out
+
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        trackways = dict((trackway.uid, trackway) for trackway in self.owner.getTrackways(sitemap))
+        for uid, data in result:
+            data = dict(data)
+            data['trackway'] = trackways[uid]
+            self.data[uid] = data
 
 #_______________________________________________________________________________
     @classmethod
@@ -193,7 +220,7 @@ class CurveSparsenessStage(AnalysisStage):
         for uid, data in DictUtils.iter(self.data):
             trackway = data['trackway']
             result = trackway.getAnalysisPair(self.analysisSession, createIfMissing=True)
-            result.curveSeries = data['dense'].firstTrackUid if data['dense'] else ''
+            result.curveSeries = data['curveSeries']
 
 #_______________________________________________________________________________
     def _processSparsenessResults(self, key):
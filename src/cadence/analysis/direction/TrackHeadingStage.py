@@ -33,6 +33,14 @@ class TrackHeadingStage(CurveOrderedAnalysisStage):
         #'relativeAngle' ])  # Heading angle relative to the previous track
                             #   value, or zero if no previous track
 
+    PARALLEL = True
+
+    INCREMENTAL = True
+
+    ANALYSIS_INPUTS = {'track':['curveIndex', 'curvePosition']}
+
+    ANALYSIS_OUTPUTS = {'track':['headingAngle', 'headingAngleUnc']}
+
     #___________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of TrackHeadingStage."""
@@ -40,7 +48,7 @@ class TrackHeadingStage(CurveOrderedAnalysisStage):
             key, owner,
             label='Track Headings',
             **kwargs)
-        self._paths  = []
+        self._plots  = []
 
 #===============================================================================
 #                                                                 G E T / S E T
@@ -56,6 +64,38 @@ class TrackHeadingStage(CurveOrderedAnalysisStage):
     #___________________________________________________________________________
     def _preAnalyze(self):
         self.cache.set('trackwaysData', {})
+        self._plots = []
+
+    #___________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        """ Returns the heading data of the sitemap trackways, with the uid of each track in
+            place of the track, and the trackway plots. """
+        trackwaysData = []
+        for trackway in self.owner.getTrackways(sitemap):
+            data = self.trackwaysData.get(trackway.uid)
+            if data is None:
+                continue
+
+            entries = []
+            for entry in data['entries']:
+                entry = entry._asdict()
+                entry['track'] = entry['track'].uid
+                entries.append(entry)
+            trackwaysData.append((trackway.uid, dict(data, entries=entries)))
+
+        return {'trackwaysData':trackwaysData, 'plots':self._plots}
+
+    #___________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        tracks = self._getSitemapTracksByUid(sitemap)
+        for uid, data in result['trackwaysData']:
+            entries = []
+            for entry in data['entries']:
+                entry = dict(entry)
+                entry['track'] = tracks[entry['track']]
+                entries.append(self.TRACK_HEADING_DATA_NT(**entry))
+            self.trackwaysData[uid] = dict(data, entries=entries)
+        self._plots.extend(result['plots'])
 
     #___________________________________________________________________________
     def _analyzeTrackway(self, trackway, sitemap):
@@ -89,14 +129,15 @@ class TrackHeadingStage(CurveOrderedAnalysisStage):
         elif devs['max'] >= 1.0:
             color ='green'
 
+        # The trackway plots follow the summary plots in the report and are
+        # only created once the summary plots have been added in _postAnalyze
         d = [item.point for item in entries]
-        plot = ScatterPlot(
+        self._plots.append(ScatterPlot(
             data=d,
             color=color,
             title='%s Track Headings' % trackway.name,
             yLabel='Angle (Degrees)',
-            xLabel='Trackway Curve Position (m)')
-        self._paths.append(plot.save(self.getTempFilePath(extension='pdf')))
+            xLabel='Trackway Curve Position (m)'))
 
     #___________________________________________________________________________
     def _analyzeTrack(self, track, series, trackway, sitemap):
@@ -152,8 +193,8 @@ class TrackHeadingStage(CurveOrderedAnalysisStage):
     def _postAnalyze(self):
         """_postAnalyze doc..."""
 
-        self._processCurveDeviations('max', 'Meandering')
-        self._processCurveDeviations('global', 'Globally Curved')
+        maxPlots = self._processCurveDeviations('max', 'Meandering')
+        globalPlots = self._processCurveDeviations('global', 'Globally Curved')
 
         d = [100.0*data['deviations']['fraction']
                 for k, data in DictUtils.iter(self.trackwaysData)]
@@ -164,13 +205,16 @@ class TrackHeadingStage(CurveOrderedAnalysisStage):
             title='Significant Deviations from Reference',
             yLabel='Fraction of Deviations (%)',
             xLabel='Trackway Index')
-        self._paths.insert(0, plot.save(self.getTempFilePath(extension='pdf')))
 
-        self.mergePdfs(self._paths, 'Trackway-Headings.pdf')
+        report = self.getReport('Trackway-Headings.pdf')
+        report.addPlots([plot] + globalPlots + maxPlots + self._plots)
+        self._plots = []
 
     #___________________________________________________________________________
     def _processCurveDeviations(self, key, label):
-        """_processCurveDeviations doc..."""
+        """ Logs the fraction of trackways whose deviation of the specified
+            key is significant and returns the histogram and scatter plots of
+            those deviations. """
 
         d = [data['deviations'][key]
                 for k, data in DictUtils.iter(self.trackwaysData)]
@@ -182,11 +226,10 @@ class TrackHeadingStage(CurveOrderedAnalysisStage):
             else:
                 dCurved.append(min(10.0, item))
 
-        plot = Histogram(
+        histogram = Histogram(
             data=dCurved,
             title='%s Trackway Deviations' % label,
             xLabel='Trackway Index')
-        self._paths.insert(0, plot.save(self.getTempFilePath(extension='pdf')))
 
         d = [(index, d[index]) for index in ListUtils.rangeOn(d)]
         dCurved = []
@@ -203,10 +246,11 @@ class TrackHeadingStage(CurveOrderedAnalysisStage):
             len(dCurved) + len(dStraight),
             100.0*len(dCurved)/(len(dCurved) + len(dStraight)) ))
 
-        plot = MultiScatterPlot(
+        scatter = MultiScatterPlot(
             {'data':dStraight, 'color':'blue'},
             {'data':dCurved, 'color':'red'},
             title='%s Trackway Deviations' % label,
             xLabel='Trackway Index',
             yLabel='Fractional Deviation')
-        self._paths.insert(1, plot.save(self.getTempFilePath(extension='pdf')))
+
+        return [histogram, scatter]
@@ -16,6 +16,8 @@ class TrackwayDeflectionStage(CurveOrderedAnalysisStage):
 
     MAPS_FOLDER_NAME = 'Trackway-Deflection'
 
+    INCREMENTAL = True
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of TrackwayDeflectionStage."""
@@ -36,14 +38,14 @@ class TrackwayDeflectionStage(CurveOrderedAnalysisStage):
 #_______________________________________________________________________________
     @property
     def trackwayDeflectionData(self):
-        return self.owner.cache.get('trackwayDeflectionData')
+        return self.cache.get('trackwayDeflectionData')
 
 #===============================================================================
 #                                                                               P R O T E C T E D
 
 #_______________________________________________________________________________
     def _preAnalyze(self):
-        self.owner.cache.set('trackwayDeflectionData', {})
+        self.cache.set('trackwayDeflectionData', {})
 
 #_______________________________________________________________________________
     def _analyzeSitemap(self, sitemap):
@@ -54,7 +56,8 @@ class TrackwayDeflectionStage(CurveOrderedAnalysisStage):
                 self.MAPS_FOLDER_NAME,
                 '%s-%s-DEFLECTION.svg' % (sitemap.name, sitemap.level),
                 isFile=True),
-            sitemap)
+            sitemap,
+            renderService=self.owner.renderService)
 
         drawing.grid()
         drawing.federalCoordinates()
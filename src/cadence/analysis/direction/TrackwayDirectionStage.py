@@ -11,6 +11,7 @@ from pyaid.number.NumericUtils import NumericUtils
 
 from cadence.analysis.CurveOrderedAnalysisStage import CurveOrderedAnalysisStage
 from cadence.analysis.shared.LineSegment2D import LineSegment2D
+from cadence.analysis.shared.RollingWeightedStatistics import RollingWeightedStatistics
 from pyaid.number.PositionValue2D import PositionValue2D
 from cadence.analysis.shared.plotting.MultiScatterPlot import MultiScatterPlot
 from cadence.svg.CadenceDrawing import CadenceDrawing
@@ -33,6 +34,14 @@ class TrackwayDirectionStage(CurveOrderedAnalysisStage):
 
     COLORS = ['#AAAAAA', 'black', 'blue', 'green', 'red']
 
+    PARALLEL = True
+
+    INCREMENTAL = True
+
+    ANALYSIS_INPUTS = {
+        'track':['curveIndex', 'curvePosition'],
+        'trackway':['curveLength']}
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of TrackwayDirectionStage."""
@@ -40,7 +49,7 @@ class TrackwayDirectionStage(CurveOrderedAnalysisStage):
             key, owner,
             label='Trackway Direction',
             **kwargs)
-        self._paths = []
+        self._plots = []
 
 #===============================================================================
 #                                                                                   G E T / S E T
@@ -53,19 +62,67 @@ class TrackwayDirectionStage(CurveOrderedAnalysisStage):
 #_______________________________________________________________________________
     @property
     def trackwayDirectionData(self):
-        return self.owner.cache.get('trackwayDirectionData')
+        return self.cache.get('trackwayDirectionData')
 
 #===============================================================================
 #                                                                               P R O T E C T E D
 
 #_______________________________________________________________________________
     def _preAnalyze(self):
-        self.owner.cache.set('trackwayDirectionData', {})
+        self.cache.set('trackwayDirectionData', {})
+        self._plots = []
+
+#_______________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        """ Returns the direction samples of the sitemap trackways, with the uid of each track
+            in place of the track, and the trackway plots. """
+        directionData = []
+        for trackway in self.owner.getTrackways(sitemap):
+            data = self.trackwayDirectionData.get(trackway.uid)
+            if data is None:
+                continue
+
+            samples = []
+            for sample in data['samples']:
+                values = []
+                for value in sample['values']:
+                    value = value._asdict()
+                    value['track'] = value['track'].uid
+                    values.append(value)
+                samples.append({'size':sample['size'], 'values':values})
+            directionData.append((trackway.uid, samples))
+
+        return {'directionData':directionData, 'plots':self._plots}
+
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        trackways = dict((trackway.uid, trackway) for trackway in self.owner.getTrackways(sitemap))
+        tracks = self._getSitemapTracksByUid(sitemap)
+
+        for uid, storedSamples in result['directionData']:
+            samples = []
+            for sample in storedSamples:
+                values = []
+                for value in sample['values']:
+                    value = dict(value)
+                    value['track'] = tracks[value['track']]
+                    values.append(self.SAMPLE_DATA_NT(**value))
+                samples.append({'size':sample['size'], 'values':values})
+            self.trackwayDirectionData[uid] = {'trackway':trackways[uid], 'samples':samples}
+
+        self._plots.extend(result['plots'])
 
 #_______________________________________________________________________________
     def _analyzeSitemap(self, sitemap):
         """_analyzeSitemap doc..."""
 
+        heading = self.owner.getStage('heading')
+        if heading.trackwaysData is None:
+            # Within sitemap worker processes the heading stage has not run, so the track
+            # headings of this sitemap are computed again
+            heading._preAnalyzeSitemapTask()
+            heading._analyzeSitemap(sitemap)
+
         self._createDrawing(sitemap, 'SAMPLED-DIRECTION', self.MAPS_FOLDER_NAME)
         super(TrackwayDirectionStage, self)._analyzeSitemap(sitemap)
         self._saveDrawing(sitemap)
@@ -84,11 +141,10 @@ class TrackwayDirectionStage(CurveOrderedAnalysisStage):
         while maxWindowSize < windowSizes[-1]:
             windowSizes.pop()
 
-        samples = []
-
-        for i in windowSizes:
-            # For each valid window size create a sample entry
-            samples.append({'size':i + 1, 'values':self._sampleTrackway(trackway, i + 1) })
+        # Sample every valid window size in a single pass over the trackway
+        sizes = [i + 1 for i in windowSizes]
+        sampled = self._sampleTrackway(trackway, sizes)
+        samples = [{'size':size, 'values':sampled[size]} for size in sizes]
 
         self._plotTrackwaySamples(trackway, samples)
         self._drawTrackwaySamples(sitemap, samples)
@@ -142,83 +198,76 @@ class TrackwayDirectionStage(CurveOrderedAnalysisStage):
 
             plot.addPlotSeries(data=data, color=color, line=True)
 
-        self._paths.append(plot.save(self.getTempFilePath(extension='pdf')))
+        # The plots are added to the report in _postAnalyze, which allows them to be returned
+        # within sitemap results before their figures are created
+        self._plots.append(plot)
+
+#_______________________________________________________________________________
+    def _postAnalyze(self):
+        if self._plots:
+            self.getReport('Trackway-Direction.pdf').addPlots(self._plots)
+        self._plots = []
 
 #_______________________________________________________________________________
-    def _sampleTrackway(self, trackway, windowSize):
+    def _sampleTrackway(self, trackway, windowSizes):
         """
-            Samples the trackway and returns result
+            Samples the trackway with each of the window sizes in a single pass over its heading
+            entries and returns a dictionary of the samples for each window size
             @type trackway: * """
 
-        window = []
-        samples = []
+        samples = dict([(size, []) for size in windowSizes])
+        rolling = RollingWeightedStatistics(windowSizes)
 
         entries = self.trackHeadingData[trackway.uid]['entries']
         analysisTrackway = trackway.getAnalysisPair(self.analysisSession)
 
         for entry in entries:
-            # For each track entry in the trackways data add that to the sample window and update
-            # the samples result
-
-            window.append(entry)
-
-            if len(window) < windowSize:
-                # Don't create a sample until the sub-sample list exceeds the sample window size
-                continue
-
-            xTests        = [] # X spatial position values
-            yTests        = [] # Y spatial position values
-            angleTests    = [] # Heading angle values
-            curvePosTests = [] # Curve position values
-            for item in window:
-                # Calculate weighted averages for various properties of the current sample window
-
-                angle = item.headingAngle
-                angleTests.append(angle.valueDegrees)
-
-                # Create a ValueUncertainty for the curve position by using the fractional
-                # positional uncertainty over the spatial length of the curve
-                posValue = item.track.positionValue
-                posUnc = math.sqrt(posValue.xUnc**2 + posValue.yUnc**2)
-                curvePos = item.track.getAnalysisPair(self.analysisSession).curvePosition
-                curvePosUnc = abs(posUnc/analysisTrackway.curveLength)
-                curvePosTests.append(NumericUtils.toValueUncertainty(curvePos, curvePosUnc))
-
-                pv = item.track.positionValue
-                xTests.append(pv.xValue)
-                yTests.append(pv.yValue)
-
-            directionAngleMean = NumericUtils.weightedAverage(*angleTests)
-            curvePositionMean = NumericUtils.weightedAverage(*curvePosTests)
-            xValue = NumericUtils.weightedAverage(*xTests)
-            yValue = NumericUtils.weightedAverage(*yTests)
-            position = PositionValue2D(
-                x=xValue.raw, xUnc=xValue.rawUncertainty,
-                y=yValue.raw, yUnc=yValue.rawUncertainty)
-
-            # Remove the oldest sample from the to make room for a new sample in the next iteration
-            window.pop(0)
-
-            if len(samples) > 0:
-                # Compare this sample to the previous one and if it does not differ
-                # significantly then continue to continue to the next iteration
-                last = samples[-1].directionAngle
-                totalUnc = last.rawUncertainty + directionAngleMean.rawUncertainty
-                deviation = abs(directionAngleMean.raw - last.raw)/totalUnc
-                if deviation < 2.0:
-                    continue
-
-            samples.append(self.SAMPLE_DATA_NT(
-                directionAngle=directionAngleMean,
-                position=position,
-                curvePoint=(
-                    curvePositionMean.value, directionAngleMean.value,
-                    curvePositionMean.uncertainty, directionAngleMean.uncertainty),
-                curvePosition=curvePositionMean,
-                track=entry.track ))
-
-        self._extendSamplesToTrackwayStart(entries[0], samples)
-        self._extendSampleToTrackwayEnd(entries[-1], samples)
+            # For each track entry in the trackways data add its values to the sample windows
+            # and update the samples result of every window that is full
+
+            angle = entry.headingAngle
+
+            # Create a ValueUncertainty for the curve position by using the fractional
+            # positional uncertainty over the spatial length of the curve
+            posValue = entry.track.positionValue
+            posUnc = math.sqrt(posValue.xUnc**2 + posValue.yUnc**2)
+            curvePos = entry.track.getAnalysisPair(self.analysisSession).curvePosition
+            curvePosUnc = abs(posUnc/analysisTrackway.curveLength)
+
+            windows = rolling.push(
+                angle.valueDegrees,
+                NumericUtils.toValueUncertainty(curvePos, curvePosUnc),
+                posValue.xValue,
+                posValue.yValue)
+
+            for windowSize, averages in windows:
+                directionAngleMean, curvePositionMean, xValue, yValue = averages
+                position = PositionValue2D(
+                    x=xValue.raw, xUnc=xValue.rawUncertainty,
+                    y=yValue.raw, yUnc=yValue.rawUncertainty)
+
+                windowSamples = samples[windowSize]
+                if len(windowSamples) > 0:
+                    # Compare this sample to the previous one and if it does not differ
+                    # significantly then continue to continue to the next window
+                    last = windowSamples[-1].directionAngle
+                    totalUnc = last.rawUncertainty + directionAngleMean.rawUncertainty
+                    deviation = abs(directionAngleMean.raw - last.raw)/totalUnc
+                    if deviation < 2.0:
+                        continue
+
+                windowSamples.append(self.SAMPLE_DATA_NT(
+                    directionAngle=directionAngleMean,
+                    position=position,
+                    curvePoint=(
+                        curvePositionMean.value, directionAngleMean.value,
+                        curvePositionMean.uncertainty, directionAngleMean.uncertainty),
+                    curvePosition=curvePositionMean,
+                    track=entry.track ))
+
+        for windowSamples in samples.values():
+            self._extendSamplesToTrackwayStart(entries[0], windowSamples)
+            self._extendSampleToTrackwayEnd(entries[-1], windowSamples)
         return samples
 
 #_______________________________________________________________________________
@@ -270,7 +319,3 @@ class TrackwayDirectionStage(CurveOrderedAnalysisStage):
             curvePoint=(analysisTrack.curvePosition, ha.value, 0, ha.uncertainty),
             curvePosition=samples[-1].curvePosition.clone(),
             track=lastTrack ))
-
-#_______________________________________________________________________________
-    def _postAnalyze(self):
-        self.mergePdfs(self._paths, 'Trackway-Direction.pdf')
@@ -18,6 +18,8 @@ from cadence.analysis.shared.CsvWriter import CsvWriter
 class SimulationCsvExporterStage(CurveOrderedAnalysisStage):
     """A class for..."""
 
+    INCREMENTAL = True
+
     def __init__(self, key, owner, **kwargs):
         super(SimulationCsvExporterStage, self).__init__(
             key, owner,
@@ -42,7 +44,18 @@ class SimulationCsvExporterStage(CurveOrderedAnalysisStage):
             sitemap=sitemap
         )
 
+        path = self.owner.settings.fetch('EXPORT_DATA_PATH')
+        if path is None:
+            path = self.owner.getLocalPath('Simulation', 'data', isFile=True)
+        path = FileUtils.makeFilePath(path, trackway.name, 'source.csv')
+
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
         csv = CsvWriter(
+            path=path,
+            flushCount=CsvWriter.DEFAULT_FLUSH_COUNT,
             autoIndexFieldName='Index',
             fields=[
                 'lp_name', 'lp_uid', 'lp_x', 'lp_dx', 'lp_y', 'lp_dy',
@@ -68,16 +81,7 @@ class SimulationCsvExporterStage(CurveOrderedAnalysisStage):
                     items += self._create_entry(limb_id).items()
             csv.addRow(dict(items))
 
-        path = self.owner.settings.fetch('EXPORT_DATA_PATH')
-        if path is None:
-            path = self.owner.getLocalPath('Simulation', 'data', isFile=True)
-        path = FileUtils.makeFilePath(path, trackway.name, 'source.csv')
-
-        directory = os.path.dirname(path)
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-
-        if csv.save(path):
+        if csv.save():
             print('[SAVED]:', path)
         else:
             print('[ERROR]: Unable to save CSV at "{}"'.format(path))
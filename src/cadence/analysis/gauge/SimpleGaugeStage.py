@@ -26,6 +26,18 @@ class SimpleGaugeStage(CurveOrderedAnalysisStage):
 
     _GAUGE_DATA_NT = namedtuple('GAUGE_DATA_NT', ['abs', 'width', 'pace', 'stride'])
 
+    PARALLEL = True
+
+    INCREMENTAL = True
+
+    ANALYSIS_INPUTS = {'track':[
+        'curveIndex', 'curvePosition', 'paceLength', 'paceLengthUnc', 'strideLength',
+        'strideLengthUnc']}
+
+    ANALYSIS_OUTPUTS = {
+        'track':['simpleGauge', 'simpleGaugeUnc'],
+        'trackway':['simpleGauge', 'simpleGaugeUnc']}
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of SimpleGaugeStage."""
@@ -33,7 +45,7 @@ class SimpleGaugeStage(CurveOrderedAnalysisStage):
             key, owner,
             label='Simple Track Gauge',
             **kwargs)
-        self._paths  = []
+        self._plots  = []
         self._errorTracks = []
         self._ignoreTracks = []
         self._trackwayGauges = None
@@ -46,7 +58,7 @@ class SimpleGaugeStage(CurveOrderedAnalysisStage):
 #_______________________________________________________________________________
     def _preAnalyze(self):
         self._trackwayGauges = self._GAUGE_DATA_NT([], [], [], [])
-        self._paths = []
+        self._plots = []
         self._errorTracks = []
         self._ignoreTracks = []
         self._count = 0
@@ -72,6 +84,27 @@ class SimpleGaugeStage(CurveOrderedAnalysisStage):
         super(SimpleGaugeStage, self)._analyzeSitemap(sitemap)
         self._saveDrawing(sitemap)
 
+#_______________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        return {
+            'gauges':self._trackwayGauges._asdict(),
+            'plots':self._plots,
+            'errorTracks':self._errorTracks,
+            'ignoreTracks':self._ignoreTracks,
+            'count':self._count,
+            'rows':self._trackwayCsv.rows }
+
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        for name in self._GAUGE_DATA_NT._fields:
+            getattr(self._trackwayGauges, name).extend(result['gauges'][name])
+        self._plots.extend(result['plots'])
+        self._errorTracks.extend(result['errorTracks'])
+        self._ignoreTracks.extend(result['ignoreTracks'])
+        self._count += result['count']
+        for row in result['rows']:
+            self._trackwayCsv.addRow(row)
+
 #_______________________________________________________________________________
     def _analyzeTrackway(self, trackway, sitemap):
         bundle = self.owner.getSeriesBundle(trackway)
@@ -160,12 +193,13 @@ class SimpleGaugeStage(CurveOrderedAnalysisStage):
 
         self._trackwayCsv.addRow(record)
 
-        plot = ScatterPlot(
+        # Trackway plots are added to the report after the summary plots in _postAnalyze, which
+        # also allows them to be returned from parallel workers before their figures are created
+        self._plots.append(ScatterPlot(
             data=data['points'],
             title='%s Width-Normalized Gauges (%s)' % (trackway.name, widthValue.label),
             xLabel='Track Position (m)',
-            yLabel='Gauge (AU)')
-        self._paths.append(plot.save(self.getTempFilePath(extension='pdf')))
+            yLabel='Gauge (AU)'))
 
         analysisTrackway = trackway.getAnalysisPair(self.analysisSession)
         analysisTrackway.simpleGauge = widthValue.raw
@@ -205,11 +239,11 @@ class SimpleGaugeStage(CurveOrderedAnalysisStage):
         if skipped == 4:
             # If skipped is 4 it means that no suitable series existed for calculating a gauge
             # value and the method should abort quietly
-            self._ignoreTracks.append(track)
+            self._ignoreTracks.append({'uid':track.uid, 'fingerprint':track.fingerprint})
             return
 
         if segmentPair is None:
-            self._errorTracks.append(track)
+            self._errorTracks.append({'uid':track.uid, 'fingerprint':track.fingerprint})
             return
 
         color = 'blue' if segmentSeries.pes == series.pes else 'orange'
@@ -260,8 +294,8 @@ class SimpleGaugeStage(CurveOrderedAnalysisStage):
             fields=[
                 ('uid', 'UID'),
                 ('fingerprint', 'Fingerprint') ])
-        for track in self._errorTracks:
-            csv.createRow(uid=track.uid, fingerprint=track.fingerprint)
+        for entry in self._errorTracks:
+            csv.createRow(**entry)
         csv.save()
 
         if self._errorTracks:
@@ -273,8 +307,8 @@ class SimpleGaugeStage(CurveOrderedAnalysisStage):
             fields=[
                 ('uid', 'UID'),
                 ('fingerprint', 'Fingerprint') ])
-        for track in self._ignoreTracks:
-            csv.createRow(uid=track.uid, fingerprint=track.fingerprint)
+        for entry in self._ignoreTracks:
+            csv.createRow(**entry)
         csv.save()
 
         if self._ignoreTracks:
@@ -287,6 +321,7 @@ class SimpleGaugeStage(CurveOrderedAnalysisStage):
             ('width', 'blue', 'AU', 'Width-Normalized Weighted'),
             ('abs', 'purple', 'm', 'Absolute Unweighted') ]
 
+        plots = []
         for data in plotData:
             out = []
             source = ListUtils.sortListByIndex(
@@ -296,29 +331,31 @@ class SimpleGaugeStage(CurveOrderedAnalysisStage):
 
             for item in source:
                 out.append(PositionValue2D(x=len(out), y=item[1].value, yUnc=item[1].uncertainty))
-            self._plotTrackwayGauges(out, *data[1:])
+            plots = self._plotTrackwayGauges(out, *data[1:]) + plots
 
-        self.mergePdfs(self._paths, 'Gauges.pdf')
+        self.getReport('Gauges.pdf').addPlots(plots + self._plots)
+        self._plots = []
 
 #_______________________________________________________________________________
     def _plotTrackwayGauges(self, points, color, unit, heading):
+        """ Returns the scatter plot and histogram of the specified averaged trackway gauges. """
 
         histData = []
         for p in points:
             histData.append(p.yValue.value)
 
-        plot = Histogram(
+        histogram = Histogram(
             data=histData,
             title='%s Trackway Gauges' % heading,
             xLabel='Averaged Trackway Gauge (%s)' % unit,
             yLabel='Frequency',
             color=color)
-        self._paths.insert(0, plot.save(self.getTempFilePath(extension='pdf')))
 
-        plot = ScatterPlot(
+        scatter = ScatterPlot(
             data=ListUtils.sortObjectList(points, 'y', inPlace=True),
             title='%s Trackway Gauges' % heading,
             xLabel='Trackway Pes Count (#)',
             yLabel='Averaged Trackway Gauge (%s)' % unit,
             color=color)
-        self._paths.insert(0, plot.save(self.getTempFilePath(extension='pdf')))
+
+        return [scatter, histogram]
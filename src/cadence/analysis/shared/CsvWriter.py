@@ -6,6 +6,9 @@ from __future__ import print_function, absolute_import, unicode_literals, divisi
 
 from collections import OrderedDict
 import csv
+import io
+import sys
+
 from pyaid.dict.DictUtils import DictUtils
 from pyaid.file.FileUtils import FileUtils
 
@@ -14,7 +17,17 @@ from pyaid.system.SystemUtils import SystemUtils
 
 #*******************************************************************************
 class CsvWriter(object):
-    """A class for..."""
+    """ Writes rows of data to a CSV file. By default every row is kept in memory until the
+        file is saved. When the flushCount is set, the rows are instead written to the file in
+        chunks of that many rows as they are added, which requires the path and fields to be set
+        before the first chunk is written. The save method then writes any remaining rows and
+        closes the file. """
+
+    # Size in bytes of the write buffer of the output file
+    BUFFER_SIZE = 1 << 16
+
+    # A flushCount suited to stages that write a row for every track or trackway
+    DEFAULT_FLUSH_COUNT = 10000
 
     #___________________________________________________________________________
     def __init__(self, **kwargs):
@@ -22,9 +35,15 @@ class CsvWriter(object):
         self.rows               = kwargs.get('rows', [])
         self.autoIndexFieldName = kwargs.get('autoIndexFieldName', None)
         self.removeIfSavedEmpty = kwargs.get('removeIfSavedEmpty', True)
+        self.flushCount         = kwargs.get('flushCount', None)
         self._path              = kwargs.get('path')
         self._fields            = OrderedDict()
 
+        self._file              = None
+        self._writer            = None
+        self._writtenCount      = 0
+        self._failed            = False
+
         if 'fields' in kwargs:
             self.addFields(*kwargs.get('fields'))
 
@@ -63,7 +82,8 @@ class CsvWriter(object):
     #___________________________________________________________________________
     @property
     def count(self):
-        return len(self.rows)
+        """ The number of rows added, including those already flushed to the file. """
+        return self._writtenCount + len(self.rows)
 
     #===========================================================================
     #                                                               P U B L I C
@@ -102,54 +122,122 @@ class CsvWriter(object):
     def addRow(self, rowData):
         """addRow doc..."""
         self.rows.append(rowData)
+        if self.flushCount and len(self.rows) >= self.flushCount:
+            self.flush()
 
     #___________________________________________________________________________
     def createRow(self, **kwargs):
         """addRow doc..."""
         self.addRow(kwargs)
 
+    #___________________________________________________________________________
+    def flush(self, path =None):
+        """ Writes the rows that have been added since the last flush to the file and then
+            clears them from memory. The file is created with its header row by the first
+            flush, after which rows are written to the same file regardless of the path until
+            the file is saved. Returns False if the rows could not be written. """
+
+        if self._failed:
+            return False
+
+        try:
+            if self._writer is None:
+                path = path if path else self.path
+                if not path:
+                    return False
+                self._openFile(path)
+
+            self._writer.writerows(self._iterRowValues(self.rows))
+        except Exception:
+            self._failed = True
+            return False
+
+        self._writtenCount += len(self.rows)
+        self.rows = []
+        return True
+
     #___________________________________________________________________________
     def save(self, path =None):
         """ Saves the CSV file data to the specified path """
         if path is None:
             path = self.path
 
-        if self.removeIfSavedEmpty and not self.rows:
+        if self.removeIfSavedEmpty and not self.count:
             self.remove()
             return
 
-        index = 0
-        names = self.fieldNames
-        if self.autoIndexFieldName:
-            names.insert(0, self.autoIndexFieldName)
+        # Rows have already been flushed to the file, so only the remaining rows are written
+        if self._writer is not None:
+            try:
+                return self.flush()
+            finally:
+                self._closeFile()
 
         try:
-            with open(path, 'wb') as f:
-                writer = csv.DictWriter(f, fieldnames=names, dialect=csv.excel)
-                writer.writeheader()
-                for row in self.rows:
-                    result = dict()
-
-                    if self.autoIndexFieldName:
-                        index += 1
-                        result[self.autoIndexFieldName] = index
-
-                    for key, spec in DictUtils.iter(self._fields):
-                        value = row.get(key, spec.get('empty', ''))
-                        name = spec.get('name', key)
-                        if StringUtils.isTextType(value):
-                            value = value.encode('latin-1')
-                        result[name] = value
-                    writer.writerow(result)
+            self._openFile(path)
+            self._writer.writerows(self._iterRowValues(self.rows))
             return True
         except Exception:
             return False
+        finally:
+            self._closeFile()
 
     #___________________________________________________________________________
     def remove(self):
         """remove doc..."""
         return SystemUtils.remove(self.path)
 
+    #===========================================================================
+    #                                                         P R O T E C T E D
+
+    #___________________________________________________________________________
+    def _openFile(self, path):
+        """ Opens the output file at the specified path and writes its header row. Text
+            values are encoded to latin-1 by the buffered file itself where the csv module
+            writes text, and by _iterRowValues otherwise. """
+
+        if sys.version_info[0] < 3:
+            self._file = io.open(path, 'wb', buffering=self.BUFFER_SIZE)
+        else:
+            self._file = io.open(
+                path, 'w', buffering=self.BUFFER_SIZE, encoding='latin-1', newline='')
+
+        names = self.fieldNames
+        if self.autoIndexFieldName:
+            names.insert(0, self.autoIndexFieldName)
+
+        self._writer = csv.writer(self._file, dialect=csv.excel)
+        self._writer.writerow(list(self._encodeValues(names)))
+
+    #___________________________________________________________________________
+    def _closeFile(self):
+        if self._file is not None:
+            self._file.close()
+        self._file   = None
+        self._writer = None
+
+    #___________________________________________________________________________
+    def _iterRowValues(self, rows):
+        """ Yields the list of values written for each of the specified rows, in the order
+            of the header, numbered by the auto index when one is set. """
+
+        fields = [(key, spec.get('empty', '')) for key, spec in self._fields.items()]
+        index  = self._writtenCount
+
+        for row in rows:
+            values = [row.get(key, empty) for key, empty in fields]
+            if self.autoIndexFieldName:
+                index += 1
+                values.insert(0, index)
+            yield self._encodeValues(values)
+
+    #___________________________________________________________________________
+    @classmethod
+    def _encodeValues(cls, values):
+        if sys.version_info[0] >= 3:
+            return values
+        return [v.encode('latin-1') if StringUtils.isTextType(v) else v for v in values]
+
     #===========================================================================
     #                                                         I N T R I N S I C
 
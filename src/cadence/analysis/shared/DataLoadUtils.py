@@ -15,9 +15,11 @@ from cadence.analysis.shared import PlotConfigs
 
 PyGlassEnvironment.initializeFromInternalPath(__file__)
 
+import json
 import os
 import re
 
+import numpy as np
 import pandas as pd
 import sqlalchemy as sqla
 
@@ -27,6 +29,13 @@ from cadence.CadenceEnvironment import CadenceEnvironment
 
 class __LOCALS__(object):
     SETTINGS_CONFIG = None
+    ENGINES = dict()
+
+# Name of the columnar snapshot of the merged tracks tables created by getTrackWithAnalysis()
+TRACK_CACHE_FILENAME = 'tracks-with-analysis.npz'
+
+# Incremented whenever the structure of the track cache file changes to invalidate older caches
+TRACK_CACHE_VERSION = 1
 
 #_______________________________________________________________________________
 def getAnalysisPath(*args, **kwargs):
@@ -63,9 +72,116 @@ def getAnalysisData(
     return df
 
 #_______________________________________________________________________________
-def getTrackWithAnalysis():
+def getTrackWithAnalysis(columns =None, site =None, level =None, useCache =True):
     """ Loads the tracks table from both the tracks.vdb and analysis.vdb and
-        merges them together into a single DataFrame.
+        merges them together into a single DataFrame. By default the merged
+        frame is read from a columnar snapshot that is regenerated whenever
+        either database file changes, which is much faster than reading the
+        database tables.
+
+    @param columns: list
+        The names of the columns to load. All columns are loaded if None.
+    @param site: str | list
+        One or more site names to which the loaded rows are limited.
+    @param level: str | list
+        One or more level names to which the loaded rows are limited.
+    @param useCache: bool
+        When False the tables are read directly from the databases.
+
+    @return: DataFrame
+    """
+    if not useCache:
+        return _filterTracks(_readTrackWithAnalysis(), columns, site, level)
+
+    path = getTrackCachePath()
+    key = _getTrackCacheKey()
+    if _readTrackCacheKey(path) != key:
+        writeTrackCache(_readTrackWithAnalysis(), path, key)
+    return readTrackCache(path, columns=columns, site=site, level=level)
+
+#_______________________________________________________________________________
+def getTrackCachePath():
+    """ Returns the absolute path to the track cache file, which is stored
+        alongside the databases.
+    @return: str
+    """
+    return CadenceEnvironment.getLocalAppResourcePath(
+        'data', TRACK_CACHE_FILENAME, isFile=True)
+
+#_______________________________________________________________________________
+def writeTrackCache(df, path, key):
+    """ Writes the specified DataFrame to the track cache file at the specified
+        path, with each column stored as a separate array so that columns can
+        be loaded individually. The file is replaced only after it has been
+        written completely.
+
+    @param df: DataFrame
+    @param path: str
+    @param key: str
+        The cache key identifying the database state from which the frame was
+        loaded.
+    """
+    arrays = dict(
+        __key__=np.array(key),
+        __columns__=np.array(json.dumps([str(c) for c in df.columns])))
+
+    for index, column in enumerate(df.columns):
+        arrays['c%s' % index] = df[column].values
+
+    tempPath = '%s.tmp' % path
+    with open(tempPath, 'wb') as f:
+        np.savez(f, **arrays)
+
+    if os.path.exists(path):
+        os.remove(path)
+    os.rename(tempPath, path)
+
+#_______________________________________________________________________________
+def readTrackCache(path, columns =None, site =None, level =None):
+    """ Reads the merged tracks frame from the track cache file at the
+        specified path. Only the requested columns are read from the file, and
+        the site and level columns are read first to select the rows.
+
+    @param path: str
+    @param columns: list
+    @param site: str | list
+    @param level: str | list
+
+    @return: DataFrame
+    """
+    with np.load(path, allow_pickle=True) as data:
+        names = json.loads(data['__columns__'].item())
+        indexes = dict((name, index) for index, name in enumerate(names))
+
+        def getColumn(name):
+            return data['c%s' % indexes[name]]
+
+        mask = None
+        for name, values in [('site', site), ('level', level)]:
+            if values is None:
+                continue
+            if not isinstance(values, (list, tuple, set)):
+                values = [values]
+            selected = pd.Series(getColumn(name)).isin(list(values)).values
+            mask = selected if mask is None else (mask & selected)
+
+        if columns is None:
+            columns = names
+        else:
+            missing = [c for c in columns if c not in indexes]
+            if missing:
+                raise KeyError('Unknown track columns: %s' % ', '.join(missing))
+
+        out = dict()
+        for name in columns:
+            values = getColumn(name)
+            out[name] = values if mask is None else values[mask]
+
+    return pd.DataFrame(out, columns=columns)
+
+#_______________________________________________________________________________
+def _readTrackWithAnalysis():
+    """ Reads and merges the tracks tables from the databases.
     @return: DataFrame
     """
     df = pd.merge(
@@ -77,6 +193,50 @@ def getTrackWithAnalysis():
     df['sizeClass'] = df['width'].map(_widthToSizeClassMapping)
     return df
 
+#_______________________________________________________________________________
+def _filterTracks(df, columns, site, level):
+    """ Applies the column projection and the site and level row filtering of
+        getTrackWithAnalysis() to a frame loaded from the databases, with the
+        same result as a frame read from the track cache.
+    @return: DataFrame
+    """
+    for name, values in [('site', site), ('level', level)]:
+        if values is None:
+            continue
+        if not isinstance(values, (list, tuple, set)):
+            values = [values]
+        df = df[df[name].isin(list(values))]
+
+    if columns is not None:
+        df = df[list(columns)]
+    return df.reset_index(drop=True)
+
+#_______________________________________________________________________________
+def _getTrackCacheKey():
+    """ Returns a key identifying the current state of the tracks and analysis
+        databases from the modification times and sizes of their files.
+    @return: str
+    """
+    key = [TRACK_CACHE_VERSION]
+    for analysis in [False, True]:
+        stat = os.stat(getDatabasePath(analysis=analysis))
+        key.extend([stat.st_mtime, stat.st_size])
+    return json.dumps(key)
+
+#_______________________________________________________________________________
+def _readTrackCacheKey(path):
+    """ Returns the cache key stored in the track cache file at the specified
+        path, or None if the file does not exist or cannot be read.
+    @return: str
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=True) as data:
+            return data['__key__'].item()
+    except Exception:
+        return None
+
 #_______________________________________________________________________________
 def _widthToSizeClassMapping(value):
     """ Returns the size class mapping for the specified
@@ -100,15 +260,23 @@ def getTrackwaysWithAnalysis():
 
 #_______________________________________________________________________________
 def createEngine(analysis =False):
-    """ Creates the SqlAlchemy engine to connect to the database and returns
-        that engine.
+    """ Returns the SqlAlchemy engine to connect to the database, which is
+        created on the first call and reused afterwards.
     :return: Engine
     """
+    if analysis not in __LOCALS__.ENGINES:
+        url = 'sqlite:///%s' % getDatabasePath(analysis=analysis)
+        __LOCALS__.ENGINES[analysis] = sqla.create_engine(url)
+    return __LOCALS__.ENGINES[analysis]
+
+#_______________________________________________________________________________
+def getDatabasePath(analysis =False):
+    """ Returns the absolute path to the tracks or analysis database file.
+    :return: str
+    """
     name = 'analysis.vdb' if analysis else 'tracks.vdb'
-    path = CadenceEnvironment.getLocalAppResourcePath(
+    return CadenceEnvironment.getLocalAppResourcePath(
         'data', name, isFile=True)
-    url = 'sqlite:///%s' % path
-    return sqla.create_engine(url)
 
 #_______________________________________________________________________________
 def readTable(tableName, analysis =False):
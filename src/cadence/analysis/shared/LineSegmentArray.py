@@ -0,0 +1,306 @@
+# LineSegmentArray.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import numpy as np
+from pyaid.number.PositionValue2D import PositionValue2D
+
+from cadence.analysis.shared.LineSegment2D import LineSegment2D
+
+#*************************************************************************************************** LineSegmentArray
+class LineSegmentArray(object):
+    """ A batch counterpart to the LineSegment2D class that stores the start and end points of
+        many line segments, along with their x and y uncertainties, in NumPy arrays and carries
+        out the LineSegment2D operations on all segments at once. Values and uncertainties are
+        returned as separate arrays of raw (unrounded) values, which correspond to the raw and
+        rawUncertainty values of the scalar results. """
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def __init__(self, startX, startY, endX, endY,
+                 startXUnc =0.0, startYUnc =0.0, endXUnc =0.0, endYUnc =0.0):
+        """ Creates a new instance of LineSegmentArray from array-like coordinates and
+            uncertainties, which are broadcast to a common length. """
+
+        arrays = np.broadcast_arrays(*[np.asarray(v, dtype=np.float64) for v in [
+            startX, startY, endX, endY, startXUnc, startYUnc, endXUnc, endYUnc ]])
+        arrays = [np.array(a, dtype=np.float64, ndmin=1) for a in arrays]
+
+        self.startX, self.startY, self.endX, self.endY = arrays[:4]
+        self.startXUnc, self.startYUnc, self.endXUnc, self.endYUnc = arrays[4:]
+
+#===============================================================================
+#                                                                                   G E T / S E T
+
+#_______________________________________________________________________________
+    @property
+    def count(self):
+        return self.startX.size
+
+#_______________________________________________________________________________
+    @property
+    def deltaX(self):
+        return self.endX - self.startX
+
+#_______________________________________________________________________________
+    @property
+    def deltaY(self):
+        return self.endY - self.startY
+
+#_______________________________________________________________________________
+    @property
+    def isValid(self):
+        """ A boolean array specifying which segments have distinct start and end points. """
+        return (np.abs(self.deltaX) + np.abs(self.deltaY)) > 0.0
+
+#_______________________________________________________________________________
+    @property
+    def lengths(self):
+        """ The lengths of the line segments as a tuple of (values, uncertainties) arrays. """
+        return self._distanceBetween(
+            self.startX, self.startY, self.startXUnc, self.startYUnc,
+            self.endX, self.endY, self.endXUnc, self.endYUnc)
+
+#_______________________________________________________________________________
+    @property
+    def angles(self):
+        """ The angles of the line segments in radians as a tuple of (values, uncertainties)
+            arrays, which correspond to the LineSegment2D.angle property. """
+
+        vx = self.deltaX
+        vy = self.deltaY
+        vxUnc = np.sqrt(self.startXUnc**2 + self.endXUnc**2)
+        vyUnc = np.sqrt(self.startYUnc**2 + self.endYUnc**2)
+
+        lengthSqr = vx*vx + vy*vy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            unc = np.abs(vy/lengthSqr)*vxUnc + np.abs(vx/lengthSqr)*vyUnc
+        return np.arctan2(vy, vx), unc
+
+#_______________________________________________________________________________
+    @property
+    def midpoints(self):
+        """ The midpoints of the line segments as a tuple of (x, y, xUnc, yUnc) arrays. """
+        return (
+            0.5*(self.startX + self.endX),
+            0.5*(self.startY + self.endY),
+            0.5*(self.startXUnc + self.endXUnc),
+            0.5*(self.startYUnc + self.endYUnc) )
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    @classmethod
+    def fromLineSegments(cls, lines):
+        """ Creates a LineSegmentArray from a list of LineSegment2D instances. """
+        return cls(
+            startX=[l.start.x for l in lines],
+            startY=[l.start.y for l in lines],
+            endX=[l.end.x for l in lines],
+            endY=[l.end.y for l in lines],
+            startXUnc=[l.start.xUnc for l in lines],
+            startYUnc=[l.start.yUnc for l in lines],
+            endXUnc=[l.end.xUnc for l in lines],
+            endYUnc=[l.end.yUnc for l in lines])
+
+#_______________________________________________________________________________
+    @classmethod
+    def fromPositions(cls, positions):
+        """ Creates a LineSegmentArray of the segments connecting each of the PositionValue2D
+            instances in the positions list to the one that follows it, e.g. the stride lines of a
+            track series. """
+
+        x = np.array([p.x for p in positions], dtype=np.float64)
+        y = np.array([p.y for p in positions], dtype=np.float64)
+        xUnc = np.array([p.xUnc for p in positions], dtype=np.float64)
+        yUnc = np.array([p.yUnc for p in positions], dtype=np.float64)
+
+        return cls(
+            startX=x[:-1], startY=y[:-1], endX=x[1:], endY=y[1:],
+            startXUnc=xUnc[:-1], startYUnc=yUnc[:-1], endXUnc=xUnc[1:], endYUnc=yUnc[1:])
+
+#_______________________________________________________________________________
+    def getLineSegment(self, index):
+        """ Returns a LineSegment2D instance for the segment at the specified index. """
+        return LineSegment2D(
+            start=PositionValue2D(
+                x=float(self.startX[index]), y=float(self.startY[index]),
+                xUnc=float(self.startXUnc[index]), yUnc=float(self.startYUnc[index])),
+            end=PositionValue2D(
+                x=float(self.endX[index]), y=float(self.endY[index]),
+                xUnc=float(self.endXUnc[index]), yUnc=float(self.endYUnc[index])) )
+
+#_______________________________________________________________________________
+    def toLineSegments(self):
+        """ Returns a list of LineSegment2D instances for each segment in the array. """
+        return [self.getLineSegment(i) for i in range(self.count)]
+
+#_______________________________________________________________________________
+    def getParametricPositions(self, values, clamp =True):
+        """ Returns the positions at the parametric values along each line segment as a tuple of
+            (x, y, xUnc, yUnc) arrays. The values argument is either a single value or an array
+            with one value per segment. """
+
+        values = np.asarray(values, dtype=np.float64)
+        if clamp:
+            values = np.clip(values, 0.0, 1.0)
+
+        x = self.startX + values*self.deltaX
+        y = self.startY + values*self.deltaY
+        xUnc = np.abs(1.0 - values)*self.startXUnc + np.abs(values)*self.endXUnc
+        yUnc = np.abs(1.0 - values)*self.startYUnc + np.abs(values)*self.endYUnc
+        return x, y, xUnc, yUnc
+
+#_______________________________________________________________________________
+    def distanceToPoints(self, x, y, xUnc =0.0, yUnc =0.0):
+        """ Calculates the smallest distance between each line segment and the specified points,
+            which are either a single point or one point per segment. The result is a tuple of
+            (values, uncertainties) arrays that correspond to LineSegment2D.distanceToPoint().
+            Where the scalar method would fail, because the segment is invalid or the point lies
+            on the line, the result entries are NaN. """
+
+        s_x, s_y, e_x, e_y = self.startX, self.startY, self.endX, self.endY
+        deltaX = self.deltaX
+        deltaY = self.deltaY
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            length = self.lengths[0]
+            B = deltaY*x - deltaX*y - s_x*e_y + e_x*s_y
+            AbsB = np.abs(B)
+
+            distance = np.where(
+                deltaX == 0.0,
+                np.abs(s_x - x),
+                np.where(deltaY == 0.0, np.abs(s_y - y), AbsB/length))
+
+            D = np.sqrt(deltaX*deltaX + deltaY*deltaY)
+            DPrime = 1.0/np.power(deltaX*deltaX + deltaY*deltaY, 1.5)
+            bBD = B/(AbsB*D)
+
+            error = \
+                xUnc*np.abs(deltaY*bBD) \
+                + yUnc*np.abs(deltaX*bBD) \
+                + self.startXUnc*np.abs(AbsB*DPrime + bBD*(y - e_y)) \
+                + self.startYUnc*np.abs(AbsB*DPrime + bBD*(e_x - x)) \
+                + self.endXUnc*np.abs(bBD*(s_y - y) - AbsB*DPrime) \
+                + self.endYUnc*np.abs(bBD*(x - s_x) - AbsB*DPrime)
+
+        invalid = (length == 0.0) | (AbsB == 0.0)
+        distance = np.where(invalid, np.nan, distance)
+        error = np.where(invalid, np.nan, error)
+        return distance, error
+
+#_______________________________________________________________________________
+    def closestPointsOnLines(self, x, y, xUnc =0.0, yUnc =0.0, contained =True):
+        """ Finds the closest point on each line to the specified points, which are either a
+            single point or one point per segment, and returns them as a tuple of (x, y, xUnc,
+            yUnc) arrays. If contained is True, entries for points that do not project within
+            the bounds of their segment are NaN, which corresponds to a None result from
+            LineSegment2D.closestPointOnLine(). Positions are computed by orthogonal projection
+            without the slope-based rotation the scalar method uses for steep lines, so they
+            agree with the scalar results within floating point tolerance. """
+
+        deltaX = self.deltaX
+        deltaY = self.deltaY
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lengthSqr = deltaX*deltaX + deltaY*deltaY
+            t = ((x - self.startX)*deltaX + (y - self.startY)*deltaY)/lengthSqr
+            px = self.startX + t*deltaX
+            py = self.startY + t*deltaY
+
+            length = np.sqrt(lengthSqr)
+            startDist = np.sqrt((px - self.startX)**2 + (py - self.startY)**2)
+            endDist = np.sqrt((px - self.endX)**2 + (py - self.endY)**2)
+
+            pxUnc = startDist/length*self.startXUnc + endDist/length*self.endXUnc
+            pxUnc = np.sqrt(pxUnc**2 + np.square(xUnc))
+            pyUnc = startDist/length*self.startYUnc + endDist/length*self.endYUnc
+            pyUnc = np.sqrt(pyUnc**2 + np.square(yUnc))
+
+        invalid = lengthSqr == 0.0
+        if contained:
+            eps = 1e-8
+            invalid |= \
+                (np.maximum(self.startX, self.endX) < px - eps) \
+                | (px + eps < np.minimum(self.startX, self.endX)) \
+                | (np.maximum(self.startY, self.endY) < py - eps) \
+                | (py + eps < np.minimum(self.startY, self.endY))
+
+        return tuple(np.where(invalid, np.nan, v) for v in [px, py, pxUnc, pyUnc])
+
+#_______________________________________________________________________________
+    def postExtendLines(self, lengthAdjust):
+        """ Extends the end of each line segment by the specified length, which is either a single
+            value or one value per segment, along the direction of the segment. """
+
+        x, y = self._extrapolateByLength(lengthAdjust, pre=False)
+        self.endX = x
+        self.endY = y
+
+#_______________________________________________________________________________
+    def preExtendLines(self, lengthAdjust):
+        """ Extends the start of each line segment backward by the specified length, which is
+            either a single value or one value per segment, along the direction of the segment. """
+
+        x, y = self._extrapolateByLength(lengthAdjust, pre=True)
+        self.startX = x
+        self.startY = y
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _extrapolateByLength(self, lengthAdjust, pre =False):
+        """ Returns the (x, y) arrays for the points offset by lengthAdjust beyond the end, or
+            before the start if pre is True, of each segment. Unlike the iterative search used by
+            LineSegment2D, the offset is applied directly along the unit direction vector. """
+
+        deltaX = self.deltaX
+        deltaY = self.deltaY
+        with np.errstate(divide='ignore', invalid='ignore'):
+            length = np.sqrt(deltaX*deltaX + deltaY*deltaY)
+            ux = deltaX/length
+            uy = deltaY/length
+
+        if pre:
+            return self.startX - lengthAdjust*ux, self.startY - lengthAdjust*uy
+        return self.endX + lengthAdjust*ux, self.endY + lengthAdjust*uy
+
+#_______________________________________________________________________________
+    @classmethod
+    def _distanceBetween(cls, ax, ay, axUnc, ayUnc, bx, by, bxUnc, byUnc):
+        """ Vectorized form of the PositionValue2D.distanceTo() calculation and its uncertainty
+            propagation. """
+
+        xDelta = ax - bx
+        yDelta = ay - by
+        distance = np.sqrt(xDelta*xDelta + yDelta*yDelta)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            error = (np.abs(xDelta)*(axUnc + bxUnc) + np.abs(yDelta)*(ayUnc + byUnc))/distance
+        return distance, np.where(distance == 0.0, 1.0, error)
+
+#===============================================================================
+#                                                                               I N T R I N S I C
+
+#_______________________________________________________________________________
+    def __len__(self):
+        return self.count
+
+#_______________________________________________________________________________
+    def __getitem__(self, index):
+        return self.getLineSegment(index)
+
+#_______________________________________________________________________________
+    def __repr__(self):
+        return self.__str__()
+
+#_______________________________________________________________________________
+    def __str__(self):
+        return '<%s[%s]>' % (self.__class__.__name__, self.count)
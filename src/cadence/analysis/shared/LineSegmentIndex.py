@@ -0,0 +1,194 @@
+# LineSegmentIndex.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import math
+
+#*************************************************************************************************** LineSegmentIndex
+class LineSegmentIndex(object):
+    """ A uniform bounding-box grid over a list of LineSegment2D instances that is used to limit
+        spatial searches, like curve projections, to the segments near a point instead of testing
+        every segment in the list. Results are always returned as indexes into the original
+        segment list in ascending order so that callers can preserve any ordering rules of an
+        equivalent brute-force search. """
+
+#===============================================================================
+#                                                                                       C L A S S
+
+    # Padding added to segment bounds to absorb the tolerances used when testing whether or not
+    # a point is contained within a line segment
+    BOUNDS_PADDING = 1.0e-6
+
+#_______________________________________________________________________________
+    def __init__(self, lines, cellSize =None):
+        """ Creates a new instance of LineSegmentIndex.
+
+            lines :: [LineSegment2D]
+                The line segments to index. The list should not be modified after the index is
+                created.
+
+            [cellSize] :: Number :: None
+                The width and height of each grid cell. If not specified, the mean of the largest
+                bounding box dimension of the segments is used. """
+
+        self._lines  = list(lines)
+        self._bounds = []
+        self._cells  = dict()
+
+        for line in self._lines:
+            s = line.start
+            e = line.end
+            self._bounds.append((
+                min(s.x, e.x), min(s.y, e.y),
+                max(s.x, e.x), max(s.y, e.y) ))
+
+        if self._bounds:
+            self._xMin = min(b[0] for b in self._bounds)
+            self._yMin = min(b[1] for b in self._bounds)
+            self._xMax = max(b[2] for b in self._bounds)
+            self._yMax = max(b[3] for b in self._bounds)
+        else:
+            self._xMin = self._yMin = self._xMax = self._yMax = 0.0
+
+        if not cellSize:
+            sizes = [max(b[2] - b[0], b[3] - b[1]) for b in self._bounds]
+            cellSize = sum(sizes)/len(sizes) if sizes else 1.0
+        self._cellSize = max(float(cellSize), self.BOUNDS_PADDING)
+
+        pad = self.BOUNDS_PADDING
+        for index, b in enumerate(self._bounds):
+            xStart, yStart = self._getCell(b[0] - pad, b[1] - pad)
+            xEnd, yEnd     = self._getCell(b[2] + pad, b[3] + pad)
+            for cx in range(xStart, xEnd + 1):
+                for cy in range(yStart, yEnd + 1):
+                    self._cells.setdefault((cx, cy), []).append(index)
+
+#===============================================================================
+#                                                                                   G E T / S E T
+
+#_______________________________________________________________________________
+    @property
+    def cellSize(self):
+        return self._cellSize
+
+#_______________________________________________________________________________
+    @property
+    def lines(self):
+        return self._lines
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def getCandidates(self, x, y, maxDistance):
+        """ Returns a sorted list of the indexes of every segment whose bounding box lies within
+            the specified distance of the point (x, y). Any segment excluded from the result is
+            guaranteed to be farther than maxDistance from the point. """
+
+        if not self._bounds:
+            return []
+
+        pad = self.BOUNDS_PADDING
+        limit = maxDistance + pad
+
+        xStart, yStart = self._getCell(x - limit, y - limit)
+        xEnd, yEnd     = self._getCell(x + limit, y + limit)
+
+        gxStart, gyStart = self._getCell(self._xMin - pad, self._yMin - pad)
+        gxEnd, gyEnd     = self._getCell(self._xMax + pad, self._yMax + pad)
+
+        xStart = max(xStart, gxStart)
+        yStart = max(yStart, gyStart)
+        xEnd   = min(xEnd, gxEnd)
+        yEnd   = min(yEnd, gyEnd)
+
+        if xEnd < xStart or yEnd < yStart:
+            return []
+
+        if (xEnd - xStart + 1)*(yEnd - yStart + 1) > len(self._bounds):
+            # When the search area covers more cells than there are segments, testing each
+            # segment directly is cheaper than visiting the cells
+            found = range(len(self._bounds))
+        else:
+            found = set()
+            for cx in range(xStart, xEnd + 1):
+                for cy in range(yStart, yEnd + 1):
+                    found.update(self._cells.get((cx, cy), []))
+
+        out = []
+        for index in found:
+            if self.getBoundsDistance(index, x, y) <= limit:
+                out.append(index)
+        out.sort()
+        return out
+
+#_______________________________________________________________________________
+    def getBoundsDistance(self, index, x, y):
+        """ Returns the distance between the point (x, y) and the bounding box of the segment at
+            the specified index, which is zero if the point resides within the bounding box. """
+
+        b = self._bounds[index]
+        dx = max(b[0] - x, 0.0, x - b[2])
+        dy = max(b[1] - y, 0.0, y - b[3])
+        return math.sqrt(dx*dx + dy*dy)
+
+#_______________________________________________________________________________
+    def getMaxDistance(self, x, y):
+        """ Returns the distance from the point (x, y) to the farthest corner of the bounds of all
+            indexed segments. A search with this distance includes every segment. """
+
+        dx = max(abs(x - self._xMin), abs(x - self._xMax))
+        dy = max(abs(y - self._yMin), abs(y - self._yMax))
+        return math.sqrt(dx*dx + dy*dy)
+
+#_______________________________________________________________________________
+    def getNearestVertex(self, x, y):
+        """ Returns the index of the segment whose start point is closest to the point (x, y), or
+            None if the index is empty. Ties are resolved in favor of the lowest index, which
+            matches a linear search over the segments using a strictly less than comparison. """
+
+        if not self._lines:
+            return None
+
+        radius = self._cellSize
+        maxDistance = self.getMaxDistance(x, y)
+        while True:
+            nearest = None
+            distanceTo = None
+            for index in self.getCandidates(x, y, radius):
+                start = self._lines[index].start
+                d = math.sqrt((start.x - x)**2 + (start.y - y)**2)
+                if distanceTo is None or d < distanceTo:
+                    distanceTo = d
+                    nearest = index
+
+            if nearest is not None and distanceTo <= radius:
+                # Every start point outside the search radius is farther away than the result
+                return nearest
+            if radius >= maxDistance:
+                return nearest
+            radius *= 2.0
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _getCell(self, x, y):
+        return int(math.floor(x/self._cellSize)), int(math.floor(y/self._cellSize))
+
+#===============================================================================
+#                                                                               I N T R I N S I C
+
+#_______________________________________________________________________________
+    def __len__(self):
+        return len(self._lines)
+
+#_______________________________________________________________________________
+    def __repr__(self):
+        return self.__str__()
+
+#_______________________________________________________________________________
+    def __str__(self):
+        return '<%s>' % self.__class__.__name__
@@ -0,0 +1,141 @@
+# RollingWeightedStatistics.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import math
+from collections import deque
+
+from pyaid.number.NumericUtils import NumericUtils
+
+#*************************************************************************************************** RollingWeightedStatistics
+class RollingWeightedStatistics(object):
+    """ Computes the uncertainty weighted averages of a window that slides over a series of
+        entries for several window sizes in a single pass over the series. Each entry is pushed
+        once as a tuple of ValueUncertainty instances, such as an angle and a position, and the
+        weighted average of each of those values is returned for every window that ends at that
+        entry.
+
+        Each window keeps running sums of the inverse-variance weights, w = 1/unc^2, and of the
+        weighted values, w*x, of each value position. An entry's terms are added to the sums when
+        it enters a window and subtracted when it leaves, so every push costs the same regardless
+        of the window sizes. A window's sums are recomputed from its entries whenever the weight
+        sum falls well below its largest value since the last recomputation, which would otherwise
+        leave the rounding error of the subtracted terms large relative to the remaining sum. The
+        results equal those of NumericUtils.weightedAverage over each window to within floating
+        point rounding. """
+
+#===============================================================================
+#                                                                                       C L A S S
+
+    # Fraction of a window's largest weight sum below which its sums are recomputed
+    RECOMPUTE_RATIO = 0.5
+
+#_______________________________________________________________________________
+    def __init__(self, windowSizes):
+        """ Creates a new instance of RollingWeightedStatistics.
+
+            windowSizes :: [Integer]
+                The number of entries in each window, in the order their results are returned. """
+
+        self._windowSizes = list(windowSizes)
+        self._entries     = deque(maxlen=max(self._windowSizes) + 1 if self._windowSizes else 0)
+        self._sums        = dict()
+        self._count       = 0
+
+#===============================================================================
+#                                                                                   G E T / S E T
+
+#_______________________________________________________________________________
+    @property
+    def windowSizes(self):
+        return self._windowSizes
+
+#_______________________________________________________________________________
+    @property
+    def count(self):
+        """ The number of entries that have been pushed. """
+        return self._count
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def push(self, *values):
+        """ Adds an entry of ValueUncertainty values to the end of the series and returns a list
+            of (windowSize, averages) tuples, one for each window size with enough entries to
+            be full. The averages are a list of the weighted average of each value position
+            over the entries within that window.
+
+            @return: [(Integer, [ValueUncertainty])] """
+
+        entry = []
+        for value in values:
+            weight = 1.0/(value.rawUncertainty*value.rawUncertainty)
+            entry.append((weight, weight*value.raw))
+
+        self._entries.append(entry)
+        self._count += 1
+
+        out = []
+        for size in self._windowSizes:
+            sums = self._sums.get(size)
+            if sums is None:
+                # The weight sum, weighted value sum and largest weight sum of each value position
+                sums = [[0.0, 0.0, 0.0] for i in range(len(entry))]
+                self._sums[size] = sums
+
+            for i, (weight, weightedValue) in enumerate(entry):
+                sums[i][0] += weight
+                sums[i][1] += weightedValue
+                sums[i][2] = max(sums[i][2], sums[i][0])
+
+            if self._count > size:
+                # Remove the entry that has just left the window
+                leaving = self._entries[-size - 1]
+                for i, (weight, weightedValue) in enumerate(leaving):
+                    sums[i][0] -= weight
+                    sums[i][1] -= weightedValue
+                    if sums[i][0] < self.RECOMPUTE_RATIO*sums[i][2]:
+                        self._recomputeSums(sums[i], i, size)
+
+            if self._count < size:
+                continue
+
+            out.append((size, [
+                NumericUtils.toValueUncertainty(
+                    weightedValue/weight, 1.0/math.sqrt(weight))
+                for weight, weightedValue, peak in sums ]))
+        return out
+
+#_______________________________________________________________________________
+    def clear(self):
+        """ Removes all entries so that a new series can be pushed. """
+        self._entries.clear()
+        self._sums.clear()
+        self._count = 0
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _recomputeSums(self, sums, index, size):
+        """ Replaces the running weight and weighted value sums of the specified value position
+            with sums over the entries currently within the window of the specified size. """
+
+        window = list(self._entries)[-size:]
+        sums[0] = sum(entry[index][0] for entry in window)
+        sums[1] = sum(entry[index][1] for entry in window)
+        sums[2] = sums[0]
+
+#===============================================================================
+#                                                                               I N T R I N S I C
+
+#_______________________________________________________________________________
+    def __repr__(self):
+        return self.__str__()
+
+#_______________________________________________________________________________
+    def __str__(self):
+        return '<%s %s>' % (self.__class__.__name__, self._windowSizes)
@@ -0,0 +1,173 @@
+# PdfReport.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import os
+
+try:
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+except Exception:
+    plt = None
+    PdfPages = None
+
+#*************************************************************************************************** PdfReport
+class PdfReport(object):
+    """ A multi-page PDF file to which plots and figures are written as pages as soon as they are
+        added. The file is opened when the first page is added and kept open until the report is
+        closed, so that a report of many plots does not need a temporary file for each page or a
+        pass to merge those files afterwards.
+
+        Scatter, line and error bar layers within a page that have at least rasterThreshold
+        points are rasterized at the report's dpi, while the axes, labels and sparse layers of the
+        page remain vector graphics. """
+
+#===============================================================================
+#                                                                                       C L A S S
+
+    DEFAULT_RASTER_THRESHOLD = 5000
+
+    DEFAULT_DPI = 150
+
+#_______________________________________________________________________________
+    def __init__(self, path, rasterThreshold =DEFAULT_RASTER_THRESHOLD, dpi =DEFAULT_DPI):
+        """ Creates a new instance of PdfReport.
+
+            [path] :: String
+                Absolute path of the PDF file to write. Any existing file at this path is replaced
+                when the first page is added.
+
+            [rasterThreshold] :: Integer :: DEFAULT_RASTER_THRESHOLD
+                The number of points at which a layer within a page is rasterized. Rasterization is
+                disabled if the threshold is None or less than one.
+
+            [dpi] :: Integer :: DEFAULT_DPI
+                The resolution at which rasterized layers are rendered. """
+
+        self._path            = path
+        self._rasterThreshold = rasterThreshold
+        self._dpi             = dpi
+        self._pages           = None
+        self._count           = 0
+
+#===============================================================================
+#                                                                                   G E T / S E T
+
+#_______________________________________________________________________________
+    @property
+    def path(self):
+        return self._path
+
+#_______________________________________________________________________________
+    @property
+    def count(self):
+        """ The number of pages that have been added to the report. """
+        return self._count
+
+#_______________________________________________________________________________
+    @property
+    def isOpen(self):
+        return self._pages is not None
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def addPlot(self, plot, close =True):
+        """ Creates the figure of the specified PlotBase instance if it has not already been
+            created and adds it to the report as a new page.
+
+            [plot] :: PlotBase
+                The plot to add to the report.
+
+            [close] :: Boolean :: True
+                If true, the plot's figure will be closed once it has been added. """
+
+        if not plot.figure:
+            plot.create()
+
+        self.addFigure(plot.figure)
+        if close:
+            plot.close()
+
+#_______________________________________________________________________________
+    def addPlots(self, plots, close =True):
+        """ Adds each of the specified PlotBase instances to the report in order. """
+        for plot in plots:
+            self.addPlot(plot, close=close)
+
+#_______________________________________________________________________________
+    def addFigure(self, figure =None):
+        """ Adds the specified PyPlot figure to the report as a new page. The figure is not closed.
+
+            [figure] :: Figure :: None
+                The figure to add to the report. If not specified, the current PyPlot figure is
+                added. """
+
+        if figure is None:
+            figure = plt.gcf()
+
+        if self._pages is None:
+            directory = os.path.dirname(self._path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            self._pages = PdfPages(self._path)
+
+        self._rasterizeDenseLayers(figure)
+        self._pages.savefig(figure, dpi=self._dpi)
+        self._count += 1
+
+#_______________________________________________________________________________
+    def close(self):
+        """ Finishes writing the report file if any pages have been added to it. Pages added after
+            the report has been closed are written to a new file at the same path. """
+
+        if self._pages is None:
+            return False
+
+        self._pages.close()
+        self._pages = None
+        return True
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _rasterizeDenseLayers(self, figure):
+        """ Rasterizes the collections and lines within the axes of the specified figure that have
+            at least as many points as the raster threshold. """
+
+        if not self._rasterThreshold or self._rasterThreshold < 1:
+            return
+
+        for axes in figure.get_axes():
+            for collection in axes.collections:
+                # Scatter points are offsets of a collection, while error bars are its paths
+                count = max(len(collection.get_offsets()), len(collection.get_paths()))
+                if count >= self._rasterThreshold:
+                    collection.set_rasterized(True)
+
+            for line in axes.lines:
+                if len(line.get_xdata()) >= self._rasterThreshold:
+                    line.set_rasterized(True)
+
+#===============================================================================
+#                                                                               I N T R I N S I C
+
+#_______________________________________________________________________________
+    def __enter__(self):
+        return self
+
+#_______________________________________________________________________________
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+#_______________________________________________________________________________
+    def __repr__(self):
+        return self.__str__()
+
+#_______________________________________________________________________________
+    def __str__(self):
+        return '<%s %s (%s pages)>' % (self.__class__.__name__, self._path, self._count)
@@ -6,6 +6,7 @@ from __future__ import print_function, absolute_import, unicode_literals, divisi
 
 import os
 
+import numpy as np
 import pandas as pd
 
 from cadence.CadenceEnvironment import CadenceEnvironment
@@ -21,6 +22,10 @@ class KMeansClusterStage(AnalysisStage):
 
     COLORS = ['#CCCCCC', 'red', 'orange', 'green', 'blue', 'purple']
 
+    # When True the uid and cluster columns of the clustered tracks CSV file are cached in a
+    # binary file alongside it, which is memory-mapped instead of parsing the CSV file each run
+    USE_BINARY_CACHE = True
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of KMeansClusterStage."""
@@ -29,14 +34,25 @@ class KMeansClusterStage(AnalysisStage):
             label='Track Priority Report',
             **kwargs)
 
-        self._frame = None
+        self._clusters = None
+        self._unassigned = []
+
+#===============================================================================
+#                                                                                   G E T / S E T
+
+#_______________________________________________________________________________
+    @property
+    def unassignedTracks(self):
+        """ The fingerprints of the analyzed tracks that have no cluster assignment. """
+        return self._unassigned
 
 #===============================================================================
 #                                                                               P R O T E C T E D
 
 #_______________________________________________________________________________
     def _preAnalyze(self):
-        self._frame = None
+        self._clusters = None
+        self._unassigned = []
 
         path = CadenceEnvironment.getPath(
             '..', 'statistics', 'output', 'Clustered-Tracks.csv', isFile=True)
@@ -44,11 +60,55 @@ class KMeansClusterStage(AnalysisStage):
         if not os.path.exists(path):
             return
 
-        self._frame = pd.read_csv(path)
+        data = self._loadClusterData(path)
+
+        # Rows with a missing uid or cluster are left out so that those tracks are reported as
+        # unassigned instead of being coloured as an arbitrary cluster
+        self._clusters = dict()
+        for uid, cluster in zip(data['uid'], data['cluster']):
+            if uid and cluster >= 0:
+                self._clusters[uid] = int(cluster)
+
+#_______________________________________________________________________________
+    def _loadClusterData(self, path):
+        """ Returns a structured array of the uid and cluster columns of the clustered tracks CSV
+            file at the specified path, where a missing cluster has the value -1. When binary
+            caching is enabled, the array is memory-mapped from the cache file, which is
+            regenerated whenever the CSV file is modified.
+
+            @return: numpy.ndarray """
+
+        cachePath = os.path.splitext(path)[0] + '.npy'
+        if self.USE_BINARY_CACHE and os.path.exists(cachePath):
+            if os.path.getmtime(cachePath) >= os.path.getmtime(path):
+                try:
+                    return np.load(cachePath, mmap_mode='r')
+                except Exception as err:
+                    self.logger.writeError(
+                        '[WARNING]: Unable to load cluster cache "%s"' % cachePath, err)
+
+        frame = pd.read_csv(path, usecols=['uid', 'cluster'])
+        uids = frame['uid'].fillna('').astype(str).values
+        clusters = frame['cluster'].fillna(-1).astype(int).values
+
+        # Field names and types must be native strings under Python 2
+        data = np.zeros(len(uids), dtype=[
+            (str('uid'), str('U%s' % max([1] + [len(u) for u in uids]))),
+            (str('cluster'), str('i4'))])
+        data['uid'] = uids
+        data['cluster'] = clusters
+
+        if self.USE_BINARY_CACHE:
+            try:
+                np.save(cachePath, data)
+            except Exception as err:
+                self.logger.writeError(
+                    '[WARNING]: Unable to write cluster cache "%s"' % cachePath, err)
+        return data
 
 #_______________________________________________________________________________
     def _analyzeSitemap(self, sitemap):
-        if self._frame is None:
+        if self._clusters is None:
             return
 
         self._createDrawing(sitemap, 'TRACK-CLUSTERS', 'Track-Clusters')
@@ -57,14 +117,34 @@ class KMeansClusterStage(AnalysisStage):
 
 #_______________________________________________________________________________
     def _analyzeTrack(self, track, series, trackway, sitemap):
-        color = self.COLORS[0]
-        try:
-            data = self._frame.loc[self._frame['uid'] == track.uid]
-            color = self.COLORS[int(data.cluster)]
-        except Exception:
-            color = self.COLORS[0]
+        cluster = self._clusters.get(track.uid)
+        if cluster is None or cluster >= len(self.COLORS):
+            self._unassigned.append(track.fingerprint)
+            cluster = 0
 
         sitemap.cache.get('drawing').circle(
-            track.positionValue.toMayaTuple(), 5, stroke='none', fill=color, fill_opacity='0.5')
+            track.positionValue.toMayaTuple(),
+            5,
+            stroke='none',
+            fill=self.COLORS[cluster],
+            fill_opacity='0.5')
+
+#_______________________________________________________________________________
+    def _postAnalyze(self):
+        if self._clusters is None:
+            self.logger.write('[WARNING]: No clustered tracks file found. Skipping stage.')
+            return
 
+        if self._unassigned:
+            self.logger.write([
+                '[WARNING]: %s tracks have no cluster assignment' % len(self._unassigned),
+                '  * %s' % ', '.join(self._unassigned[:20]) + (
+                    ', ...' if len(self._unassigned) > 20 else '')])
 
+#_______________________________________________________________________________
+    def _getFooterArgs(self):
+        if self._clusters is None:
+            return []
+        return [
+            '%s clustered tracks loaded' % len(self._clusters),
+            '%s tracks with no cluster assignment' % len(self._unassigned)]
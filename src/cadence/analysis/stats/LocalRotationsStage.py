@@ -19,6 +19,8 @@ from cadence.enums.ImportFlagsEnum import ImportFlagsEnum
 class LocalRotationsStage(CurveOrderedAnalysisStage):
     """A class for..."""
 
+    INCREMENTAL = True
+
     #___________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of LocalRotationsStage."""
@@ -26,10 +28,12 @@ class LocalRotationsStage(CurveOrderedAnalysisStage):
             key, owner, label='Local Rotation', **kwargs)
 
         self._csv = None
+        self._rows = []
 
 
     #___________________________________________________________________________
     def _preAnalyze(self):
+        self._rows = []
         self._csv = CsvWriter(
             path=self.getPath('Local_Rotations.csv'),
             autoIndexFieldName='index',
@@ -43,6 +47,21 @@ class LocalRotationsStage(CurveOrderedAnalysisStage):
             ]
         )
 
+    #___________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        return self._rows
+
+    #___________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        for row in result:
+            self._addRow(row)
+
+    #___________________________________________________________________________
+    def _addRow(self, row):
+        """ Adds the row to the CSV file and the rows returned as the sitemap result """
+        self._rows.append(row)
+        self._csv.createRow(**row)
+
     #___________________________________________________________________________
     def _analyzeTrackSeries(self, series, trackway, sitemap):
         if len(series.tracks) < 2:
@@ -78,13 +97,13 @@ class LocalRotationsStage(CurveOrderedAnalysisStage):
                 difference = ''
                 deviation = ''
 
-            self._csv.createRow(
+            self._addRow(dict(
                 uid=prev_track.uid,
                 fingerprint=prev_track.fingerprint,
                 difference=difference,
                 deviation=deviation,
                 localRotation=round(local_angle.degrees),
-                measuredRotation=measuredRotation)
+                measuredRotation=measuredRotation))
             prev_track = track
 
     #___________________________________________________________________________
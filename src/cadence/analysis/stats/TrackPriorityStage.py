@@ -15,6 +15,8 @@ class TrackPriorityStage(AnalysisStage):
 #===============================================================================
 #                                                                                       C L A S S
 
+    INCREMENTAL = True
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of TrackPriorityStage."""
@@ -45,6 +47,15 @@ class TrackPriorityStage(AnalysisStage):
             ('outlined', 'Outlined') )
         self._csv = csv
 
+#_______________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        return self._csv.rows
+
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        for row in result:
+            self._csv.addRow(row)
+
 #_______________________________________________________________________________
     def _analyzeTrack(self, track, series, trackway, sitemap):
 
@@ -22,6 +22,14 @@ class TrackwayStatsStage(AnalysisStage):
     TRACKWAY_STATS_CSV = 'Trackway-Stats.csv'
     UNWEIGHTED_TRACKWAY_STATS_CSV = 'Unweighted-Trackway-Stats.csv'
 
+    INCREMENTAL = True
+
+    ANALYSIS_INPUTS = {
+        'trackway':['curveLength'],
+        'track':[
+            'strideLength', 'strideLengthUnc', 'paceLength', 'paceLengthUnc', 'simpleGauge',
+            'simpleGaugeUnc']}
+
     #___________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of TrackwayStatsStage."""
@@ -35,14 +43,26 @@ class TrackwayStatsStage(AnalysisStage):
         self._unweightedStats = None
         self._quartileStats = dict()
         self._densityPlots = dict()
+        self._flushCount = None
 
     #===========================================================================
     #                                                         P R O T E C T E D
 
     #___________________________________________________________________________
     def _preAnalyze(self):
+        self._preAnalyzeSitemapTask()
+        self._flushCount = CsvWriter.DEFAULT_FLUSH_COUNT
+        self._weightedStats.flushCount = self._flushCount
+        self._unweightedStats.flushCount = self._flushCount
+
+    #___________________________________________________________________________
+    def _preAnalyzeSitemapTask(self):
+        """ Initializes the stage without flushing CSV writers, which would change the shared
+            output files. """
         self._trackways = []
+        self._quartileStats = dict()
         self._densityPlots = dict()
+        self._flushCount = None
 
         fields = [
             ('name', 'Name'),
@@ -80,9 +100,36 @@ class TrackwayStatsStage(AnalysisStage):
         self._unweightedStats = csv
 
     #___________________________________________________________________________
-    def _addQuartileEntry(self, label, trackway, data):
-        if not data or len(data) < 4:
-            return
+    def _getSitemapResult(self, sitemap):
+        return {
+            'weighted':self._weightedStats.rows,
+            'unweighted':self._unweightedStats.rows,
+            'quartiles':[
+                (label, csv.rows) for label, csv in DictUtils.iter(self._quartileStats)],
+            'densityPlots':[
+                (label, self._readFiles(paths))
+                for label, paths in DictUtils.iter(self._densityPlots)] }
+
+    #___________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        for row in result['weighted']:
+            self._weightedStats.addRow(row)
+        for row in result['unweighted']:
+            self._unweightedStats.addRow(row)
+
+        for label, rows in result['quartiles']:
+            csv = self._getQuartileCsv(label)
+            for row in rows:
+                csv.addRow(row)
+
+        for label, contents in result['densityPlots']:
+            self._densityPlots.setdefault(label, []).extend(
+                self._createTempFiles(contents, extension='pdf'))
+
+    #___________________________________________________________________________
+    def _getQuartileCsv(self, label):
+        """ Returns the quartile CsvWriter for the specified label, creating it if it does not
+            already exist. """
 
         if label not in self._quartileStats:
             csv = CsvWriter()
@@ -90,6 +137,7 @@ class TrackwayStatsStage(AnalysisStage):
                 '%s-Quartiles.csv' % label.replace(' ', '-'),
                 isFile=True)
             csv.autoIndexFieldName = 'Index'
+            csv.flushCount = self._flushCount
             csv.addFields(
                 ('name', 'Name'),
 
@@ -115,7 +163,14 @@ class TrackwayStatsStage(AnalysisStage):
                 ('diffUpperBound', 'Diff Upper Bound') )
             self._quartileStats[label] = csv
 
-        csv = self._quartileStats[label]
+        return self._quartileStats[label]
+
+    #___________________________________________________________________________
+    def _addQuartileEntry(self, label, trackway, data):
+        if not data or len(data) < 4:
+            return
+
+        csv = self._getQuartileCsv(label)
         dd = mstats.density.Distribution(data)
         unweighted = mstats.density.boundaries.unweighted_two(dd)
         weighted = mstats.density.boundaries.weighted_two(dd)
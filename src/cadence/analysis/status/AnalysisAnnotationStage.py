@@ -15,6 +15,10 @@ class AnalysisAnnotationStage(AnalysisStage):
 #===============================================================================
 #                                                                   C L A S S
 
+    INCREMENTAL = True
+
+    ANALYSIS_OUTPUTS = {'track':['trackwayIndex', 'trackwayName']}
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of OriginCheckStage."""
@@ -16,6 +16,8 @@ class OriginCheckStage(AnalysisStage):
 #===============================================================================
 #                                                                                       C L A S S
 
+    INCREMENTAL = True
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of OriginCheckStage."""
@@ -42,14 +44,25 @@ class OriginCheckStage(AnalysisStage):
             ('fingerprint', 'Fingerprint') )
         self._csv = csv
 
+#_______________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        return {'rows':self._csv.rows}
+
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        for row in result['rows']:
+            self._tracks.append(row)
+            self._csv.addRow(row)
+
 #_______________________________________________________________________________
     def _analyzeTrack(self, track, series, trackway, sitemap):
         if NumericUtils.equivalent(track.x, 0.0) and NumericUtils.equivalent(track.z, 0.0):
-            self._tracks.append(track)
-            self._csv.addRow({'uid':track.uid, 'fingerprint':track.fingerprint})
+            row = {'uid':track.uid, 'fingerprint':track.fingerprint}
+            self._tracks.append(row)
+            self._csv.addRow(row)
 
 #_______________________________________________________________________________
     def _postAnalyze(self):
         self.logger.write('ORIGIN TRACK COUNT: %s' % len(self._tracks))
         for t in self._tracks:
-            self.logger.write(' * %s (%s)' % (t.fingerprint, t.uid))
+            self.logger.write(' * %s (%s)' % (t['fingerprint'], t['uid']))
@@ -20,6 +20,8 @@ class RotationalUncertaintyStage(AnalysisStage):
 
     DRAWING_FOLDER_NAME = 'Rotational-Unc-Maps'
 
+    INCREMENTAL = True
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of RotationalUncertaintyStage."""
@@ -51,6 +53,21 @@ class RotationalUncertaintyStage(AnalysisStage):
             ('rotation', 'Rotation') )
         self._largeUncCsv = csv
 
+#_______________________________________________________________________________
+    def _preAnalyzeSitemapTask(self):
+        self._uncs   = []
+        self._tracks = []
+
+#_______________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        return {'tracks':[t.uid for t in self._tracks], 'uncs':self._uncs}
+
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        tracks = self._getSitemapTracksByUid(sitemap)
+        self._tracks.extend([tracks[uid] for uid in result['tracks']])
+        self._uncs.extend(result['uncs'])
+
 #_______________________________________________________________________________
     def _analyzeTrack(self, track, series, trackway, sitemap):
         self._tracks.append(track)
@@ -99,7 +116,8 @@ class RotationalUncertaintyStage(AnalysisStage):
 
                 fileName = '%s-%s-ROTATION_UNC.svg' % (sitemap.name, sitemap.level)
                 path = self.getPath(self.DRAWING_FOLDER_NAME, fileName, isFile=True)
-                drawing = CadenceDrawing(path, sitemap)
+                drawing = CadenceDrawing(
+                    path, sitemap, renderService=self.owner.renderService, streaming=True)
 
                 # create a group to be instanced for the spreadsheet values
                 drawing.createGroup('rect1')
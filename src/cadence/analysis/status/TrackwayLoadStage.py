@@ -17,6 +17,8 @@ class TrackwayLoadStage(AnalysisStage):
 #===============================================================================
 #                                                                                       C L A S S
 
+    INCREMENTAL = True
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of TrackwayLoadStage."""
@@ -36,19 +38,31 @@ class TrackwayLoadStage(AnalysisStage):
         self._unprocessedCsv    = None
         self._soloTrackCsv      = None
         self._allTracks         = None
+        self._sitemapTrackUids  = []
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def getIncrementalInputs(self):
+        """ The track listing created in _preAnalyze() includes every track in the database,
+            not only the tracks within the analyzed sitemaps. """
+
+        model = Tracks_Track.MASTER
+        session = model.createSession()
+        try:
+            return [
+                [t.i, t.uid, t.fingerprint, t.hidden, t.next, t.year, t.isComplete]
+                for t in session.query(model).order_by(model.i).all() ]
+        finally:
+            session.close()
 
 #===============================================================================
 #                                                                               P R O T E C T E D
 
 #_______________________________________________________________________________
     def _preAnalyze(self):
-        csv = CsvWriter()
-        csv.path = self.getPath('Solo-Track-Report.csv')
-        csv.autoIndexFieldName = 'Index'
-        csv.addFields(
-            ('uid', 'UID'),
-            ('fingerprint', 'Fingerprint') )
-        self._soloTrackCsv = csv
+        self._preAnalyzeSitemapTask()
 
         csv = CsvWriter()
         csv.path = self.getPath('Corrupt-Track-Report.csv')
@@ -62,24 +76,60 @@ class TrackwayLoadStage(AnalysisStage):
         self._badTrackCsv = csv
 
         csv = CsvWriter()
-        csv.path = self.getPath('Unprocessed-Track-Report.csv')
+        csv.path = self.getPath('Unknown-Track-Report.csv')
         csv.autoIndexFieldName = 'Index'
         csv.addFields(
             ('uid', 'UID'),
             ('fingerprint', 'Fingerprint'),
-            ('previous', 'Previous Track UID'),
-            ('next', 'Next Track UID') )
-        self._unprocessedCsv = csv
+            ('hidden', 'Hidden'),
+            ('complete', 'Complete') )
+        self._unknownCsv = csv
+
+        self._allTracks = dict()
+
+        #-------------------------------------------------------------------------------------------
+        # CREATE ALL TRACK LISTING
+        #       This list is used to find tracks that are not referenced by relationships to
+        #       sitemaps, which would never be loaded by standard analysis methods
+        model = Tracks_Track.MASTER
+        session = model.createSession()
+        tracks = session.query(model).all()
+        for t in tracks:
+            self._checkTrackProperties(t, tracks)
+            self._allTracks[t.uid] = dict(
+                uid=t.uid,
+                fingerprint=t.fingerprint,
+                hidden=t.hidden,
+                complete=t.isComplete)
+        session.close()
+
+#_______________________________________________________________________________
+    def _preAnalyzeSitemapTask(self):
+        """ Creates the reports with rows for each sitemap, leaving the database-wide track
+            listing to _preAnalyze(). """
+
+        self.count              = 0
+        self.ignoredCount       = 0
+        self.incompleteCount    = 0
+        self._sitemapTrackUids  = []
 
         csv = CsvWriter()
-        csv.path = self.getPath('Unknown-Track-Report.csv')
+        csv.path = self.getPath('Solo-Track-Report.csv')
+        csv.autoIndexFieldName = 'Index'
+        csv.addFields(
+            ('uid', 'UID'),
+            ('fingerprint', 'Fingerprint') )
+        self._soloTrackCsv = csv
+
+        csv = CsvWriter()
+        csv.path = self.getPath('Unprocessed-Track-Report.csv')
         csv.autoIndexFieldName = 'Index'
         csv.addFields(
             ('uid', 'UID'),
             ('fingerprint', 'Fingerprint'),
-            ('hidden', 'Hidden'),
-            ('complete', 'Complete') )
-        self._unknownCsv = csv
+            ('previous', 'Previous Track UID'),
+            ('next', 'Next Track UID') )
+        self._unprocessedCsv = csv
 
         csv = CsvWriter()
         csv.path = self.getPath('Ignored-Track-Report.csv')
@@ -119,23 +169,35 @@ class TrackwayLoadStage(AnalysisStage):
             ('complete', 'Completion (%)') )
         self._trackwayCsv = csv
 
-        self._allTracks = dict()
+#_______________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        return {
+            'count':self.count,
+            'ignoredCount':self.ignoredCount,
+            'incompleteCount':self.incompleteCount,
+            'trackUids':self._sitemapTrackUids,
+            'rows':dict((name, csv.rows) for name, csv in self._getSitemapCsvs().items()) }
 
-        #-------------------------------------------------------------------------------------------
-        # CREATE ALL TRACK LISTING
-        #       This list is used to find tracks that are not referenced by relationships to
-        #       sitemaps, which would never be loaded by standard analysis methods
-        model = Tracks_Track.MASTER
-        session = model.createSession()
-        tracks = session.query(model).all()
-        for t in tracks:
-            self._checkTrackProperties(t, tracks)
-            self._allTracks[t.uid] = dict(
-                uid=t.uid,
-                fingerprint=t.fingerprint,
-                hidden=t.hidden,
-                complete=t.isComplete)
-        session.close()
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        self.count           += result['count']
+        self.ignoredCount    += result['ignoredCount']
+        self.incompleteCount += result['incompleteCount']
+        self._sitemapTrackUids.extend(result['trackUids'])
+
+        for name, csv in self._getSitemapCsvs().items():
+            for row in result['rows'][name]:
+                csv.addRow(row)
+
+#_______________________________________________________________________________
+    def _getSitemapCsvs(self):
+        """ Returns the reports with rows created for each sitemap keyed by name. """
+        return {
+            'solo':self._soloTrackCsv,
+            'orphan':self._orphanCsv,
+            'unprocessed':self._unprocessedCsv,
+            'sitemap':self._sitemapCsv,
+            'trackway':self._trackwayCsv }
 
 #_______________________________________________________________________________
     def _checkTrackProperties(self, track, tracks):
@@ -198,8 +260,7 @@ class TrackwayLoadStage(AnalysisStage):
         processed = []
 
         for t in tracks:
-            if t.uid in self._allTracks:
-                del self._allTracks[t.uid]
+            self._sitemapTrackUids.append(t.uid)
 
             if t.next and t.next == t.uid:
                 self.logger.write([
@@ -326,6 +387,10 @@ class TrackwayLoadStage(AnalysisStage):
         self.logger.write('TOTAL TRACKS: %s + (%s ignored) = %s' % (
             count, ignoreCount, count + ignoreCount))
 
+        # Tracks found within the sitemaps are not unknown
+        for uid in self._sitemapTrackUids:
+            self._allTracks.pop(uid, None)
+
         for uid, data in self._allTracks.items():
             self._unknownCsv.createRow(
                 uid=uid,
@@ -13,7 +13,6 @@ import numpy as np
 
 from pyaid.list.ListUtils import ListUtils
 from pyaid.number.NumericUtils import NumericUtils
-from pyaid.string.StringUtils import StringUtils
 
 from cadence.analysis.AnalysisStage import AnalysisStage
 from cadence.analysis.shared.CsvWriter import CsvWriter
@@ -33,6 +32,14 @@ class PaceLengthStage(AnalysisStage):
 
     MAPS_FOLDER_NAME = 'Pace-Lengths'
 
+    PARALLEL = True
+
+    INCREMENTAL = True
+
+    ANALYSIS_INPUTS = {'track':['curvePosition']}
+
+    ANALYSIS_OUTPUTS = {'track':['paceLength', 'paceLengthUnc']}
+
     #___________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of PaceLengthStage."""
@@ -46,7 +53,6 @@ class PaceLengthStage(AnalysisStage):
         self.ignored = 0
         self.entries = []
 
-        self._paths     = []
         self._csv       = None
         self._errorCsv  = None
 
@@ -56,11 +62,19 @@ class PaceLengthStage(AnalysisStage):
     #___________________________________________________________________________
     def _preAnalyze(self):
         """_preDeviations doc..."""
+        self.initializeFolder(self.MAPS_FOLDER_NAME)
+        self._preAnalyzeSitemapTask()
+        self._csv.flushCount = CsvWriter.DEFAULT_FLUSH_COUNT
+        self._errorCsv.flushCount = CsvWriter.DEFAULT_FLUSH_COUNT
+
+    #___________________________________________________________________________
+    def _preAnalyzeSitemapTask(self):
+        """ Initializes the stage without the maps folder or flushing CSV writers, which would
+            change the shared outputs. """
         self.noData = 0
+        self.count = 0
+        self.ignored = 0
         self.entries = []
-        self._paths = []
-
-        self.initializeFolder(self.MAPS_FOLDER_NAME)
 
         csv = CsvWriter()
         csv.path = self.getPath('Pace-Length-Deviations.csv', isFile=True)
@@ -94,14 +108,65 @@ class PaceLengthStage(AnalysisStage):
                 self.MAPS_FOLDER_NAME,
                 '%s-%s-PACE.svg' % (sitemap.name, sitemap.level),
                 isFile=True),
-            sitemap)
+            sitemap,
+            renderService=self.owner.renderService)
 
         drawing.grid()
         drawing.federalCoordinates()
         sitemap.cache.set('drawing', drawing)
 
+        start = len(self.entries)
         super(PaceLengthStage, self)._analyzeSitemap(sitemap)
 
+        for entry in self.entries[start:]:
+            drawFunc = entry.pop('drawFunc')
+            if 'measured' not in entry:
+                continue
+            if entry['deviation'] > 2.0:
+                drawFunc('red')
+            else:
+                drawFunc('black' if abs(entry['deviation']) < 2.0 else '#FFAAAA')
+
+        # Remove drawing from the sitemap cache and save the drawing file
+        try:
+            sitemap.cache.extract('drawing').save()
+        except Exception:
+            self.logger.write('[WARNING]: No sitemap saved for %s-%s' % (
+                sitemap.name, sitemap.level))
+
+    #___________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        entries = []
+        for entry in self.entries:
+            entry = dict(entry)
+            entry['trackUid'] = entry.pop('track').uid
+            entry['pairTrackUid'] = entry.pop('pairTrack').uid
+            entries.append(entry)
+
+        return {
+            'entries':entries,
+            'noData':self.noData,
+            'count':self.count,
+            'ignored':self.ignored,
+            'errorRows':self._errorCsv.rows }
+
+    #___________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        self.noData += result['noData']
+        self.count += result['count']
+        self.ignored += result['ignored']
+        for row in result['errorRows']:
+            self._errorCsv.addRow(row)
+
+        tracks = self._getSitemapTracksByUid(sitemap)
+        for entry in result['entries']:
+            entry = dict(entry)
+            track = tracks[entry.pop('trackUid')]
+            entry['track'] = track
+            entry['pairTrack'] = tracks[entry.pop('pairTrackUid')]
+            self.entries.append(entry)
+            track.cache.set('paceData', entry)
+
     #___________________________________________________________________________
     def _analyzeTrackway(self, trackway, sitemap):
         bundle = self.owner.getSeriesBundle(trackway)
@@ -333,14 +398,10 @@ class PaceLengthStage(AnalysisStage):
     #___________________________________________________________________________
     def _postAnalyze(self):
         """_postAnalyze doc..."""
-        self._paths = []
-
         self.logger.write(
             '%s\nFRACTIONAL ERROR (Measured vs Entered)' % ('='*80))
         self._process()
 
-        self.mergePdfs(self._paths)
-
     #___________________________________________________________________________
     def _getFooterArgs(self):
         return [
@@ -361,41 +422,36 @@ class PaceLengthStage(AnalysisStage):
 
         label = 'Fractional Pace Errors'
         d     = errors
-        self._paths.append(self._makePlot(
+        self._makePlot(
             label=label,
             data=d,
-            histRange=(-1.0, 1.0)))
-        self._paths.append(self._makePlot(
+            histRange=(-1.0, 1.0))
+        self._makePlot(
             label=label,
             data=d,
             isLog=True,
-            histRange=(-1.0, 1.0)))
+            histRange=(-1.0, 1.0))
 
         # noinspection PyUnresolvedReferences
         d = np.absolute(np.array(d))
-        self._paths.append(self._makePlot(
+        self._makePlot(
             label='Absolute %s' % label,
             data=d,
-            histRange=(0.0, 1.0) ))
-        self._paths.append(self._makePlot(
+            histRange=(0.0, 1.0) )
+        self._makePlot(
             label='Absolute %s' % label,
             data=d,
             isLog=True,
-            histRange=(0.0, 1.0) ))
+            histRange=(0.0, 1.0) )
 
         highDeviationCount = 0
 
         for entry in self.entries:
             if 'measured' not in entry:
-                # entry['drawFunc']('purple')
                 continue
 
             if entry['deviation'] > 2.0:
-                entry['drawFunc']('red')
                 highDeviationCount += 1
-            else:
-                entry['drawFunc'](
-                    'black' if abs(entry['deviation']) < 2.0 else '#FFAAAA')
 
             track = entry['track']
             delta = NumericUtils.roundToSigFigs(100.0*abs(entry['delta']), 3)
@@ -418,14 +474,6 @@ class PaceLengthStage(AnalysisStage):
                 'pairedUid':pairedUid,
                 'pairedFingerprint':pairedFingerprint})
 
-        for sitemap in self.owner.getSitemaps():
-            # Remove drawing from the sitemap cache and save the drawing file
-            try:
-                sitemap.cache.extract('drawing').save()
-            except Exception:
-                self.logger.write('[WARNING]: No sitemap saved for %s-%s' % (
-                    sitemap.name, sitemap.level))
-
         if not self._csv.save():
             self.logger.write(
                 '[ERROR]: Failed to save CSV file %s' % self._csv.path)
@@ -467,10 +515,7 @@ class PaceLengthStage(AnalysisStage):
         xlims = axis.get_xlim()
         pl.xlim((max(histRange[0], xlims[0]), min(histRange[1], xlims[1])))
 
-        path = self.getTempPath(
-            '%s.pdf' % StringUtils.getRandomString(16),
-            isFile=True)
-        self.owner.saveFigure('makePlot', path)
-        return path
+        self.getReport().addFigure()
+        self.owner.closeFigure('makePlot')
 
 
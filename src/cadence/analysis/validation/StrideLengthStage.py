@@ -10,7 +10,6 @@ import math
 
 import numpy as np
 from pyaid.number.NumericUtils import NumericUtils
-from pyaid.string.StringUtils import StringUtils
 
 from cadence.analysis.AnalysisStage import AnalysisStage
 from cadence.analysis.shared.CsvWriter import CsvWriter
@@ -32,6 +31,12 @@ class StrideLengthStage(AnalysisStage):
 
     MAPS_FOLDER_NAME = 'Stride-Lengths'
 
+    PARALLEL = True
+
+    INCREMENTAL = True
+
+    ANALYSIS_OUTPUTS = {'track':['strideLength', 'strideLengthUnc']}
+
     #___________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of StrideLengthStage."""
@@ -39,7 +44,6 @@ class StrideLengthStage(AnalysisStage):
             key, owner,
             label='Stride Length',
             **kwargs)
-        self._paths  = []
         self._csv    = None
         self.noData  = 0
         self.entries = []
@@ -52,7 +56,6 @@ class StrideLengthStage(AnalysisStage):
         """_preDeviations doc..."""
         self.noData = 0
         self.entries = []
-        self._paths = []
 
         csv = CsvWriter()
         csv.path = self.getPath('Stride-Length-Deviations.csv', isFile=True)
@@ -74,7 +77,8 @@ class StrideLengthStage(AnalysisStage):
                 self.MAPS_FOLDER_NAME,
                 '%s-%s-STRIDE.svg' % (sitemap.name, sitemap.level),
                 isFile=True),
-            sitemap)
+            sitemap,
+            renderService=self.owner.renderService)
 
         drawing.grid()
         drawing.federalCoordinates()
@@ -88,6 +92,27 @@ class StrideLengthStage(AnalysisStage):
             self.logger.write('[WARNING]: No sitemap saved for %s-%s' % (
                 sitemap.name, sitemap.level))
 
+    #___________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        entries = []
+        for entry in self.entries:
+            entry = dict(entry)
+            entry['trackUid'] = entry.pop('track').uid
+            entries.append(entry)
+        return {'entries':entries, 'noData':self.noData}
+
+    #___________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        self.noData += result['noData']
+
+        tracks = self._getSitemapTracksByUid(sitemap)
+        for entry in result['entries']:
+            entry = dict(entry)
+            track = tracks[entry.pop('trackUid')]
+            entry['track'] = track
+            self.entries.append(entry)
+            track.cache.set('strideData', entry)
+
     #___________________________________________________________________________
     def _analyzeTrackSeries(self, series, trackway, sitemap):
 
@@ -195,14 +220,10 @@ class StrideLengthStage(AnalysisStage):
     #___________________________________________________________________________
     def _postAnalyze(self):
         """_postAnalyze doc..."""
-        self._paths = []
-
         self.logger.write(
             '%s\nFRACTIONAL ERROR (Measured vs Entered)' % ('='*80))
         self._process()
 
-        self.mergePdfs(self._paths)
-
     #___________________________________________________________________________
     def _getFooterArgs(self):
         return [
@@ -222,26 +243,26 @@ class StrideLengthStage(AnalysisStage):
         self.logger.write('Fractional Stride Error %s' % res.label)
 
         label = 'Fractional Stride Errors'
-        self._paths.append(self._makePlot(
+        self._makePlot(
             label=label,
             data=errors,
-            histRange=(-1.0, 1.0) ))
-        self._paths.append(self._makePlot(
+            histRange=(-1.0, 1.0) )
+        self._makePlot(
             label=label,
             data=errors,
             isLog=True,
-            histRange=(-1.0, 1.0) ))
+            histRange=(-1.0, 1.0) )
 
         # noinspection PyUnresolvedReferences
         d = np.absolute(np.array(errors))
-        self._paths.append(self._makePlot(
+        self._makePlot(
             label='Absolute %s' % label,
-            data=d, histRange=(0.0, 1.0) ))
-        self._paths.append(self._makePlot(
+            data=d, histRange=(0.0, 1.0) )
+        self._makePlot(
             label='Absolute %s' % label,
             data=d,
             isLog=True,
-            histRange=(0.0, 1.0) ))
+            histRange=(0.0, 1.0) )
 
         highDeviationCount = 0
 
@@ -303,10 +324,8 @@ class StrideLengthStage(AnalysisStage):
         xlims = axis.get_xlim()
         pl.xlim((max(histRange[0], xlims[0]), min(histRange[1], xlims[1])))
 
-        path = self.getTempPath(
-            '%s.pdf' % StringUtils.getRandomString(16), isFile=True)
-        self.owner.saveFigure('makePlot', path)
-        return path
+        self.getReport().addFigure()
+        self.owner.closeFigure('makePlot')
 
     #___________________________________________________________________________
     @classmethod
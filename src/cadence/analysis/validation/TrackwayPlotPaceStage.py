@@ -16,6 +16,10 @@ class TrackwayPlotPaceStage(AnalysisStage):
 #===============================================================================
 #                                                                                       C L A S S
 
+    INCREMENTAL = True
+
+    ANALYSIS_INPUTS = {'track':['curvePosition']}
+
 #_______________________________________________________________________________
     def __init__(self, key, owner, **kwargs):
         """Creates a new instance of TrackwayPlotPaceStage."""
@@ -28,6 +32,14 @@ class TrackwayPlotPaceStage(AnalysisStage):
 #===============================================================================
 #                                                                               P R O T E C T E D
 
+#_______________________________________________________________________________
+    def _getSitemapResult(self, sitemap):
+        return self._readFiles(self._paths)
+
+#_______________________________________________________________________________
+    def _mergeSitemapResult(self, sitemap, result):
+        self._paths.extend(self._createTempFiles(result, extension='pdf'))
+
 #_______________________________________________________________________________
     def _analyzeTrackway(self, trackway, sitemap):
         pl = self.plot
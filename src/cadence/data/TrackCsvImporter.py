@@ -18,6 +18,7 @@ from pyaid.string.StringUtils import StringUtils
 from cadence.enums.ImportFlagsEnum import ImportFlagsEnum
 from cadence.enums.SnapshotDataEnum import SnapshotDataEnum
 from cadence.enums.TrackCsvColumnEnum import TrackCsvColumnEnum
+from cadence.enums.TrackPropEnum import TrackPropEnum
 from cadence.models.tracks.Tracks_Track import Tracks_Track
 
 
@@ -44,6 +45,15 @@ class TrackCsvImporter(object):
 
         self.fingerprints = dict()
         self.remainingTracks = dict()
+
+        # Indexes of the tracks in the database created by loadExistingTracks(), which replace
+        # the per-row searches for existing and remaining tracks during import
+        self._existingTracks  = None
+        self._tracksByUid     = dict()
+        self._remainingUids   = dict()
+        self._uniqueProps     = [
+            enum.name for enum in Reflection.getReflectionList(TrackPropEnum) if enum.unique]
+
         self._logger  = logger
         if not logger:
             self._logger = Logger(self, printOut=True)
@@ -61,9 +71,7 @@ class TrackCsvImporter(object):
         if self._path is None:
             return False
 
-        model = Tracks_Track.MASTER
-        for existingTrack in session.query(model).all():
-            self.remainingTracks[existingTrack.uid] = existingTrack.fingerprint
+        self.loadExistingTracks(session)
 
         try:
             data = pd.read_csv(self._path)
@@ -78,39 +86,7 @@ class TrackCsvImporter(object):
                 'message':'ERROR: Failed to create CSV reader for file "%s"' % self._path })
             return
 
-        for index, row in data.iterrows():
-            # Skip any rows that don't start with the proper numeric index value, which
-            # includes the header row (if it exists) with the column names
-            try:
-                index = int(row[0])
-            except Exception:
-                continue
-
-            rowDict = dict()
-            for column in Reflection.getReflectionList(TrackCsvColumnEnum):
-                value = row[column.index]
-
-                if value and StringUtils.isStringType(value) and not StringUtils.isTextType(value):
-                    # Try to decode the value into a unicode string using common codecs
-                    for codec in ['utf8', 'MacRoman', 'utf16']:
-                        try:
-                            decodedValue = value.decode(codec)
-                            if decodedValue:
-                                value = decodedValue
-                                break
-                        except Exception:
-                            continue
-
-                try:
-                    # Check to see if the value is NaN, and if it is replace it with an empty
-                    # string to be ignored during import
-                    value = '' if np.isnan(value) else value
-                except Exception:
-                    pass
-
-                if value != '' or value is None:
-                    rowDict[column.name] = value
-
+        for rowDict in self._getRecords(data):
             self.fromSpreadsheetEntry(rowDict, session)
 
         for uid, fingerprint in DictUtils.iter(self.remainingTracks):
@@ -119,7 +95,7 @@ class TrackCsvImporter(object):
             # it is ignored. Otherwise, the track is deleted from the database as a track that no
             # longer exists.
 
-            track = Tracks_Track.MASTER.getByUid(uid, session)
+            track = self._tracksByUid[uid]
             if track.custom:
                 continue
 
@@ -134,6 +110,29 @@ class TrackCsvImporter(object):
 
         return True
 
+#_______________________________________________________________________________
+    def loadExistingTracks(self, session):
+        """ Loads every track in the database with a single query and indexes them by their
+            uniquely identifying properties and fingerprints. Once loaded, the
+            fromSpreadsheetEntry() method matches rows against these indexes instead of
+            querying the database for each row. """
+
+        self.remainingTracks = dict()
+        self._existingTracks = dict()
+        self._tracksByUid    = dict()
+        self._remainingUids  = dict()
+
+        model = Tracks_Track.MASTER
+        for existingTrack in session.query(model).all():
+            fingerprint = existingTrack.fingerprint
+            self.remainingTracks[existingTrack.uid] = fingerprint
+            self._tracksByUid[existingTrack.uid] = existingTrack
+            self._remainingUids.setdefault(fingerprint, []).append(existingTrack.uid)
+
+            # Only the first match is used during import, which is the first track returned by
+            # the query just as with the findExistingTracks() method
+            self._existingTracks.setdefault(self._getUniqueKey(existingTrack), existingTrack)
+
 #_______________________________________________________________________________
     def fromSpreadsheetEntry(self, csvRowData, session):
         """ From the spreadsheet data dictionary representing raw track data, this method creates
@@ -288,18 +287,26 @@ class TrackCsvImporter(object):
         #       Use data set above to attempt to load the track database entry
         fingerprint = t.fingerprint
 
-        for uid, fp in DictUtils.iter(self.remainingTracks):
-            # Remove the fingerprint from the list of fingerprints found in the database, which at
-            # the end will leave only those fingerprints that exist in the database but were not
-            # touched by the importer. These values can be used to identify tracks that should
-            # have been "touched" but were not.
-            if fp == fingerprint:
-                del self.remainingTracks[uid]
-                break
-
-        existing = t.findExistingTracks(session)
-        if existing and not isinstance(existing, Tracks_Track):
-            existing = existing[0]
+        # Remove the fingerprint from the list of fingerprints found in the database, which at
+        # the end will leave only those fingerprints that exist in the database but were not
+        # touched by the importer. These values can be used to identify tracks that should
+        # have been "touched" but were not.
+        if self._existingTracks is None:
+            for uid, fp in DictUtils.iter(self.remainingTracks):
+                if fp == fingerprint:
+                    del self.remainingTracks[uid]
+                    break
+        else:
+            remainingUids = self._remainingUids.get(fingerprint)
+            if remainingUids:
+                del self.remainingTracks[remainingUids.pop(0)]
+
+        if self._existingTracks is None:
+            existing = t.findExistingTracks(session)
+            if existing and not isinstance(existing, Tracks_Track):
+                existing = existing[0]
+        else:
+            existing = self._existingTracks.get(self._getUniqueKey(t))
 
         if fingerprint in self.fingerprints:
             if not existing:
@@ -318,8 +325,13 @@ class TrackCsvImporter(object):
         if existing:
             t = existing
         else:
+            # New tracks are written to the database together by the flush at the end of the
+            # import instead of one at a time
             session.add(t)
-            session.flush()
+            if self._existingTracks is None:
+                session.flush()
+            else:
+                self._existingTracks[self._getUniqueKey(t)] = t
 
         TCCE = TrackCsvColumnEnum
         IFE  = ImportFlagsEnum
@@ -600,6 +612,70 @@ class TrackCsvImporter(object):
         else:
             self._logger.write(result)
 
+#_______________________________________________________________________________
+    @classmethod
+    def _getRecords(cls, data):
+        """ Normalizes the spreadsheet DataFrame one column at a time and returns a list of row
+            dictionaries keyed by TrackCsvColumnEnum names, which omit blank and NaN cells. Rows
+            that don't start with a numeric index value, which includes the header row (if it
+            exists) with the column names, are skipped. """
+
+        indexes = pd.to_numeric(data.iloc[:, 0], errors='coerce')
+        data = data[indexes.notnull().values]
+
+        names   = []
+        columns = []
+        for column in Reflection.getReflectionList(TrackCsvColumnEnum):
+            names.append(column.name)
+            columns.append(cls._getColumnValues(data.iloc[:, column.index]))
+
+        out = []
+        for values in zip(*columns):
+            out.append(dict((n, v) for n, v in zip(names, values) if v != ''))
+        return out
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getColumnValues(cls, series):
+        """ Returns a list of the values in the DataFrame column series where NaN values are
+            replaced with empty strings, to be ignored during import, and byte strings are decoded
+            into unicode strings. """
+
+        values = series.values.astype(object)
+        values[pd.isnull(series).values] = ''
+
+        if series.dtype == object:
+            isEncoded = np.array([
+                StringUtils.isStringType(v) and not StringUtils.isTextType(v) for v in values],
+                dtype=bool)
+            if isEncoded.any():
+                values[isEncoded] = [cls._decodeValue(v) for v in values[isEncoded]]
+
+        return values.tolist()
+
+#_______________________________________________________________________________
+    @classmethod
+    def _decodeValue(cls, value):
+        """ Tries to decode the value into a unicode string using common codecs. """
+
+        if not value:
+            return value
+
+        for codec in ['utf8', 'MacRoman', 'utf16']:
+            try:
+                decodedValue = value.decode(codec)
+                if decodedValue:
+                    return decodedValue
+            except Exception:
+                continue
+        return value
+
+#_______________________________________________________________________________
+    def _getUniqueKey(self, track):
+        """ Returns a hashable key from the uniquely identifying properties of the specified
+            track, which are the properties compared by the findExistingTracks() method. """
+        return tuple(StringUtils.toText(getattr(track, name)) for name in self._uniqueProps)
+
 #_______________________________________________________________________________
     @classmethod
     def _getStrippedValue(cls, value):
@@ -23,6 +23,9 @@ class TrackLinkConnector(object):
 
     _TRACK_NUMBER_RE = re.compile('(?P<prefix>[^0-9\-]*)(?P<number>-?[0-9]+)(?P<suffix>[^0-9]*)')
 
+    # Track properties that together identify the series to which a track belongs
+    _SERIES_KEY_PROPS = ['site', 'sector', 'level', 'trackwayType', 'trackwayNumber', 'pes', 'left']
+
 #_______________________________________________________________________________
     def __init__(self, logger =None):
         """Creates a new instance of TrackLinkConnector."""
@@ -34,6 +37,7 @@ class TrackLinkConnector(object):
         self.searchPrev         = True
         self.overrideExisting   = False
         self.operatedTracks     = []
+        self._operatedUids      = set()
         self.modifiedTracks     = []
         self.trackLinkages      = []
 
@@ -50,36 +54,66 @@ class TrackLinkConnector(object):
 #_______________________________________________________________________________
     def runAll(self, session):
         model = Tracks_Track.MASTER
-        return self.run(session.query(model).all(), session)
+        tracks = session.query(model).all()
+        return self.run(tracks, session, seriesTracks=tracks)
 
 #_______________________________________________________________________________
-    def run(self, tracks, session):
-        """Doc..."""
+    def run(self, tracks, session, seriesTracks =None):
+        """ Links the tracks within each series that contains one of the specified tracks. The
+            candidate tracks are grouped by series in a single pass and all of the resulting
+            next links are written with one flush.
+
+            [seriesTracks] :: [Tracks_Track] :: None
+                The tracks from which the series are assembled. If not specified, all tracks in
+                the sites of the specified tracks are loaded with a single query. """
 
+        keys = []
+        found = set()
         for track in tracks:
-            if track not in self.operatedTracks:
-                self._runTrack(track, session)
+            if track.uid in self._operatedUids:
+                continue
+            key = self._getSeriesKey(track)
+            if key not in found:
+                found.add(key)
+                keys.append(key)
+
+        if not keys:
+            return
+
+        if seriesTracks is None:
+            model = Tracks_Track.MASTER
+            seriesTracks = session.query(model).filter(
+                model.site.in_(list(set(key[0] for key in keys)))).all()
+
+        groups = dict()
+        for track in seriesTracks:
+            groups.setdefault(self._getSeriesKey(track), []).append(track)
+
+        for key in keys:
+            self._runSeries(groups.get(key, []))
+
+        session.flush()
 
 #===============================================================================
 #                                                                               P R O T E C T E D
 
 #_______________________________________________________________________________
-    def _runTrack(self, source, session):
-        """Doc..."""
-
-        model = source.__class__
-        trackSeries = session.query(model).filter(
-            model.site == source.site,
-            model.sector == source.sector,
-            model.level == source.level,
-            model.trackwayType == source.trackwayType,
-            model.trackwayNumber == source.trackwayNumber,
-            model.pes == source.pes,
-            model.left == source.left).order_by(model.number.asc()).all()
+    def _getSeriesKey(self, track):
+        """ Returns a hashable key of the series identifying properties of the track. """
+        return tuple(getattr(track, name) for name in self._SERIES_KEY_PROPS)
+
+#_______________________________________________________________________________
+    def _runSeries(self, trackSeries):
+        """ Sorts the tracks within a single series and links each track to the next one. """
 
         if not trackSeries:
             return False
 
+        # Match the ordering of the series query sorted by track number
+        trackSeries = sorted(
+            trackSeries,
+            key=lambda t: (t.number is not None, t.number if t.number is not None else ''))
+
         #-------------------------------------------------------------------------------------------
         # TRACK ORDERING
         #       Tracks numbers are strings to support naming conventions like 10b or 12c, where the
@@ -113,7 +147,8 @@ class TrackLinkConnector(object):
             else:
                 entry['extras'][suffix] = track
 
-            if track not in self.operatedTracks:
+            if track.uid not in self._operatedUids:
+                self._operatedUids.add(track.uid)
                 self.operatedTracks.append(track)
 
         prev = None
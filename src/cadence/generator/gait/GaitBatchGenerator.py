@@ -0,0 +1,188 @@
+# GaitBatchGenerator.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import itertools
+import multiprocessing
+
+import numpy as np
+
+from cadence.generator.gait.GaitGenerator import GaitGenerator
+from cadence.shared.io.channel.DataChannel import DataChannel
+
+#___________________________________________________________________________________________________
+def runGaitBatch(configs):
+    """ Generates the gaits for the specified list of GaitGenerator keyword argument dictionaries
+        within a worker process created by the GaitBatchGenerator and returns the channels of each
+        gait as dictionaries, which are listed by target in the order of the generator's targets.
+
+        @return: List """
+
+    batch = GaitBatchGenerator(configs)
+    batch.run()
+
+    out = []
+    for generator in batch.generators:
+        out.append([
+            [channel.toDict() for channel in target.channels.values()]
+            for target in generator.targets ])
+    return out
+
+#*************************************************************************************************** GaitBatchGenerator
+class GaitBatchGenerator(object):
+    """ Generates the gait-phase and position channels of many gaits at once, such as those of a
+        parameter sweep. The gait phases of the four limbs of every gait are computed together as
+        rows of a single array, as are the lift and land events found within them. The keyframes
+        of each position channel are then created from those events exactly as they would be by
+        the GaitGenerator, so each generated gait is identical to its single-gait output. """
+
+    # Number of chunks of gaits per worker process, which balances the load between workers
+    CHUNKS_PER_PROCESS = 4
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def __init__(self, configs):
+        """ Creates a new instance of GaitBatchGenerator.
+
+            [configs] :: [Dict]
+                A list of keyword argument dictionaries, one for each gait, which are used to
+                create the GaitGenerator of that gait. """
+
+        self._configs    = [dict(config) for config in configs]
+        self._generators = [GaitGenerator(**config) for config in self._configs]
+
+#===============================================================================
+#                                                                                   G E T / S E T
+
+#_______________________________________________________________________________
+    @property
+    def configs(self):
+        return self._configs
+
+#_______________________________________________________________________________
+    @property
+    def generators(self):
+        """ The GaitGenerator of each gait in the order of the configs. """
+        return self._generators
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def run(self, processes =None):
+        """ Generates the channels of every gait, which are added to the targets of the gait's
+            GaitGenerator as if its run() method had been called.
+
+            [processes] :: Integer :: None
+                The number of worker processes across which the gaits are divided. The gaits are
+                generated within this process when not specified or less than two.
+
+            @return: Boolean """
+
+        if processes and processes > 1 and len(self._generators) > 1:
+            return self._runParallel(processes)
+
+        groups = dict()
+        for generator in self._generators:
+            key = (generator.steps, generator.cycles, generator.startTime, generator.stopTime)
+            groups.setdefault(key, []).append(generator)
+
+        for key, generators in groups.items():
+            self._generateGroup(key, generators)
+        return True
+
+#_______________________________________________________________________________
+    def toCadenceData(self):
+        """ Returns a list with the CadenceData of each gait in the order of the configs. """
+        return [generator.toCadenceData() for generator in self._generators]
+
+#_______________________________________________________________________________
+    @classmethod
+    def createSweepConfigs(cls, sweeps, **kwargs):
+        """ Returns a list of GaitGenerator keyword argument dictionaries for every combination of
+            the swept config values.
+
+            [sweeps] :: Dict
+                The values of each swept config, such as GaitConfigEnum.PHASE, keyed by config.
+
+            [kwargs] :: Dict
+                Additional GaitGenerator keyword arguments shared by every gait. Swept values
+                take precedence over any matching values in its overrides dictionary. """
+
+        keys = sorted(sweeps.keys())
+
+        out = []
+        for values in itertools.product(*[sweeps[key] for key in keys]):
+            config = dict(kwargs)
+            overrides = dict(kwargs.get('overrides') or dict())
+            overrides.update(zip(keys, values))
+            config['overrides'] = overrides
+            out.append(config)
+        return out
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _generateGroup(self, key, generators):
+        """ Generates the channels of gaits that share the same steps, cycles, start and stop
+            times, and therefore the same gait-phase times. """
+
+        steps, cycles = key[:2]
+        targets = [target for generator in generators for target in generator.targets]
+
+        offsets = []
+        for generator in generators:
+            offsets.extend([target.getStepOffset(generator) for target in generator.targets])
+
+        phases = targets[0].computeGaitPhases(
+            steps, cycles, [target.dutyFactor for target in targets], offsets)
+        events = targets[0].findGaitEvents(phases)
+
+        index = 0
+        for generator in generators:
+            for target in generator.targets:
+                target.createGaitPhaseChannel(generator, values=phases[index])
+                target.createPositionChannel(generator, events=events[index])
+                index += 1
+
+#_______________________________________________________________________________
+    def _runParallel(self, processes):
+        """ Divides the gaits into chunks that are generated by a pool of worker processes, after
+            which the returned channels are added to the targets of each gait. """
+
+        count  = min(processes*self.CHUNKS_PER_PROCESS, len(self._configs))
+        bounds = np.linspace(0, len(self._configs), count + 1).astype(int)
+        chunks = [self._configs[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+        context = multiprocessing.get_context('spawn') \
+            if hasattr(multiprocessing, 'get_context') \
+            else multiprocessing
+        pool = context.Pool(min(processes, len(chunks)))
+
+        try:
+            results = itertools.chain.from_iterable(pool.imap(runGaitBatch, chunks))
+            for generator, channels in zip(self._generators, results):
+                for target, targetChannels in zip(generator.targets, channels):
+                    for channel in targetChannels:
+                        target.addChannel(DataChannel.fromDict(channel))
+        finally:
+            pool.terminate()
+            pool.join()
+
+        return True
+
+#===============================================================================
+#                                                                               I N T R I N S I C
+
+#_______________________________________________________________________________
+    def __repr__(self):
+        return self.__str__()
+
+#_______________________________________________________________________________
+    def __str__(self):
+        return '<%s>' % self.__class__.__name__
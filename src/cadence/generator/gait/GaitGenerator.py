@@ -103,6 +103,13 @@ class GaitGenerator(object):
     def phase(self):
         return self._phase
 
+#_______________________________________________________________________________
+    @property
+    def targets(self):
+        """ The TargetData of each limb in the order left hind, left fore, right hind and right
+            fore. """
+        return [self._leftHind, self._leftFore, self._rightHind, self._rightFore]
+
 #_______________________________________________________________________________
     @property
     def configs(self):
@@ -165,16 +172,12 @@ class GaitGenerator(object):
 
 #_______________________________________________________________________________
     def _generateGaitPhases(self):
-        self._leftHind.createGaitPhaseChannel(self)
-        self._leftFore.createGaitPhaseChannel(self)
-        self._rightHind.createGaitPhaseChannel(self)
-        self._rightFore.createGaitPhaseChannel(self)
+        for target in self.targets:
+            target.createGaitPhaseChannel(self)
         return True
 
 #_______________________________________________________________________________
     def _generatePositions(self):
-        self._leftHind.createPositionChannel(self)
-        self._leftFore.createPositionChannel(self)
-        self._rightHind.createPositionChannel(self)
-        self._rightFore.createPositionChannel(self)
+        for target in self.targets:
+            target.createPositionChannel(self)
         return True
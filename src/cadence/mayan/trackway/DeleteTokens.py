@@ -39,4 +39,6 @@ class DeleteTokens(NimbleScriptBase):
         for object in objects:
             if object.startswith('Token'):
                 cmds.delete(object)
+
+        TrackSceneUtils.invalidateUidIndex()
         return
@@ -0,0 +1,62 @@
+# GetTrackNodePropsBatch.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import\
+    print_function, absolute_import, unicode_literals, division
+
+from nimble import NimbleScriptBase
+
+from cadence.mayan.trackway.TrackSceneUtils import TrackSceneUtils
+
+#_______________________________________________________________________________
+class GetTrackNodePropsBatch(NimbleScriptBase):
+    """ A remote script class for locating many tracks based on their uid
+        properties and returning their property data in a single call. Tracks
+        whose cached node names no longer match are located with one pass over
+        the track set.
+
+        entries:        List of dictionaries, each with the uid of a track and
+                        the nodeName cached for that uid, if any.
+
+        <- success      | Boolean specifying if a node was found for every
+                        entry.
+        <- nodes        | Dictionary keyed by uid with the nodeName and props
+                        of each track node that was found. """
+
+#===============================================================================
+#                                                                   P U B L I C
+#
+#_______________________________________________________________________________
+    def run(self, *args, **kwargs):
+        entries = self.fetch('entries', None)
+
+        if not entries:
+            self.puts(
+                success=False,
+                error=True,
+                message='Invalid or missing entries')
+            return
+
+        uids  = set()
+        nodes = dict()
+        missingUids = list()
+        for entry in entries:
+            uid  = entry['uid']
+            node = entry.get('nodeName')
+            uids.add(uid)
+            if node and TrackSceneUtils.checkNodeUidMatch(uid, node):
+                nodes[uid] = node
+            else:
+                missingUids.append(uid)
+
+        if missingUids:
+            nodes.update(TrackSceneUtils.getNodesByUid(missingUids))
+
+        out = dict()
+        for uid, node in nodes.items():
+            out[uid] = {
+                'nodeName':node,
+                'props':TrackSceneUtils.getTrackProps(node) }
+
+        self.puts(success=len(out) == len(uids), nodes=out)
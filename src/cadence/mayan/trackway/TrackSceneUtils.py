@@ -26,6 +26,10 @@ class TrackSceneUtils(object):
         introduced, and while it uses the uid and trackSetNode, the attributes
         are different. """
 
+    # The uid index of the track set members for the current Maya session,
+    # which is created and refreshed on demand by getNodesByUid()
+    _uidIndex = None
+
 #===============================================================================
 #                                             T R A C K  N O D E  S U P P O R T
 #
@@ -425,28 +429,81 @@ class TrackSceneUtils(object):
         # Add the new nodeName to the Cadence track scene set, color it, and
         # we're done
         cmds.sets(node, add=trackSetNode)
+        cls._addToUidIndex(node, trackSetNode)
         cls.colorTrackNode(node, props)
         return node
 
 #_______________________________________________________________________________
     @classmethod
     def getTrackNode(cls, uid, trackSetNode =None):
+        """ Returns the name of the node in the track set with the specified
+            uid, or None if there is no such node. The node is found with the
+            uid index of the track set, see getNodesByUid(). """
+
         trackSetNode = cls.getTrackSetNode() if not trackSetNode\
             else trackSetNode
         if not trackSetNode:
             return None
 
-        nodes = cmds.sets(trackSetNode, query=True)
-        if not nodes:
-            return None
+        return cls.getNodesByUid([uid], trackSetNode=trackSetNode).get(uid)
 
-        for node in nodes:
-            if not cmds.hasAttr(node + '.' + TrackPropEnum.UID.maya):
-                continue
-            if uid == cmds.getAttr(node + '.' + TrackPropEnum.UID.maya):
-                return node
+#_______________________________________________________________________________
+    @classmethod
+    def getNodesByUid(cls, uids, trackSetNode =None):
+        """ Returns a dictionary that maps each of the specified uids to the
+            name of the node in the track set with that uid. Uids without a
+            node in the track set are omitted. This applies to both track nodes
+            and tokens, which share the same uid attribute.
+
+            Nodes are found with an index of the uids of the track set members
+            that is kept for the current Maya session. Each node found in the
+            index is verified by reading its uid attribute. The members of the
+            track set are only scanned when a uid is missing from the index or
+            its node no longer matches, and then only the members that are not
+            already indexed have their uid attributes read. If a uid is still
+            missing, the uid attributes of the indexed members are read again
+            in case one of them was changed. """
 
-        return None
+        trackSetNode = cls.getTrackSetNode() if not trackSetNode\
+            else trackSetNode
+        if not trackSetNode:
+            return dict()
+
+        index = cls._getUidIndex(trackSetNode)
+
+        out   = dict()
+        stale = False
+        for uid in uids:
+            node = index['nodes'].get(uid)
+            if node is None:
+                stale = True
+            elif cls._readNodeUid(node) == uid:
+                out[uid] = node
+            else:
+                # The node was renamed, deleted or given a different uid
+                cls._removeFromUidIndex(index, node)
+                stale = True
+
+        if not stale:
+            return out
+
+        cls._refreshUidIndex(index)
+        if [uid for uid in uids if uid not in out and uid not in index['nodes']]:
+            cls._refreshUidIndex(index, reread=True)
+
+        for uid in uids:
+            if uid not in out and uid in index['nodes']:
+                out[uid] = index['nodes'][uid]
+        return out
+
+#_______________________________________________________________________________
+    @classmethod
+    def invalidateUidIndex(cls):
+        """ Discards the uid index of the track set, which should be called
+            after track nodes or tokens are deleted or renamed within Maya.
+            The index is rebuilt by the next node lookup. """
+
+        cls._uidIndex = None
 
 #_______________________________________________________________________________
     @classmethod
@@ -722,6 +779,7 @@ class TrackSceneUtils(object):
 
         # finally, initialize all the properties from the dictionary props
         cls.setTokenProps(node, props)
+        cls._addToUidIndex(node, trackSetNode)
 
         return node
 
@@ -887,22 +945,7 @@ class TrackSceneUtils(object):
         """ This returns the name (string) of the node in the trackSet
             for the object with matching UID attribute. """
 
-        if not trackSetNode:
-            trackSetNode = cls.getTrackSetNode()
-        if not trackSetNode:
-            return None
-
-        nodes = cmds.sets(trackSetNode, query=True)
-        if not nodes:
-            return None
-
-        for node in nodes:
-            if not cmds.hasAttr(node + '.' + 'track_uid'):
-                continue
-            if uid == cmds.getAttr(node + '.' + 'track_uid'):
-                return node
-
-        return None
+        return cls.getTrackNode(uid, trackSetNode=trackSetNode)
 
 #_______________________________________________________________________________
     @classmethod
@@ -947,4 +990,99 @@ class TrackSceneUtils(object):
             return out
         else:
             print('decomposeName:  unrecognized format for name string')
-            return None
\ No newline at end of file
+            return None
+
+#===============================================================================
+#                                                           P R O T E C T E D
+#
+#_______________________________________________________________________________
+    @classmethod
+    def _getUidIndex(cls, trackSetNode):
+        """ Returns the uid index for the specified track set node, replacing
+            the existing index if it was created for a different track set.
+            The index is a dictionary with the track set node, a dictionary of
+            node names keyed by uid and a dictionary of uids keyed by the node
+            names of every member that has been scanned, where members without
+            a uid attribute have a uid of None. """
+
+        index = cls._uidIndex
+        if index is None or index['trackSetNode'] != trackSetNode:
+            index = {'trackSetNode':trackSetNode, 'nodes':dict(), 'uids':dict()}
+            cls._uidIndex = index
+        return index
+
+#_______________________________________________________________________________
+    @classmethod
+    def _refreshUidIndex(cls, index, reread =False):
+        """ Brings the specified uid index up to date with the members of its
+            track set by removing the nodes that are no longer members and
+            reading the uid attributes of the members that have not yet been
+            scanned. When reread is True the uid attributes of the members that
+            were already scanned are read as well, and those whose uids have
+            changed are indexed again. """
+
+        members = cmds.sets(index['trackSetNode'], query=True) or []
+
+        memberSet = set(members)
+        for node in list(index['uids'].keys()):
+            if node not in memberSet:
+                cls._removeFromUidIndex(index, node)
+
+        for node in members:
+            if node in index['uids'] and not reread:
+                continue
+
+            uid = None
+            if cmds.hasAttr(node + '.' + TrackPropEnum.UID.maya):
+                uid = cmds.getAttr(node + '.' + TrackPropEnum.UID.maya)
+
+            if node in index['uids']:
+                if index['uids'][node] == uid:
+                    continue
+                cls._removeFromUidIndex(index, node)
+
+            index['uids'][node] = uid
+            if uid is not None and uid not in index['nodes']:
+                index['nodes'][uid] = node
+
+#_______________________________________________________________________________
+    @classmethod
+    def _addToUidIndex(cls, node, trackSetNode):
+        """ Adds a node that was just created and added to the specified track
+            set to the uid index, if an index exists for that track set. """
+
+        index = cls._uidIndex
+        if index is None or index['trackSetNode'] != trackSetNode:
+            return
+
+        uid = cls._readNodeUid(node)
+        index['uids'][node] = uid
+        if uid is not None:
+            index['nodes'][uid] = node
+
+#_______________________________________________________________________________
+    @classmethod
+    def _removeFromUidIndex(cls, index, node):
+        """ Removes the specified node from the uid index, replacing it with
+            another scanned member that has the same uid if there is one. """
+
+        uid = index['uids'].pop(node, None)
+        if uid is None or index['nodes'].get(uid) != node:
+            return
+
+        del index['nodes'][uid]
+        for other, otherUid in index['uids'].items():
+            if otherUid == uid:
+                index['nodes'][uid] = other
+                return
+
+#_______________________________________________________________________________
+    @classmethod
+    def _readNodeUid(cls, node):
+        """ Returns the uid attribute of the specified node, or None if the
+            node does not exist or has no uid attribute. """
+
+        try:
+            return cmds.getAttr(node + '.' + TrackPropEnum.UID.maya)
+        except Exception:
+            return None
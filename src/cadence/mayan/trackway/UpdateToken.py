@@ -5,7 +5,6 @@
 from __future__ import\
     print_function, absolute_import, unicode_literals, division
 
-from nimble import cmds
 from nimble import NimbleScriptBase
 
 from cadence.mayan.trackway.TrackSceneUtils import TrackSceneUtils
@@ -35,12 +34,10 @@ class UpdateToken(NimbleScriptBase):
                 message='Scene not initialized for Cadence')
             return
 
-        for node in cmds.sets(trackSetNode, query=True):
-            if not cmds.hasAttr(node + '.track_uid'):
-                continue
-            if uid == cmds.getAttr(node + '.track_uid'):
-                TrackSceneUtils.setTokenProps(node, props)
-                self.puts(success=True, nodeName=node)
-                return
+        node = TrackSceneUtils.getTokenNode(uid, trackSetNode=trackSetNode)
+        if node:
+            TrackSceneUtils.setTokenProps(node, props)
+            self.puts(success=True, nodeName=node)
+            return
 
         self.response.puts(success=False)
@@ -0,0 +1,64 @@
+# UpdateTokens.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import\
+    print_function, absolute_import, unicode_literals, division
+
+from nimble import NimbleScriptBase
+
+from cadence.mayan.trackway.TrackSceneUtils import TrackSceneUtils
+
+#_______________________________________________________________________________
+class UpdateTokens(NimbleScriptBase):
+    """ A remote script class for updating the attributes of many tokens in a
+        single call, which locates all of the tokens with one pass over the
+        track set.
+
+        entries:        List of dictionaries, each with the uid of a token and
+                        the props dictionary to set on that token.
+
+        <- success      | Boolean specifying if every token was found and
+                        updated.
+        <- nodeNames    | Dictionary of the node names of the updated tokens
+                        keyed by their uids.
+        <- missingUids  | List of the uids for which no token was found. """
+
+#===============================================================================
+#                                                                   P U B L I C
+#
+#_______________________________________________________________________________
+    def run(self, *args, **kwargs):
+        entries = self.fetch('entries', None)
+
+        if not entries:
+            self.puts(
+                success=False, error=True, message='Invalid or missing entries')
+            return
+
+        trackSetNode = TrackSceneUtils.getTrackSetNode()
+        if not trackSetNode:
+            self.puts(
+                success=False,
+                error=True,
+                message='Scene not initialized for Cadence')
+            return
+
+        nodes = TrackSceneUtils.getNodesByUid(
+            [entry['uid'] for entry in entries], trackSetNode=trackSetNode)
+
+        nodeNames   = dict()
+        missingUids = list()
+        for entry in entries:
+            node = nodes.get(entry['uid'])
+            if not node:
+                missingUids.append(entry['uid'])
+                continue
+
+            TrackSceneUtils.setTokenProps(node, entry['props'])
+            nodeNames[entry['uid']] = node
+
+        self.puts(
+            success=not missingUids,
+            nodeNames=nodeNames,
+            missingUids=missingUids)
@@ -5,11 +5,8 @@
 from __future__ import\
     print_function, absolute_import, unicode_literals, division
 
-from nimble import cmds
 from nimble import NimbleScriptBase
 
-from cadence.enums.TrackPropEnum import TrackPropEnum
-
 from cadence.mayan.trackway.TrackSceneUtils import TrackSceneUtils
 
 #_______________________________________________________________________________
@@ -43,12 +40,10 @@ class UpdateTrackNode(NimbleScriptBase):
                 message='Scene not initialized for Cadence')
             return
 
-        for node in cmds.sets(trackSetNode, query=True):
-            if not cmds.hasAttr(node + '.' + TrackPropEnum.UID.maya):
-                continue
-            if uid == cmds.getAttr(node + '.' + TrackPropEnum.UID.maya):
-                TrackSceneUtils.setTrackProps(node, props)
-                self.puts(success=True, nodeName=node)
-                return
+        node = TrackSceneUtils.getTrackNode(uid, trackSetNode=trackSetNode)
+        if node:
+            TrackSceneUtils.setTrackProps(node, props)
+            self.puts(success=True, nodeName=node)
+            return
 
         self.response.puts(success=False)
@@ -24,6 +24,10 @@ class TracksDefault(PyGlassModelsDefault):
 
     _ANALYSIS_PAIR_KEY = 'analysisPair'
 
+    # Maximum number of values bound in a single IN clause when bulk loading analysis pairs,
+    # which keeps each query below the SQLite limit on variables per statement
+    _ANALYSIS_PAIR_CHUNK_SIZE = 500
+
     _flags               = sqla.Column(sqla.Integer,     default=0)
     _sourceFlags         = sqla.Column(sqla.Integer,     default=0)
     _displayFlags        = sqla.Column(sqla.Integer,     default=0)
@@ -73,6 +77,30 @@ class TracksDefault(PyGlassModelsDefault):
         self.putTransient(self._ANALYSIS_PAIR_KEY, result)
         return result
 
+#_______________________________________________________________________________
+    @classmethod
+    def prefetchAnalysisPairs(cls, items, analysisSession, createIfMissing =True):
+        """ Loads the analysis pairs for a list of model instances in bulk and stores them on
+            each instance's transient data, where getAnalysisPair() will find them without
+            querying the analysis database. Instances that already hold a pair for the
+            specified session are skipped. Returns the number of instances that were paired. """
+
+        key = cls._ANALYSIS_PAIR_KEY
+
+        missing = []
+        for item in items:
+            target = item.fetchTransient(key)
+            if not target or analysisSession != target.mySession:
+                missing.append(item)
+
+        if not missing:
+            return 0
+
+        pairs = cls._getAnalysisPairs(analysisSession, missing, createIfMissing)
+        for item, pair in zip(missing, pairs):
+            item.putTransient(key, pair)
+        return len(missing)
+
 #===============================================================================
 #                                                                               P R O T E C T E D
 
@@ -80,3 +108,48 @@ class TracksDefault(PyGlassModelsDefault):
     def _getAnalysisPair(self, session, createIfMissing):
         """_getAnalysisPair doc..."""
         return None
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getAnalysisPairs(cls, session, items, createIfMissing):
+        """ Returns a list of analysis pairs matching the order of the items list. Models with
+            analysis pairs should override this method to load the pairs in bulk. """
+        return [item._getAnalysisPair(session, createIfMissing) for item in items]
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getAnalysisPairsByKey(cls, session, model, keyName, items, createIfMissing):
+        """ Loads the analysis model rows whose keyName column matches the keyName attribute of
+            each of the items with chunked IN queries. When createIfMissing is True, rows missing
+            for any of the items are created and inserted together in a single flush.
+
+            @return: A list of analysis pairs in the same order as items """
+
+        keys = [getattr(item, keyName) for item in items]
+        column = getattr(model, keyName)
+        size = cls._ANALYSIS_PAIR_CHUNK_SIZE
+
+        existing = dict()
+        uniqueKeys = list(set(keys))
+        for i in range(0, len(uniqueKeys), size):
+            query = session.query(model).filter(column.in_(uniqueKeys[i:i + size]))
+            for result in query.all():
+                # Match the first result behavior of the single pair queries
+                existing.setdefault(getattr(result, keyName), result)
+
+        out = []
+        created = []
+        for key in keys:
+            result = existing.get(key)
+            if result is None and createIfMissing:
+                result = model()
+                setattr(result, keyName, key)
+                existing[key] = result
+                created.append(result)
+            out.append(result)
+
+        if created:
+            session.add_all(created)
+            session.flush()
+
+        return out
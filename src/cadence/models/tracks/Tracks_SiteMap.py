@@ -142,6 +142,39 @@ class Tracks_SiteMap(TracksDefault):
 
         return self.getTracksQuery(session=session).all()
 
+#_______________________________________________________________________________
+    def getTracksByUid(self, session =None):
+        """ Loads all of the tracks within this sitemap in a single query and returns them as a
+            dictionary keyed by track uid, which is used to assemble track series in memory
+            instead of querying each linked track individually. """
+
+        query = self.getTracksQuery(session=session)
+        if query is None:
+            return dict()
+
+        out = dict()
+        for track in query.all():
+            out[track.uid] = track
+        return out
+
+#_______________________________________________________________________________
+    def getTrackwaySeriesBundles(self, trackways =None, session =None):
+        """ Creates the TrackSeriesBundle for each of the specified trackways, or all of the
+            trackways in this sitemap if none are specified, from a single bulk load of the
+            sitemap's tracks.
+
+            @return: Dict of TrackSeriesBundle instances keyed by trackway uid """
+
+        if trackways is None:
+            trackways = self.getTrackways()
+
+        tracksByUid = self.getTracksByUid(session=session)
+
+        out = dict()
+        for tw in trackways:
+            out[tw.uid] = tw.getTrackwaySeriesBundle(tracksByUid=tracksByUid)
+        return out
+
 #_______________________________________________________________________________
     def getTrackways(self):
         """getTrackways doc..."""
@@ -184,6 +217,15 @@ class Tracks_SiteMap(TracksDefault):
 
         return result
 
+#_______________________________________________________________________________
+    @classmethod
+    def _getAnalysisPairs(cls, session, items, createIfMissing):
+        """ Loads the Analysis_Sitemap rows for the items with a bulk IN query on index. """
+
+        from cadence.models.analysis.Analysis_Sitemap import Analysis_Sitemap
+        return cls._getAnalysisPairsByKey(
+            session, Analysis_Sitemap.MASTER, 'index', items, createIfMissing)
+
 #===============================================================================
 #                                                                               I N T R I N S I C
 
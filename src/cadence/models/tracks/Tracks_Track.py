@@ -275,3 +275,12 @@ class Tracks_Track(TracksTrackDefault):
             session.flush()
 
         return result
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getAnalysisPairs(cls, session, items, createIfMissing):
+        """ Loads the Analysis_Track rows for the items with a bulk IN query on uid. """
+
+        from cadence.models.analysis.Analysis_Track import Analysis_Track
+        return cls._getAnalysisPairsByKey(
+            session, Analysis_Track.MASTER, 'uid', items, createIfMissing)
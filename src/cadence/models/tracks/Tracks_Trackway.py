@@ -86,20 +86,69 @@ class Tracks_Trackway(TracksDefault):
 #                                                                   P U B L I C
 
 #_______________________________________________________________________________
-    def getTrackwaySeriesBundle(self):
+    def getTrackwaySeriesBundle(self, tracksByUid =None):
         """ Creates an ordered dictionary containing the track series for each
             series in the trackway, even if one of the series has no tracks. The
             keys of the dictionary match the key value of the track series
             instance, i.e. TrackSeries.key.
 
+            [tracksByUid] :: Dict :: None
+                Pre-fetched tracks keyed by uid from which the series are built
+                in memory. If not specified, the tracks of this trackway are
+                bulk loaded with the getTracksByUid() method.
+
             @return: TrackSeriesBundle """
 
         from cadence.analysis.TrackSeriesBundle import TrackSeriesBundle
 
+        if tracksByUid is None:
+            tracksByUid = self.getTracksByUid()
+
         bundle = TrackSeriesBundle(self)
-        bundle.load()
+        bundle.load(tracksByUid=tracksByUid)
         return bundle
 
+#_______________________________________________________________________________
+    def getTracksByUid(self, session =None):
+        """ Bulk loads the tracks of this trackway and returns them as a
+            dictionary keyed by track uid. The first tracks of each series are
+            loaded to determine the series keys (site, level, sector, trackway
+            type and number) on which track linkages are made, and then every
+            track matching those keys is loaded in a single query. """
+
+        from cadence.models.tracks.Tracks_Track import Tracks_Track
+        model = Tracks_Track.MASTER
+
+        if session is None:
+            session = self.mySession
+
+        firstUids = self.firstTracksList
+        if not firstUids:
+            return dict()
+
+        seriesFilters = []
+        seriesKeys    = []
+        for track in session.query(model).filter(model.uid.in_(firstUids)).all():
+            key = (track.site, track.level, track.sector, track.trackwayType,
+                   track.trackwayNumber)
+            if key in seriesKeys:
+                continue
+            seriesKeys.append(key)
+            seriesFilters.append(sqla.and_(
+                model.site == track.site,
+                model.level == track.level,
+                model.sector == track.sector,
+                model.trackwayType == track.trackwayType,
+                model.trackwayNumber == track.trackwayNumber))
+
+        if not seriesFilters:
+            return dict()
+
+        out = dict()
+        for track in session.query(model).filter(sqla.or_(*seriesFilters)).all():
+            out[track.uid] = track
+        return out
+
 #_______________________________________________________________________________
     def getSitemap(self):
         """getSitemap doc..."""
@@ -137,23 +186,37 @@ class Tracks_Trackway(TracksDefault):
             newSession = True
             session = model.createSession()
 
+        # Load all tracks and sitemaps in single queries and index them in
+        # memory so that series heads can be found without a query per step
+        allTracks = session.query(trackModel).all()
+
+        # Reverse-link index mapping a track uid to the first track whose next
+        # references it, which matches the getPreviousTrack() result
+        previousTracks = dict()
+        for track in allTracks:
+            if track.next and track.next not in previousTracks:
+                previousTracks[track.next] = track
+
+        sitemaps = dict()
+        for sitemap in session.query(sitemapModel).all():
+            sitemaps.setdefault((sitemap.name, sitemap.level), sitemap)
+
         # Get all tracks that have no next (end of a track series)
-        endTracks = session.query(trackModel).filter(
-            trackModel.next == '').all()
+        endTracks = [t for t in allTracks if t.next == '']
 
         index     = 0
         trackways = dict()
-        tested    = []
+        tested    = set()
 
         for track in endTracks:
-            if track in tested or track.hidden:
+            if track.uid in tested or track.hidden:
                 # Skip tracks that have already been tested or are hidden
                 continue
 
             prev = track
             while prev:
-                tested.append(prev)
-                t = prev.getPreviousTrack()
+                tested.add(prev.uid)
+                t = previousTracks.get(prev.uid)
                 if not t:
                     break
                 prev = t
@@ -178,9 +241,7 @@ class Tracks_Trackway(TracksDefault):
                 tw.index = index
                 tw.name  = name
 
-                sitemap = session.query(sitemapModel).filter(
-                    sitemapModel.name == prev.site).filter(
-                    sitemapModel.level == prev.level).first()
+                sitemap = sitemaps.get((prev.site, prev.level))
                 if not sitemap:
                     missingSitemaps.append(sitemapStamp)
                     logger.write(
@@ -243,6 +304,15 @@ class Tracks_Trackway(TracksDefault):
 
         return result
 
+#_______________________________________________________________________________
+    @classmethod
+    def _getAnalysisPairs(cls, session, items, createIfMissing):
+        """ Loads the Analysis_Trackway rows for the items with a bulk IN query on index. """
+
+        from cadence.models.analysis.Analysis_Trackway import Analysis_Trackway
+        return cls._getAnalysisPairsByKey(
+            session, Analysis_Trackway.MASTER, 'index', items, createIfMissing)
+
 #===============================================================================
 #                                                             I N T R I N S I C
 
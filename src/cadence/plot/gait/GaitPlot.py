@@ -4,10 +4,13 @@
 
 from __future__ import print_function, absolute_import, unicode_literals, division
 
+import numpy as np
 import pylab as plt
+from matplotlib.collections import PolyCollection
 
 from cadence.shared.io.CadenceData import CadenceData
 from cadence.shared.enum.ChannelsEnum import ChannelsEnum
+from cadence.shared.enum.TangentsEnum import TangentsEnum
 from cadence.shared.enum.TargetsEnum import TargetsEnum
 from cadence.config.enum.GeneralConfigEnum import GeneralConfigEnum
 
@@ -40,6 +43,15 @@ class GaitPlot(object):
         gp.save(<file>)               # save as a .png
         gp.show()                     # launch the display popup
     """
+
+    # Support score of each of the 16 combinations of limb contacts, indexed by the left hind,
+    # left fore, right fore and right hind contacts as the bits of a 4-bit number in that order
+    SUPPORT_SCORES = np.array([
+        0.0,  0.0,  0.0,  0.1,      # LH lifted, LF lifted
+        0.0,  0.7,  0.2,  0.85,     # LH lifted, LF planted
+        0.0,  0.75, 0.7,  0.95,     # LH planted, LF lifted
+        0.1,  0.95, 0.85, 1.0 ])    # LH planted, LF planted
+
 #_______________________________________________________________________________
 
     def __init__(self, rows=1, width=8, height=4):
@@ -188,21 +200,15 @@ class GaitPlot(object):
 #_______________________________________________________________________________
 
     def value(self, channel, time):
-        prevKey = channel.keys[0]
-        for key in channel.keys[1:]:
-            if prevKey.time <= time and time <= key.time:
-                return key.value
-            prevKey = key
-        return channel.keys[0].value
+        """ Returns the value of the key that ends the interval containing the specified time. """
+        return channel.sample(time, mode=TangentsEnum.STEPPED_NEXT)[0]
 
 #_______________________________________________________________________________
 
     def values(self, channel, times):
-        values = []
-
-        for t in times:
-            values.append(self.value(channel, t))
-        return values
+        """ Returns an array with the value() of the channel at each of the specified times,
+            sampled in a single call. """
+        return channel.sample(times, mode=TangentsEnum.STEPPED_NEXT)
 
 #_______________________________________________________________________________
 
@@ -226,22 +232,10 @@ class GaitPlot(object):
         valuesLF = self.values(self._channel_LF, times)
         valuesLH = self.values(self._channel_LH, times)
 
-        self.setColorMap('RdYlGn')
+        support = self.getSupportScores(valuesLH != 0, valuesLF != 0, valuesRF != 0, valuesRH != 0)
 
-        for i in range(len(times)):
-            time  = times[i]
-            lh, lf, rf, rh = valuesLH[i], valuesLF[i], valuesRF[i], valuesRH[i]
-
-            if   lh and lf and rf and rh:                  support = 1.0
-            elif (lh and rf and rh) or (lh and lf and rh): support = 0.95
-            elif (lh and lf and rf) or (lf and rf and rh): support = 0.85
-            elif lh and rh:                                support = 0.75
-            elif (lh and rf) or (lf and rh):               support = 0.7
-            elif lf and rf:                                support = 0.2
-            elif (lh and lf) or (rf and rh):               support = 0.1
-            else:                                          support = 0.0
-            if support > 0.0:
-                plt.axvspan(time - 2.0*delta, time, fc=self.mapValueToColor(support), ec='none')
+        self.setColorMap('RdYlGn')
+        self.plotSupport(graph, times, support, delta)
 
         self.setColorMap('gray')
         self.plotChannel(self._channel_LH, graph, y_LH, lineWidth)
@@ -257,6 +251,59 @@ class GaitPlot(object):
         plt.yticks(positions, labels)
         return True
 
+#_______________________________________________________________________________
+
+    def plotSupport(self, graph, times, support, delta):
+        """ Shades the graph behind each time with the color of its support score. Every time
+            shades the interval of two steps that ends at that time, over which the next time is
+            drawn, so each step shows the score of the latest time that shades it. Consecutive
+            steps of equal score are drawn as a single rectangle within one collection. """
+
+        count = len(times)
+        if not count:
+            return False
+
+        # The step ending one step before each time shows its score, or the previous time's
+        # score when its own is zero. The final step shows the score of the final time.
+        shown = np.append(support, support[-1])
+        shown[1:-1] = np.where(support[1:] > 0.0, support[1:], support[:-1])
+
+        changes = np.flatnonzero(shown[1:] != shown[:-1]) + 1
+        starts  = np.concatenate(([0], changes))
+        ends    = np.concatenate((changes, [len(shown)]))
+        visible = shown[starts] > 0.0
+        starts, ends = starts[visible], ends[visible]
+        if not len(starts):
+            return False
+
+        edges = times[0] + (np.arange(count + 2) - 2.0)*delta
+        x0, x1 = edges[starts], edges[ends]
+        vertices = np.stack([
+            np.column_stack((x0, np.zeros_like(x0))),
+            np.column_stack((x0, np.ones_like(x0))),
+            np.column_stack((x1, np.ones_like(x1))),
+            np.column_stack((x1, np.zeros_like(x1))) ], axis=1)
+
+        # The rectangles span the full height of the graph like axvspan
+        graph.add_collection(PolyCollection(
+            vertices,
+            facecolors=self.mapValueToColor(shown[starts]),
+            edgecolors='none',
+            transform=graph.get_xaxis_transform()))
+        return True
+
+#_______________________________________________________________________________
+
+    @classmethod
+    def getSupportScores(cls, lh, lf, rf, rh):
+        """ Returns an array of the support score of each combination of the boolean ground
+            contact arrays of the left hind, left fore, right fore and right hind limbs, which
+            may be of any matching shape, from the SUPPORT_SCORES lookup table. """
+
+        index = 8*np.asarray(lh, dtype=int) + 4*np.asarray(lf, dtype=int) \
+            + 2*np.asarray(rf, dtype=int) + np.asarray(rh, dtype=int)
+        return cls.SUPPORT_SCORES[index]
+
     #_______________________________________________________________________________
 
     def clearGraph(self, graphNumber=1, background='black'):
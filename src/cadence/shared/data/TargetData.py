@@ -48,8 +48,6 @@ class TargetData(object):
         self._dutyFactor    = ArgsUtils.get('dutyFactor', 0.5, kwargs)
         self._phaseOffset   = float(ArgsUtils.get('phaseOffset', 0.0, kwargs))
 
-        print(self.target, self._phaseOffset)
-
 #===============================================================================
 #                                                                                   G E T / S E T
 
@@ -73,6 +71,16 @@ class TargetData(object):
     def target(self):
         return self._target
 
+#_______________________________________________________________________________
+    @property
+    def dutyFactor(self):
+        return self._dutyFactor
+
+#_______________________________________________________________________________
+    @property
+    def phaseOffset(self):
+        return self._phaseOffset
+
 #===============================================================================
 #                                                                                     P U B L I C
 
@@ -112,29 +120,39 @@ class TargetData(object):
         return None
 
 #_______________________________________________________________________________
-    def createGaitPhaseChannel(self, settings):
-        """Doc..."""
-        steps = int(settings.steps)
-        d     = np.zeros(steps)
-
-        for i in range(0, steps):
-            cyclePhase = math.modf(float(i)*float(settings.cycles)/float(steps))[0]
-            d[i]       = int(cyclePhase <= self._dutyFactor)
+    def getStepOffset(self, settings):
+        """ Returns the number of steps by which the gait phases of this target are rotated, which
+            combines the phase offset of the target with the cycle offset of the settings. """
 
+        steps  = int(settings.steps)
+        offset = 0
         if self._phaseOffset:
-            offset = int(round(self._phaseOffset*float(steps)/float(settings.cycles)))
-            d      = np.roll(d, offset)
-
+            offset += int(round(self._phaseOffset*float(steps)/float(settings.cycles)))
         if settings.cycleOffset:
-            offset = int(round(settings.cycleOffset*float(steps)/float(settings.cycles)))
-            d      = np.roll(d, offset)
+            offset += int(round(settings.cycleOffset*float(steps)/float(settings.cycles)))
+        return offset
+
+#_______________________________________________________________________________
+    def createGaitPhaseChannel(self, settings, values =None):
+        """ Creates the gait phase channel for this target from the specified settings. The values
+            argument accepts gait phase values computed in advance for this target, like those of
+            the computeGaitPhases() method, instead of computing them here. """
+
+        steps = int(settings.steps)
+        if values is None:
+            values = self.computeGaitPhases(
+                steps, settings.cycles, [self._dutyFactor], [self.getStepOffset(settings)])[0]
 
         time = list(np.linspace(settings.startTime, settings.stopTime, steps))
 
-        return self.createChannel(ChannelsEnum.GAIT_PHASE, list(d), time)
+        return self.createChannel(ChannelsEnum.GAIT_PHASE, list(values), time)
 
 #_______________________________________________________________________________
-    def createPositionChannel(self, settings):
+    def createPositionChannel(self, settings, events =None):
+        """ Creates the position channel for this target from its gait phase channel. The events
+            argument accepts the (lifts, lands) step indexes of the gait phase channel found in
+            advance, like those of the findGaitEvents() method, instead of finding them here. """
+
         cls  = self.__class__
         gait = self.getChannel(ChannelsEnum.GAIT_PHASE)
         if not gait:
@@ -144,10 +162,7 @@ class TargetData(object):
         # INITIALIZATION
         dc             = self.createChannel(kind=ChannelsEnum.POSITION)
         times          = gait.times
-        values         = gait.values
         steps          = int(settings.steps)
-        lifts          = []
-        lands          = []
         strideLength   = float(settings.configs.get(SkeletonConfigEnum.STRIDE_LENGTH, 50.0))
         strideWidth    = float(settings.configs.get(SkeletonConfigEnum.STRIDE_WIDTH, 50.0))
         hindOffset     = settings.configs.get(
@@ -169,17 +184,10 @@ class TargetData(object):
         # FIND POSITION KEYFRAMES
         #       Find lift and lands within the step range by finding changes in the gait-phase
         #       channel.
-        index = 0
-        prev  = values[-1]
-        while index < steps:
-            v = values[index]
-            if v - prev < 0:
-                lifts.append(index)
-            elif v - prev > 0:
-                lands.append(index)
-
-            index += 1
-            prev   = v
+        if events is None:
+            events = cls.findGaitEvents([gait.values])[0]
+        lifts = [int(index) for index in events[0]]
+        lands = [int(index) for index in events[1]]
 
         # PRE KEY
         preEvent = KeyEventEnum.LIFT if lifts[0] > lands[0] else KeyEventEnum.LAND
@@ -286,9 +294,62 @@ class TargetData(object):
                 'event':KeyEventEnum.AERIAL
             })
 
-        dc.echo()
         self.addChannel(dc)
 
+#_______________________________________________________________________________
+    @classmethod
+    def computeGaitPhases(cls, steps, cycles, dutyFactors, stepOffsets):
+        """ Computes the gait phase values of any number of targets at once, each with its own
+            duty factor and step offset, returning an array with one row of values per target.
+            A value is 1.0 when the target is in contact with the ground and 0.0 otherwise.
+
+            steps :: Integer
+                The number of steps in the gait phase channels.
+
+            cycles :: Integer
+                The number of gait cycles spanned by the steps.
+
+            dutyFactors :: [Number]
+                The duty factor of each target.
+
+            stepOffsets :: [Integer]
+                The number of steps by which each target's phases are rotated, as returned by
+                the getStepOffset() method.
+
+            @return: numpy.ndarray """
+
+        steps       = int(steps)
+        cyclePhases = np.modf(np.arange(steps, dtype=float)*float(cycles)/float(steps))[0]
+        dutyFactors = np.asarray(dutyFactors, dtype=float)
+        phases      = (cyclePhases[np.newaxis, :] <= dutyFactors[:, np.newaxis]).astype(float)
+
+        # Rotate each row by its offset in the same way as numpy.roll
+        stepOffsets = np.asarray(stepOffsets, dtype=int)
+        columns = (np.arange(steps)[np.newaxis, :] - stepOffsets[:, np.newaxis]) % steps
+        return phases[np.arange(len(phases))[:, np.newaxis], columns]
+
+#_______________________________________________________________________________
+    @classmethod
+    def findGaitEvents(cls, phases):
+        """ Finds the step indexes of the lifts and lands within each row of gait phase values,
+            where the first step is compared with the last one as the gait is cyclic. Returns a
+            list with a (lifts, lands) tuple of index arrays for each row.
+
+            phases :: numpy.ndarray | [[Number]]
+                An array with one row of gait phase values per target.
+
+            @return: [(numpy.ndarray, numpy.ndarray)] """
+
+        phases  = np.asarray(phases, dtype=float)
+        changes = phases - np.roll(phases, 1, axis=1)
+        bounds  = np.arange(1, len(phases))
+
+        liftRows, liftSteps = np.nonzero(changes < 0)
+        landRows, landSteps = np.nonzero(changes > 0)
+        return list(zip(
+            np.split(liftSteps, np.searchsorted(liftRows, bounds)),
+            np.split(landSteps, np.searchsorted(landRows, bounds)) ))
+
 #===============================================================================
 #                                                                               P R O T E C T E D
 
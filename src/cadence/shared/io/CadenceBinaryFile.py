@@ -0,0 +1,347 @@
+# CadenceBinaryFile.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import json
+import os
+import struct
+
+import numpy as np
+
+from cadence.shared.enum.DataTypeEnum import DataTypeEnum
+from cadence.shared.enum.TangentsEnum import TangentsEnum
+from cadence.shared.io.channel.DataChannel import DataChannel
+from cadence.shared.io.channel.DataChannelKey import DataChannelKey
+from cadence.util.math3D.Vector3D import Vector3D
+
+#*************************************************************************************************** CadenceBinaryFile
+class CadenceBinaryFile(object):
+    """ Reads and writes the binary Cadence data format, which stores the keyframes of each channel
+        as typed arrays of times, values, tangent codes and event codes instead of the per-key
+        dictionaries of the JSON format.
+
+        The file begins with the MAGIC bytes and the length of a JSON header, which holds the name
+        and configs of the data and an index of its channels. Each channel entry in the index lists
+        the offset, dtype and shape of the channel's arrays, which follow the header aligned to
+        ALIGNMENT bytes and are read through a single read-only memory map. A channel's keys are
+        only created when that channel is requested.
+
+        Channels whose keys are not all scalar or all vector floats are stored as the keyframe
+        dictionaries of the JSON format within the header instead, so that every channel converts
+        losslessly between the two formats. """
+
+    MAGIC       = b'CADENCEB'
+    VERSION     = 1
+    EXTENSION   = '.cadenceb'
+    ALIGNMENT   = 16
+
+    # Tangent enums in the order of their codes within the tangent arrays
+    TANGENTS    = [
+        TangentsEnum.LINEAR,
+        TangentsEnum.SPLINE,
+        TangentsEnum.FAST,
+        TangentsEnum.SLOW,
+        TangentsEnum.FLAT,
+        TangentsEnum.STEPPED,
+        TangentsEnum.STEPPED_NEXT,
+        TangentsEnum.FIXED,
+        TangentsEnum.CLAMPED,
+        TangentsEnum.PLATEAU ]
+
+    _HEADER_STRUCT  = struct.Struct(str('<8sI'))
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def __init__(self, path):
+        """ Opens the binary Cadence data file at the specified path and reads its header. The
+            channel arrays are not read until they are requested.
+
+            [path] :: String
+                Absolute path to the binary Cadence data file. """
+
+        self._path = path
+
+        with open(path, 'rb') as f:
+            magic, size = self._HEADER_STRUCT.unpack(f.read(self._HEADER_STRUCT.size))
+            if magic != self.MAGIC:
+                raise ValueError('Not a binary Cadence data file: %s' % path)
+            self._header = json.loads(f.read(size).decode('utf-8'))
+
+        # The array offsets within the index are relative to the aligned end of the header
+        self._dataOffset = self._getPaddedSize(self._HEADER_STRUCT.size + size)
+        self._buffer     = None
+
+#===============================================================================
+#                                                                                   G E T / S E T
+
+#_______________________________________________________________________________
+    @property
+    def path(self):
+        return self._path
+
+#_______________________________________________________________________________
+    @property
+    def name(self):
+        return self._header.get('name')
+
+#_______________________________________________________________________________
+    @property
+    def configs(self):
+        """ The serialized configs dictionary of the data, or None if it had no configs. """
+        return self._header.get('configs')
+
+#_______________________________________________________________________________
+    @property
+    def index(self):
+        """ The list of channel entries within the header, each a dictionary with at least the
+            name, kind and target of the channel. """
+        return self._header['channels']
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def getArrays(self, index):
+        """ Returns a dictionary of the read-only arrays of the channel at the specified index
+            within the channel index, or None if the channel is stored as keyframe dictionaries.
+
+            @return: Dict """
+
+        entry = self.index[index]
+        if 'arrays' not in entry:
+            return None
+
+        if self._buffer is None:
+            self._buffer = np.memmap(self._path, dtype=np.uint8, mode='r')
+
+        out = dict()
+        for field, spec in entry['arrays'].items():
+            dtype = np.dtype(str(spec['dtype']))
+            shape = tuple(spec['shape'])
+            size  = int(np.prod(shape))*dtype.itemsize
+            start = self._dataOffset + spec['offset']
+            out[field] = self._buffer[start:start + size].view(dtype).reshape(shape)
+        return out
+
+#_______________________________________________________________________________
+    def createChannel(self, index):
+        """ Creates the DataChannel for the channel at the specified index within the channel
+            index from its arrays or keyframe dictionaries.
+
+            @return: DataChannel """
+
+        cls   = self.__class__
+        entry = self.index[index]
+
+        arrays = self.getArrays(index)
+        if arrays is None:
+            return DataChannel(
+                name=entry['name'],
+                kind=entry['kind'],
+                target=entry['target'],
+                keys=entry['keys'])
+
+        dataType    = entry['dataType']
+        events      = entry['events']
+        names       = entry['names']
+        times       = arrays['times'].tolist()
+        values      = arrays['values'].tolist()
+        inTangents  = arrays['inTangents'].tolist()
+        outTangents = arrays['outTangents'].tolist()
+        eventCodes  = arrays['events'].tolist()
+        nameCodes   = arrays['names'].tolist()
+
+        keys = []
+        for i in range(len(times)):
+            if dataType == DataTypeEnum.VECTOR:
+                value      = Vector3D(*values[i])
+                inTangent  = [cls.TANGENTS[code] for code in inTangents[i]]
+                outTangent = [cls.TANGENTS[code] for code in outTangents[i]]
+            else:
+                value      = values[i]
+                inTangent  = cls.TANGENTS[inTangents[i]]
+                outTangent = cls.TANGENTS[outTangents[i]]
+
+            keys.append(DataChannelKey(
+                name=names[nameCodes[i]],
+                event=events[eventCodes[i]],
+                time=times[i],
+                value=value,
+                dataType=dataType,
+                inTangent=inTangent,
+                outTangent=outTangent))
+
+        return DataChannel(
+            name=entry['name'],
+            kind=entry['kind'],
+            target=entry['target'],
+            keys=keys)
+
+#_______________________________________________________________________________
+    def close(self):
+        """ Releases the memory map of the channel arrays. Channels that have already been created
+            remain valid. """
+        self._buffer = None
+
+#_______________________________________________________________________________
+    @classmethod
+    def write(cls, path, channels, name =None, configs =None):
+        """ Writes the specified channels to a binary Cadence data file at the specified path.
+
+            [path] :: String
+                Absolute path of the file to write.
+
+            [channels] :: [DataChannel]
+                The channels to write, in order.
+
+            [name] :: String :: None
+                The name identifying the data.
+
+            [configs] :: Dict :: None
+                The serialized configs dictionary of the data. """
+
+        index  = []
+        arrays = []
+        offset = 0
+        for channel in channels:
+            entry = {'name':channel.name, 'kind':channel.kind, 'target':channel.target}
+            index.append(entry)
+
+            channelArrays = cls._createArrays(channel, entry)
+            if channelArrays is None:
+                entry['keys'] = [key.toDict() for key in channel.keys]
+                continue
+
+            entry['arrays'] = dict()
+            for field, array in channelArrays:
+                array = np.ascontiguousarray(array)
+                entry['arrays'][field] = {
+                    'offset':offset,
+                    'dtype':array.dtype.str,
+                    'shape':list(array.shape) }
+                arrays.append(array)
+                offset += cls._getPaddedSize(array.nbytes)
+
+        header = {'version':cls.VERSION, 'name':name, 'configs':configs, 'channels':index}
+        data   = json.dumps(header).encode('utf-8')
+        start  = cls._getPaddedSize(cls._HEADER_STRUCT.size + len(data))
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(path, 'wb') as f:
+            f.write(cls._HEADER_STRUCT.pack(cls.MAGIC, len(data)))
+            f.write(data)
+            f.write(b'\0'*(start - cls._HEADER_STRUCT.size - len(data)))
+            for array in arrays:
+                f.write(array.tobytes())
+                f.write(b'\0'*(cls._getPaddedSize(array.nbytes) - array.nbytes))
+
+        return True
+
+#_______________________________________________________________________________
+    @classmethod
+    def isBinaryFile(cls, path):
+        """ Whether or not the file at the specified path begins with the binary format's MAGIC
+            bytes. """
+
+        try:
+            with open(path, 'rb') as f:
+                return f.read(len(cls.MAGIC)) == cls.MAGIC
+        except Exception:
+            return False
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    @classmethod
+    def _createArrays(cls, channel, entry):
+        """ Returns a list of (field, array) tuples for the keys of the specified channel, adding
+            the data type and string tables of the channel to its index entry, or None if the keys
+            cannot be stored as typed arrays without loss. """
+
+        keys = channel.keys
+        if not keys:
+            return None
+
+        dataType = keys[0].dataType
+        if dataType not in [DataTypeEnum.SCALAR, DataTypeEnum.VECTOR]:
+            return None
+
+        times       = []
+        values      = []
+        inTangents  = []
+        outTangents = []
+        for key in keys:
+            if key.dataType != dataType or not cls._isFloat(key.time):
+                return None
+
+            if dataType == DataTypeEnum.VECTOR:
+                value = key.value.toList()
+                if not all([cls._isFloat(v) for v in value]):
+                    return None
+                inTangents.append([cls.TANGENTS.index(t) for t in key.inTangent])
+                outTangents.append([cls.TANGENTS.index(t) for t in key.outTangent])
+            else:
+                value = key.value
+                if not cls._isFloat(value):
+                    return None
+                inTangents.append(cls.TANGENTS.index(key.inTangent))
+                outTangents.append(cls.TANGENTS.index(key.outTangent))
+
+            times.append(key.time)
+            values.append(value)
+
+        # String tables for the optional key events and names, where code 0 is None
+        events = [None]
+        names  = [None]
+        eventCodes = [cls._getStringCode(events, key.event) for key in keys]
+        nameCodes  = [cls._getStringCode(names, key.name) for key in keys]
+        if len(events) > 256 or len(names) > 256:
+            return None
+
+        entry['dataType'] = dataType
+        entry['events']   = events
+        entry['names']    = names
+
+        return [
+            ('times', np.array(times, dtype='<f8')),
+            ('values', np.array(values, dtype='<f8')),
+            ('inTangents', np.array(inTangents, dtype=np.uint8)),
+            ('outTangents', np.array(outTangents, dtype=np.uint8)),
+            ('events', np.array(eventCodes, dtype=np.uint8)),
+            ('names', np.array(nameCodes, dtype=np.uint8)) ]
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getStringCode(cls, table, value):
+        if value not in table:
+            table.append(value)
+        return table.index(value)
+
+#_______________________________________________________________________________
+    @classmethod
+    def _isFloat(cls, value):
+        return isinstance(value, float)
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getPaddedSize(cls, size):
+        return size + (-size % cls.ALIGNMENT)
+
+#===============================================================================
+#                                                                               I N T R I N S I C
+
+#_______________________________________________________________________________
+    def __repr__(self):
+        return self.__str__()
+
+#_______________________________________________________________________________
+    def __str__(self):
+        return '<%s %s>' % (self.__class__.__name__, self._path)
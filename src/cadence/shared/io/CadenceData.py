@@ -6,12 +6,14 @@ from __future__ import print_function, absolute_import, unicode_literals, divisi
 
 import os
 import json
+from collections import namedtuple
 
 from pyaid.ArgsUtils import ArgsUtils
 from pyaid.dict.DictUtils import DictUtils
 from pyaid.string.StringUtils import StringUtils
 
 from cadence.config.ConfigReader import ConfigReader
+from cadence.shared.io.CadenceBinaryFile import CadenceBinaryFile
 from cadence.shared.io.channel.DataChannel import DataChannel
 
 
@@ -24,6 +26,7 @@ class CadenceData(object):
 
     VERSION         = 1
     EXTENSION       = '.cadence'
+    BINARY_EXTENSION = CadenceBinaryFile.EXTENSION
 
     ROOT_DATA_PATH  = os.path.abspath(os.path.dirname(__file__)).split('src')[0] + 'data' + os.sep
 
@@ -31,6 +34,9 @@ class CadenceData(object):
     _NAME_KEY       = 'name'
     _CHANNELS_KEY   = 'channels'
 
+    # Placeholder for a channel of a binary file that has not yet been loaded
+    _LAZY_CHANNEL_NTUPLE = namedtuple('LAZY_CHANNEL_NTUPLE', ['source', 'index'])
+
 #_______________________________________________________________________________
     def __init__(self, **kwargs):
         """ Creates a new instance of CadenceData.
@@ -68,6 +74,8 @@ class CadenceData(object):
     @property
     def channels(self):
         """Data keyframe channels in the created/loaded dataset."""
+        for i in range(len(self._channels)):
+            self._getChannel(i)
         return self._channels
 
 #===============================================================================
@@ -86,9 +94,8 @@ class CadenceData(object):
 
 #_______________________________________________________________________________
     def getChannelByName(self, name):
-        for c in self._channels:
-            if c.name == name:
-                return c
+        for c in self._findChannels(name=name):
+            return c
 
         return None
 
@@ -103,29 +110,16 @@ class CadenceData(object):
         if not target:
             return self.getChannelsByKind(kind)
 
-        out = []
-        for c in self._channels:
-            if c.kind == kind and c.target == target:
-                out.append(c)
-
-        return out
+        return list(self._findChannels(kind=kind, target=target))
 
 #_______________________________________________________________________________
     def getChannelsByKind(self, kind):
-        out = []
-        for c in self._channels:
-            if c.kind == kind:
-                out.append(c)
-
+        out = list(self._findChannels(kind=kind))
         return out if out else None
 
 #_______________________________________________________________________________
     def getChannelsByTarget(self, target):
-        out = []
-        for c in self._channels:
-            if c.target == target:
-                out.append(c)
-
+        out = list(self._findChannels(target=target))
         return out if out else None
 
 #_______________________________________________________________________________
@@ -158,7 +152,7 @@ class CadenceData(object):
         """
 
         sourcePath = path
-        if not sourcePath.endswith(CadenceData.EXTENSION):
+        if not sourcePath.endswith((CadenceData.EXTENSION, CadenceData.BINARY_EXTENSION)):
             sourcePath += CadenceData.EXTENSION
 
         if not os.path.exists(sourcePath):
@@ -167,6 +161,9 @@ class CadenceData(object):
                 print('FAILED: Unable to load Cadence data from missing file ' + path)
                 return False
 
+        if CadenceBinaryFile.isBinaryFile(sourcePath):
+            return self.loadBinaryFile(sourcePath)
+
         try:
             f    = open(sourcePath, 'r')
             data = f.read()
@@ -177,6 +174,36 @@ class CadenceData(object):
 
         return self.load(data)
 
+#_______________________________________________________________________________
+    def loadBinaryFile(self, path):
+        """ Loads the name, configs and channel index of a binary Cadence data file, which is
+            written by the writeBinary method. The keys of each channel are not loaded until the
+            channel is first requested.
+
+            @@@param path:string
+                Absolute path to the binary Cadence data file to open.
+
+            @@@return bool
+                True if the load was successful, False otherwise.
+        """
+
+        try:
+            source = CadenceBinaryFile(path)
+        except Exception as err:
+            print('FAILED: Unable to load binary Cadence data from file ' + path, err)
+            return False
+
+        if source.name:
+            self._name = source.name
+
+        if source.configs:
+            self._configs = ConfigReader.fromDict(source.configs)
+
+        for i in range(len(source.index)):
+            self._channels.append(CadenceData._LAZY_CHANNEL_NTUPLE(source=source, index=i))
+
+        return True
+
 #_______________________________________________________________________________
     def load(self, data):
         """ Loads the data into the CadenceData instance, parsing if necessary beforehand.
@@ -235,7 +262,7 @@ class CadenceData(object):
 
         if self._channels:
             channels = []
-            for c in self._channels:
+            for c in self.channels:
                 channels.append(c.toDict())
             data['channels'] = channels
 
@@ -246,17 +273,8 @@ class CadenceData(object):
             return None
 
         if folder:
-            name = name if name else (self._name if self._name else 'data')
-            if not name.endswith(CadenceData.EXTENSION):
-                name += CadenceData.EXTENSION
-            path = os.path.join(CadenceData.ROOT_DATA_PATH, folder, name)
-            outDir = os.path.dirname(path)
-
-            try:
-                if not os.path.exists(outDir):
-                    os.makedirs(outDir)
-            except Exception as err:
-                print('FAILED: Unable to create output directory: ' + str(outDir))
+            path = self._getOutputPath(folder, name, CadenceData.EXTENSION)
+            if not path:
                 return None
 
             try:
@@ -267,3 +285,88 @@ class CadenceData(object):
                 print('FAILED: Writing Cadence file.', err)
 
         return data
+
+#_______________________________________________________________________________
+    def writeBinary(self, folder, name =None):
+        """ Writes the Cadence data to a binary file, which stores the keys of each channel as
+            typed arrays that are loaded lazily by the loadBinaryFile method. The binary file
+            converts losslessly to and from the JSON file written by the write method. Returns the
+            path of the written file, or None if the writing process fails.
+
+            @@@param folder:string
+                The folder where the file should be written relative to Cadence's root data
+                directory.
+
+            @@@param name:string
+                If specified this value will override the CadenceData instance's name for the
+                file to be written.
+        """
+
+        path = self._getOutputPath(folder, name, CadenceData.BINARY_EXTENSION)
+        if not path:
+            return None
+
+        try:
+            CadenceBinaryFile.write(
+                path,
+                self.channels,
+                name=self._name,
+                configs=self._configs.toDict() if self._configs else None)
+        except Exception as err:
+            print('FAILED: Writing binary Cadence file.', err)
+            return None
+
+        return path
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _getChannel(self, index):
+        """ Returns the channel at the specified index, loading it first if it is a channel of a
+            binary file that has not yet been loaded. """
+
+        c = self._channels[index]
+        if isinstance(c, CadenceData._LAZY_CHANNEL_NTUPLE):
+            c = c.source.createChannel(c.index)
+            self._channels[index] = c
+        return c
+
+#_______________________________________________________________________________
+    def _findChannels(self, name =None, kind =None, target =None):
+        """ Yields the channels matching each of the specified name, kind and target values,
+            which are compared against the binary file's channel index for channels that have not
+            yet been loaded so that only the matching channels are loaded. """
+
+        for i, c in enumerate(self._channels):
+            info = c.source.index[c.index] \
+                if isinstance(c, CadenceData._LAZY_CHANNEL_NTUPLE) \
+                else {'name':c.name, 'kind':c.kind, 'target':c.target}
+
+            if name is not None and info['name'] != name:
+                continue
+            if kind is not None and info['kind'] != kind:
+                continue
+            if target is not None and info['target'] != target:
+                continue
+            yield self._getChannel(i)
+
+#_______________________________________________________________________________
+    def _getOutputPath(self, folder, name, extension):
+        """ Returns the path of a file to be written within the folder, relative to Cadence's
+            root data folder, creating the folder if it does not exist. """
+
+        name = name if name else (self._name if self._name else 'data')
+        if not name.endswith(extension):
+            name += extension
+        path = os.path.join(CadenceData.ROOT_DATA_PATH, folder, name)
+        outDir = os.path.dirname(path)
+
+        try:
+            if not os.path.exists(outDir):
+                os.makedirs(outDir)
+        except Exception as err:
+            print('FAILED: Unable to create output directory: ' + str(outDir))
+            return None
+
+        return path
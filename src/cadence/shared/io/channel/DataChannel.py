@@ -4,15 +4,24 @@
 
 from __future__ import print_function, absolute_import, unicode_literals, division
 
+import bisect
+
+import numpy as np
 from pyaid.ArgsUtils import ArgsUtils
 from pyaid.string.StringUtils import StringUtils
 
+from cadence.shared.enum.DataTypeEnum import DataTypeEnum
+from cadence.shared.enum.TangentsEnum import TangentsEnum
 from cadence.shared.io.channel.DataChannelKey import DataChannelKey
 
 #_______________________________________________________________________________
 class DataChannel(object):
     """A class for..."""
 
+    _STEPPED_SAMPLING      = 0
+    _STEPPED_NEXT_SAMPLING = 1
+    _LINEAR_SAMPLING       = 2
+
 #===============================================================================
 #                                                                                       C L A S S
 
@@ -32,7 +41,7 @@ class DataChannel(object):
         if not self._keys:
             self.addKeysFromLists(**kwargs)
 
-        self._clearCache()
+        self._sortKeys()
 
 #===============================================================================
 #                                                                                   G E T / S E T
@@ -73,13 +82,8 @@ class DataChannel(object):
 #_______________________________________________________________________________
     @property
     def times(self):
-        """Data keyframes in the created/loaded dataset."""
-        if self._times is None:
-            out = []
-            for k in self._keys:
-                out.append(k.time)
-            self._times = out
-
+        """ The sorted times of the keyframes in the created/loaded dataset, which are also used
+            to locate keyframes by binary search. """
         return self._times
 
 #_______________________________________________________________________________
@@ -123,8 +127,6 @@ class DataChannel(object):
 
 #_______________________________________________________________________________
     def addKeysFromLists(self, **kwargs):
-        self._clearCache()
-
         x = ArgsUtils.get('times', None, kwargs)
         if not x:
             return
@@ -150,28 +152,90 @@ class DataChannel(object):
                 inTangent=inTans if StringUtils.isStringType(inTans) else inTans[i],
                 outTangent=outTans if StringUtils.isStringType(outTans) else outTans[i] ))
 
+        self._sortKeys()
+
 #_______________________________________________________________________________
     def addKeyframe(self, keyframe):
-        self._clearCache()
+        """ Inserts the keyframe after any existing keyframes with the same or earlier times. The
+            insertion point is found by binary search and any cached keyframe lists are updated
+            in place, so building a channel one keyframe at a time remains fast. """
 
         if not isinstance(keyframe, DataChannelKey):
             keyframe = DataChannelKey.fromDict(keyframe)
 
-        if not self._keys:
-            self._keys.append(keyframe)
-            return True
-
-        index = 0
-        for k in self._keys:
-            if k.time <= keyframe.time:
-                index += 1
-                continue
+        index = bisect.bisect_right(self._times, keyframe.time)
+        self._keys.insert(index, keyframe)
+        self._times.insert(index, keyframe.time)
+
+        if self._values is not None:
+            self._values.insert(index, keyframe.value)
+        if self._inTangents is not None:
+            self._inTangents.insert(index, keyframe.inTangent)
+        if self._outTangents is not None:
+            self._outTangents.insert(index, keyframe.outTangent)
+        self._samplingData = None
+        return True
 
-            self._keys.insert(index, keyframe)
-            return True
+#_______________________________________________________________________________
+    def getKeyIndex(self, time):
+        """ Returns the index of the last keyframe at or before the specified time, or -1 if the
+            time precedes every keyframe. """
+        return bisect.bisect_right(self._times, time) - 1
 
-        self._keys.append(keyframe)
-        return True
+#_______________________________________________________________________________
+    def sample(self, times, mode =None):
+        """ Samples the channel at each of the specified times in a single vectorized operation
+            and returns the sampled values as a NumPy array. Scalar channels return an array with
+            one value per time, vector channels an array with one row of x, y and z values per
+            time. Times before the first or after the last keyframe take the value of that
+            keyframe.
+
+            times :: [Number] | numpy.ndarray
+                The times at which to sample the channel.
+
+            [mode] :: String :: None
+                How values are interpolated between keyframes. TangentsEnum.STEPPED holds the
+                value of the previous keyframe, TangentsEnum.STEPPED_NEXT takes the value of the
+                next keyframe and TangentsEnum.LINEAR interpolates linearly. If not specified,
+                the out tangent of the previous keyframe determines the interpolation of each
+                interval, where tangents other than stepped ones are treated as linear. Enum and
+                arbitrary channels can only be stepped.
+
+            @return: numpy.ndarray """
+
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        if not self._keys:
+            return np.zeros(times.shape)
+
+        keyTimes, values, modes = self._getSamplingData()
+        last = len(keyTimes) - 1
+
+        # The previous and next keyframe indexes of each sample time, clipped to the key range
+        before = np.clip(np.searchsorted(keyTimes, times, side='right') - 1, 0, last)
+        after = np.clip(np.searchsorted(keyTimes, times, side='left'), 0, last)
+
+        if mode is not None:
+            modes = np.full(modes.shape, self._getSamplingMode(mode), dtype=int)
+        modes = modes[before]
+
+        stepped = values[before]
+        steppedNext = values[after]
+        if values.dtype == object:
+            modes = np.where(modes == self._LINEAR_SAMPLING, self._STEPPED_SAMPLING, modes)
+            return np.where(modes == self._STEPPED_NEXT_SAMPLING, steppedNext, stepped)
+
+        spans = keyTimes[after] - keyTimes[before]
+        fractions = np.zeros(times.shape)
+        valid = spans > 0
+        fractions[valid] = (times[valid] - keyTimes[before][valid])/spans[valid]
+        if values.ndim > 1:
+            fractions = fractions[:, np.newaxis]
+        linear = stepped + fractions*(steppedNext - stepped)
+
+        return np.where(
+            modes == self._LINEAR_SAMPLING,
+            linear,
+            np.where(modes == self._STEPPED_NEXT_SAMPLING, steppedNext, stepped))
 
 #_______________________________________________________________________________
     def echo(self):
@@ -233,10 +297,53 @@ class DataChannel(object):
 
 #_______________________________________________________________________________
     def _clearCache(self):
-        self._times         = None
+        self._times         = [k.time for k in self._keys]
         self._values        = None
         self._inTangents    = None
         self._outTangents   = None
+        self._samplingData  = None
+
+#_______________________________________________________________________________
+    def _sortKeys(self):
+        """ Orders the keys by time, keeping keys with equal times in their existing order, and
+            resets the cached keyframe lists. """
+
+        self._keys.sort(key=lambda k: k.time)
+        self._clearCache()
+
+#_______________________________________________________________________________
+    def _getSamplingData(self):
+        """ Returns the cached arrays of keyframe times, values and sampling modes used by the
+            sample() method, which are created on demand after the keyframes change. """
+
+        if self._samplingData is not None:
+            return self._samplingData
+
+        dataType = self._keys[0].dataType
+        if dataType == DataTypeEnum.VECTOR:
+            values = np.array([k.value.toList() for k in self._keys], dtype=float)
+            modes = np.array(
+                [[self._getSamplingMode(t) for t in k.outTangent] for k in self._keys], dtype=int)
+        else:
+            # Filled one at a time so that list values are not expanded into extra dimensions
+            values = np.empty(len(self._keys), dtype=object)
+            for index, key in enumerate(self._keys):
+                values[index] = key.value
+            if dataType == DataTypeEnum.SCALAR:
+                values = values.astype(float)
+            modes = np.array([self._getSamplingMode(k.outTangent) for k in self._keys], dtype=int)
+
+        self._samplingData = (np.array(self._times, dtype=float), values, modes)
+        return self._samplingData
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getSamplingMode(cls, tangent):
+        if tangent == TangentsEnum.STEPPED:
+            return cls._STEPPED_SAMPLING
+        elif tangent == TangentsEnum.STEPPED_NEXT:
+            return cls._STEPPED_NEXT_SAMPLING
+        return cls._LINEAR_SAMPLING
 
 #_______________________________________________________________________________
     def _createKeys(self, src):
@@ -14,6 +14,9 @@ from pyaid.file.FileUtils import FileUtils
 from pyaid.system.SystemUtils import SystemUtils
 from pyaid.OsUtils import OsUtils
 
+from cadence.svg.SvgRenderService import SvgRenderService
+from cadence.svg.SvgStreamDrawing import SvgStreamDrawing
+
 #_______________________________________________________________________________
 class CadenceDrawing(object):
     """ A class for writing Scalable Vector Graphics (SVG) files, tailored to create overlays for
@@ -92,9 +95,13 @@ class CadenceDrawing(object):
             and others result in objects being added to the SVG canvas, with the file written by the
             save() method to specified fileName.  The second argument, the siteMap is provided as an
             argument to establish the correspondence between the Maya scene and the site siteMap
-            coordinates. """
+            coordinates. If a renderService kwarg is specified, the PDF conversion is submitted
+            to that SvgRenderService instance instead of being run during the call to save(). If
+            the streaming kwarg is True, elements are written to disk as they are added using an
+            SvgStreamDrawing, which keeps memory use flat for drawings with many elements. """
 
         self._logger = kwargs.get('logger')
+        self._renderService = kwargs.get('renderService')
         if not self._logger:
             self._logger = Logger(self, printOut=True)
 
@@ -124,7 +131,8 @@ class CadenceDrawing(object):
         width  = siteMap.width*mm
         height = siteMap.height*mm
 
-        self._drawing = svgwrite.Drawing(
+        DrawingClass = SvgStreamDrawing if kwargs.get('streaming') else svgwrite.Drawing
+        self._drawing = DrawingClass(
             fileName,
             profile='tiny',
             size=(width, height),
@@ -561,7 +569,8 @@ class CadenceDrawing(object):
     def save(self, toPDF=True):
         """ Writes the current _drawing in SVG format to the file specified at initialization. If
             one wishes to have create a PDF file (same file name as used for the .SVG, but with
-            suffix .PDF), then call with toPDF True). """
+            suffix .PDF), then call with toPDF True). When the drawing was created with a render
+            service, the PDF file is created asynchronously by that service. """
 
         if not self.siteMapReady:
             return
@@ -578,15 +587,16 @@ class CadenceDrawing(object):
         # strip any extension off of the file name
         basicName = self.fileName.split('.')[0]
 
+        # hand off the conversion to the render service, if one was specified, to continue
+        # without waiting for the renderer
+        if self._renderService:
+            self._renderService.submit(basicName + '.svg', basicName + '.pdf')
+            return
+
         # load up the command
         cmd = [
-            '/Applications/Inkscape.app/Contents/Resources/bin/inkscape',
-            '-f',
-            None,
-            '-A',
-            None]
-        cmd[2] = basicName + '.svg'
-        cmd[4] = basicName + '.pdf'
+            a.replace('{svg}', basicName + '.svg').replace('{pdf}', basicName + '.pdf')
+            for a in SvgRenderService.DEFAULT_COMMAND]
 
         # and execute it
         response = SystemUtils.executeCommand(cmd)
@@ -0,0 +1,283 @@
+# SvgRenderService.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import hashlib
+import os
+import shutil
+import subprocess
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    # noinspection PyUnresolvedReferences
+    import Queue as queue
+
+#*************************************************************************************************** SvgRenderService
+class SvgRenderService(object):
+    """ Converts saved SVG files into PDF files in a bounded pool of worker threads, so that
+        analysis can continue while the external renderer runs. SVG files with identical content
+        are only rendered once, with the PDF copied to the other destinations. Call wait() to block
+        until every submitted conversion has finished and to report the render latency of each
+        file. """
+
+    # The default renderer command, where {svg} and {pdf} are replaced by the source and
+    # destination paths of each conversion
+    DEFAULT_COMMAND = [
+        '/Applications/Inkscape.app/Contents/Resources/bin/inkscape',
+        '-f', '{svg}',
+        '-A', '{pdf}']
+
+    DEFAULT_WORKER_COUNT = 2
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def __init__(self, command =None, workerCount =None, logger =None):
+        """ Creates a new instance of SvgRenderService.
+
+            [command] :: [String] :: None
+                The renderer command as a list of arguments in which the {svg} and {pdf}
+                placeholders are replaced by the source and destination paths. Any executable that
+                writes the PDF file, like a local stub in place of Inkscape, can be used. If not
+                specified the DEFAULT_COMMAND is used.
+
+            [workerCount] :: Integer :: None
+                The maximum number of conversions run at the same time. If not specified the
+                DEFAULT_WORKER_COUNT is used.
+
+            [logger] :: Logger :: None
+                If specified, the outcome and latency of each conversion is written to this logger
+                when wait() is called. """
+
+        self._command     = list(command) if command else list(self.DEFAULT_COMMAND)
+        self._workerCount = max(1, int(workerCount or self.DEFAULT_WORKER_COUNT))
+        self._logger      = logger
+        self._queue       = queue.Queue()
+        self._lock        = threading.Lock()
+        self._workers     = []
+        self._renders     = dict()
+        self._results     = []
+
+#===============================================================================
+#                                                                                   G E T / S E T
+
+#_______________________________________________________________________________
+    @property
+    def command(self):
+        return self._command
+
+#_______________________________________________________________________________
+    @property
+    def workerCount(self):
+        return self._workerCount
+
+#_______________________________________________________________________________
+    @property
+    def pendingCount(self):
+        """ The number of submitted conversions that have not yet finished. """
+        with self._lock:
+            return len([r for r in self._results if r['finished'] is None])
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def submit(self, svgPath, pdfPath =None):
+        """ Queues the conversion of the specified SVG file into a PDF file and returns immediately.
+            If an SVG file with identical content has already been submitted, it is not rendered
+            again. Instead the PDF file of that render is copied to the destination path when it
+            becomes available.
+
+            svgPath :: String
+                The absolute path of the saved SVG file to render.
+
+            [pdfPath] :: String :: None
+                The absolute path of the PDF file to create. If not specified, the SVG path with a
+                .pdf extension is used.
+
+            @return: Dict
+                The result record for the conversion, which is completed by the worker threads. """
+
+        if not pdfPath:
+            pdfPath = os.path.splitext(svgPath)[0] + '.pdf'
+
+        with open(svgPath, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+
+        result = dict(
+            svgPath=svgPath,
+            pdfPath=pdfPath,
+            digest=digest,
+            source=None,
+            submitted=time.time(),
+            started=None,
+            finished=None,
+            error=None)
+
+        with self._lock:
+            self._results.append(result)
+            primary = self._renders.get(digest)
+            if primary is None:
+                self._renders[digest] = result
+                result['duplicates'] = []
+            elif primary['finished'] is None:
+                # Copied by the worker thread once the primary render finishes
+                primary['duplicates'].append(result)
+                return result
+
+        if primary is None:
+            self._startWorkers()
+            self._queue.put(result)
+        else:
+            self._copyRender(primary, result)
+        return result
+
+#_______________________________________________________________________________
+    def wait(self):
+        """ Blocks until every submitted conversion has finished, then writes the outcome and
+            latency of each conversion to the logger, if one was specified.
+
+            @return: List
+                The result records of the conversions submitted since the last call to wait(),
+                where the renderTime and queueTime keys hold the latencies in seconds. """
+
+        if self._workers:
+            self._queue.join()
+
+        with self._lock:
+            results = self._results
+            self._results = []
+
+        for result in results:
+            result['renderTime'] = result['finished'] - result['started']
+            result['queueTime'] = result['started'] - result['submitted']
+
+        if self._logger and results:
+            self._logger.write(self.createReport(results))
+        return results
+
+#_______________________________________________________________________________
+    def close(self):
+        """ Waits for all remaining conversions before stopping the worker threads.
+
+            @return: List """
+
+        results = self.wait()
+        for worker in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        self._renders = dict()
+        return results
+
+#_______________________________________________________________________________
+    @classmethod
+    def createReport(cls, results):
+        """ Creates a list of log lines describing the outcome and latency of each of the specified
+            result records returned by the wait() method. """
+
+        out = ['[SVG RENDERS]: %s files' % len(results)]
+        for result in results:
+            name = os.path.basename(result['pdfPath'])
+            if result['error']:
+                out.append('  [FAILED] %s: %s' % (name, result['error']))
+            elif result['source']:
+                out.append('  [DUPLICATE] %s: copied from %s' % (
+                    name, os.path.basename(result['source'])))
+            else:
+                out.append('  [RENDERED] %s: %.3fs render, %.3fs queued' % (
+                    name, result['renderTime'], result['queueTime']))
+        return out
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _startWorkers(self):
+        """ Starts another worker thread, up to the worker count, for each render submitted. """
+
+        with self._lock:
+            if len(self._workers) >= self._workerCount:
+                return
+            worker = threading.Thread(target=self._runWorker)
+            worker.daemon = True
+            self._workers.append(worker)
+        worker.start()
+
+#_______________________________________________________________________________
+    def _runWorker(self):
+        while True:
+            result = self._queue.get()
+            if result is None:
+                self._queue.task_done()
+                return
+
+            try:
+                self._render(result)
+            finally:
+                with self._lock:
+                    duplicates = result['duplicates']
+                    result['duplicates'] = []
+
+                for duplicate in duplicates:
+                    self._copyRender(result, duplicate)
+                self._queue.task_done()
+
+#_______________________________________________________________________________
+    def _render(self, result):
+        """ Runs the renderer command for the specified result record. """
+
+        result['started'] = time.time()
+        cmd = [
+            a.replace('{svg}', result['svgPath']).replace('{pdf}', result['pdfPath'])
+            for a in self._command]
+
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            out, error = process.communicate()
+            if process.returncode:
+                result['error'] = error.decode('utf-8', 'replace').strip() or \
+                    'Renderer exited with code %s' % process.returncode
+            elif not os.path.exists(result['pdfPath']):
+                result['error'] = 'Renderer did not create the PDF file'
+        except Exception as err:
+            result['error'] = str(err)
+
+        result['finished'] = time.time()
+
+#_______________________________________________________________________________
+    @classmethod
+    def _copyRender(cls, primary, result):
+        """ Completes the specified duplicate result record by copying the PDF file rendered for
+            the primary result record with the same content. """
+
+        result['started'] = time.time()
+        result['source'] = primary['pdfPath']
+
+        if primary['error']:
+            result['error'] = primary['error']
+        elif result['pdfPath'] != primary['pdfPath']:
+            try:
+                shutil.copyfile(primary['pdfPath'], result['pdfPath'])
+            except Exception as err:
+                result['error'] = str(err)
+
+        result['finished'] = time.time()
+
+#===============================================================================
+#                                                                               I N T R I N S I C
+
+#_______________________________________________________________________________
+    def __repr__(self):
+        return self.__str__()
+
+#_______________________________________________________________________________
+    def __str__(self):
+        return '<%s>' % self.__class__.__name__
@@ -0,0 +1,136 @@
+# SvgStreamDrawing.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import codecs
+import io
+import tempfile
+
+import svgwrite
+
+#*************************************************************************************************** SvgStreamDrawing
+class SvgStreamDrawing(svgwrite.Drawing):
+    """ An svgwrite.Drawing that serializes each element as soon as it is added to the drawing,
+        instead of keeping every element in memory until the drawing is saved. The serialized
+        elements are streamed to a temporary file that is copied into the output file on save.
+
+        Only the defs container, which holds the reusable groups instanced by <use> elements, is
+        kept in memory because groups are added to after they are created. Elements must therefore
+        be complete when they are added to the drawing, as any later changes to them are not
+        written. The saved file is byte-identical to the one the svgwrite.Drawing would write. """
+
+    # Size in bytes of the blocks in which the streamed elements are copied into the output file
+    CHUNK_SIZE = 1 << 16
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def __init__(self, filename ='noname.svg', size =('100%', '100%'), **extra):
+        """ Creates a new instance of SvgStreamDrawing with the same arguments as the
+            svgwrite.Drawing class. """
+
+        self._stream = None
+        self._count  = 0
+        super(SvgStreamDrawing, self).__init__(filename, size=size, **extra)
+
+#===============================================================================
+#                                                                                   G E T / S E T
+
+#_______________________________________________________________________________
+    @property
+    def streamedCount(self):
+        """ The number of elements that have been written to the stream. """
+        return self._count
+
+#===============================================================================
+#                                                                                     P U B L I C
+
+#_______________________________________________________________________________
+    def add(self, element):
+        """ Serializes the specified element to the stream. The defs container is added to the
+            drawing as usual. """
+
+        if element is getattr(self, 'defs', None):
+            return super(SvgStreamDrawing, self).add(element)
+
+        if self._stream is None:
+            self._stream = tempfile.TemporaryFile()
+
+        self._stream.write(element.tostring().encode('utf-8'))
+        self._count += 1
+        return element
+
+#_______________________________________________________________________________
+    def write(self, fileobj):
+        """ Writes the XML header, the drawing with its defs and then the streamed elements to the
+            specified file-like object opened in text mode. """
+
+        # Decoded incrementally as chunks of the stream can split multi-byte characters
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        for chunk in self._iterChunks():
+            fileobj.write(decoder.decode(chunk))
+        fileobj.write(decoder.decode(b'', final=True))
+
+#_______________________________________________________________________________
+    def save(self):
+        """ Writes the drawing to the filename specified at creation. The streamed elements remain
+            available so the drawing can be added to and saved again. """
+
+        with io.open(self.filename, mode='wb') as f:
+            for chunk in self._iterChunks():
+                f.write(chunk)
+
+#_______________________________________________________________________________
+    def close(self):
+        """ Removes the temporary stream file. No elements can be added or saved afterwards. """
+
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _iterChunks(self):
+        """ Yields the encoded contents of the SVG file in order. The drawing is serialized with
+            only its defs as children, which is split before the closing svg tag so that the
+            streamed elements follow the defs exactly as they would in the svgwrite output. """
+
+        header = io.StringIO()
+        super(SvgStreamDrawing, self).write(header)
+        header = header.getvalue()
+
+        closing = '</%s>' % self.elementname
+        index = header.rfind(closing)
+        yield header[:index].encode('utf-8')
+
+        if self._stream is not None:
+            self._stream.flush()
+            self._stream.seek(0)
+            while True:
+                chunk = self._stream.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+            self._stream.seek(0, io.SEEK_END)
+
+        yield header[index:].encode('utf-8')
+
+#===============================================================================
+#                                                                               I N T R I N S I C
+
+#_______________________________________________________________________________
+    def __del__(self):
+        self.close()
+
+#_______________________________________________________________________________
+    def __repr__(self):
+        return self.__str__()
+
+#_______________________________________________________________________________
+    def __str__(self):
+        return '<%s>' % self.__class__.__name__
@@ -0,0 +1,146 @@
+# TrackQueryUtils.py
+# (C)2016
+# Scott Ernst
+
+from __future__ import\
+    print_function, absolute_import, unicode_literals, division
+
+import itertools
+import sqlite3
+from collections import OrderedDict
+
+import sqlalchemy as sqla
+
+#_______________________________________________________________________________
+class TrackQueryUtils(object):
+    """ Query support for the TrackwayManager, which loads the track model
+        instances for long lists of uids and the distinct values of track
+        columns.
+
+        Uid lists are queried with IN clauses in chunks sized to the number of
+        bound variables the database allows in a single statement. Lists longer
+        than TEMP_TABLE_THRESHOLD are instead inserted into a temporary table
+        that is joined to the track table, so that the uids are matched in one
+        query. Temporary tables are private to the session's connection and
+        each is given a unique name, so concurrent sessions can query
+        independently. """
+
+#===============================================================================
+#                                                                      C L A S S
+
+    # SQLite's default SQLITE_MAX_VARIABLE_NUMBER before and after version 3.32
+    SQLITE_VARIABLE_LIMIT        = 999
+    SQLITE_VARIABLE_LIMIT_3_32   = 32766
+
+    # Used for databases other than SQLite
+    DEFAULT_VARIABLE_LIMIT       = 999
+
+    # Bound variables left free in each chunk for the query's other filters
+    RESERVED_VARIABLE_COUNT      = 32
+
+    # Uid lists longer than this are matched by joining a temporary table
+    TEMP_TABLE_THRESHOLD         = 5000
+
+    _TEMP_TABLE_INDEX = itertools.count()
+
+#===============================================================================
+#                                                                    P U B L I C
+#
+#_______________________________________________________________________________
+    @classmethod
+    def getVariableLimit(cls, session):
+        """ Returns the maximum number of bound variables allowed in a single
+            statement by the database of the specified session. """
+
+        if session.get_bind().dialect.name != 'sqlite':
+            return cls.DEFAULT_VARIABLE_LIMIT
+
+        # Python 3.11 and later can read the limit of the connection itself
+        try:
+            dbapi = session.connection().connection
+            dbapi = getattr(dbapi, 'dbapi_connection', dbapi)
+            return dbapi.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        except Exception:
+            pass
+
+        if sqlite3.sqlite_version_info >= (3, 32, 0):
+            return cls.SQLITE_VARIABLE_LIMIT_3_32
+        return cls.SQLITE_VARIABLE_LIMIT
+
+#_______________________________________________________________________________
+    @classmethod
+    def getChunkSize(cls, session):
+        """ Returns the number of uids to include in each IN clause for the
+            database of the specified session. """
+
+        return max(
+            1, cls.getVariableLimit(session) - cls.RESERVED_VARIABLE_COUNT)
+
+#_______________________________________________________________________________
+    @classmethod
+    def queryByUids(cls, session, model, uidList, *filters):
+        """ Returns a list of the instances of the specified model with uids in
+            the uid list that also match each of the specified filters. The
+            instances are returned in database order within each chunk of
+            uids, so callers that need a particular order should sort them.
+
+            session:    The session in which to run the query.
+            model:      The model class to query, which must have a uid column.
+            uidList:    The list of uids to match.
+            filters:    Additional filter criteria for the query. """
+
+        # remove duplicate uids while keeping the order of the uid list
+        uids = list(OrderedDict.fromkeys(uidList))
+        if not uids:
+            return list()
+
+        if len(uids) > cls.TEMP_TABLE_THRESHOLD:
+            return cls._queryByTempTable(session, model, uids, *filters)
+
+        size = cls.getChunkSize(session)
+        out  = list()
+        for i in range(0, len(uids), size):
+            query = session.query(model).filter(model.uid.in_(uids[i:i + size]))
+            for criterion in filters:
+                query = query.filter(criterion)
+            out += query.all()
+        return out
+
+#_______________________________________________________________________________
+    @classmethod
+    def queryDistinct(cls, session, columns, *filters):
+        """ Returns a sorted list of the distinct value tuples of the specified
+            columns for the rows that match each of the specified filters. The
+            rows are never loaded as model instances. """
+
+        query = session.query(*columns)
+        for criterion in filters:
+            query = query.filter(criterion)
+        return sorted([tuple(row) for row in query.distinct().all()])
+
+#===============================================================================
+#                                                                 P R I V A T E
+#
+#_______________________________________________________________________________
+    @classmethod
+    def _queryByTempTable(cls, session, model, uids, *filters):
+        """ Inserts the uids into a temporary table on the session's connection
+            and returns the model instances matched by joining that table. """
+
+        table = sqla.Table(
+            '_track_query_uids_%s' % next(cls._TEMP_TABLE_INDEX),
+            sqla.MetaData(),
+            sqla.Column('uid', sqla.Unicode, primary_key=True),
+            prefixes=['TEMPORARY'])
+
+        connection = session.connection()
+        table.create(bind=connection)
+        try:
+            connection.execute(table.insert(), [{'uid':uid} for uid in uids])
+
+            query = session.query(model).join(table, table.c.uid == model.uid)
+            for criterion in filters:
+                query = query.filter(criterion)
+            return query.all()
+        finally:
+            table.drop(bind=connection)
@@ -14,12 +14,15 @@ from cadence.enums.SourceFlagsEnum import SourceFlagsEnum
 from cadence.models.tracks.Tracks_Track import Tracks_Track
 from cadence.models.tracks.Tracks_SiteMap import Tracks_SiteMap
 from cadence.util.maya.MayaUtils import MayaUtils
+from cadence.views.tools.trackwayManager.TrackQueryUtils import TrackQueryUtils
 from cadence.mayan.trackway import GetSelectedUidList
 from cadence.mayan.trackway import GetUidList
 from cadence.mayan.trackway import GetTrackNodeProps
+from cadence.mayan.trackway import GetTrackNodePropsBatch
 from cadence.mayan.trackway import CreateToken
 from cadence.mayan.trackway import CreateTokens
 from cadence.mayan.trackway import UpdateToken
+from cadence.mayan.trackway import UpdateTokens
 from cadence.mayan.trackway import GetTokenProps
 from cadence.mayan.trackway import DeleteTokens
 
@@ -41,19 +44,36 @@ class TrackwayManager(object):
     FIT_FACTOR   = 0.1
     CADENCE_CAM  = 'CadenceCam'
 
+    # The maximum number of entries sent to Maya in a single remote call by the
+    # batched token and track node operations
+    REMOTE_BATCH_SIZE = 500
+
 #_______________________________________________________________________________
-    def __init__(self):
-        self._session  = None
+    def __init__(self, connection =None):
+        """ Creates a new instance of TrackwayManager. A nimble connection can
+            be specified for the remote calls into Maya, otherwise the default
+            nimble connection is used. """
+
+        self._session    = None
+        self._connection = connection
 
 #===============================================================================
 #                                                                   P U B L I C
 #
+#_______________________________________________________________________________
+    def getConnection(self):
+        """ Returns the nimble connection used for remote calls into Maya. """
+
+        if self._connection is not None:
+            return self._connection
+        return nimble.getConnection()
+
 #_______________________________________________________________________________
     def getUidList(self):
         """ Returns a list of the UIDs of all track nodes currently loaded into
             Maya. """
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
 
         result = conn.runPythonModule(GetUidList, runInMaya=True)
 
@@ -76,9 +96,7 @@ class TrackwayManager(object):
         uidList = self.getUidList()
 
         # compile the corresponding list of track node instances
-        tracks  = list()
-        for uid in uidList:
-            tracks.append(self.getTrackByUid(uid))
+        tracks  = self.getTracksByUids(uidList)
 
         self.closeSession()
         return tracks if len(tracks) > 0 else None
@@ -140,26 +158,10 @@ class TrackwayManager(object):
 
         model   = Tracks_Track.MASTER
         state   = flag if set else 0
-        size    = 200
-        iMax    = len(uidList)/size
-        i       = 0
-        entries = list()
-
         session = self._getSession()
-        while i < iMax:
-            query   = session.query(model)
-            batch   = uidList[i*size : (i + 1)*size]
-            query   = query.filter(model.uid.in_(batch))
-            query   = query.filter(model.sourceFlags.op('&')(flag) == state)
-            entries += query.all()
-            i       += 1
-
-        if i*size < len(uidList):
-            query   = session.query(model)
-            batch   = uidList[i*size :]
-            query   = query.filter(model.uid.in_(batch))
-            query   = query.filter(model.sourceFlags.op('&')(flag) == state)
-            entries += query.all()
+        entries = TrackQueryUtils.queryByUids(
+            session, model, uidList,
+            model.sourceFlags.op('&')(flag) == state)
 
         self.closeSession(commit=False)
 
@@ -227,7 +229,7 @@ class TrackwayManager(object):
             Maya track nodes. A list of the corresponding track models is then
             returned. """
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
         result = conn.runPythonModule(GetSelectedUidList, runInMaya=True )
 
         # Check to see if the remote command execution was successful
@@ -244,12 +246,8 @@ class TrackwayManager(object):
         if len(selectedUidList) == 0:
             return None
 
-        tracks = list()
-        for uid in selectedUidList:
-            track = self.getTrackByUid(uid)
-            if track:
-                track.updateFromNode()
-                tracks.append(track)
+        tracks = self.getTracksByUids(selectedUidList)
+        self.updateTracksFromNodes(tracks)
         return tracks
 
 #_______________________________________________________________________________
@@ -278,6 +276,67 @@ class TrackwayManager(object):
         model = Tracks_Track.MASTER
         return model.getByUid(uid, self._getSession())
 
+#_______________________________________________________________________________
+    def getTracksByUids(self, uidList):
+        """ This gets the track model instances corresponding to a list of
+            uids, in the order of that list. Uids without a track are skipped. """
+
+        model   = Tracks_Track.MASTER
+        session = self._getSession()
+
+        tracks = dict()
+        for track in TrackQueryUtils.queryByUids(session, model, uidList):
+            tracks.setdefault(track.uid, track)
+
+        return [tracks[uid] for uid in uidList if uid in tracks]
+
+#_______________________________________________________________________________
+    def getTrackNodeProps(self, tracks):
+        """ Returns a dictionary keyed by uid with the nodeName and props of
+            the Maya track node for each of the specified tracks, or None for
+            tracks that have no node. The track nodes are located in batches of
+            REMOTE_BATCH_SIZE tracks per remote call, and the tracks of a batch
+            that fails are left out of the dictionary. """
+
+        entries = [
+            {'uid':track.uid, 'nodeName':track.nodeName} for track in tracks]
+        size    = self.REMOTE_BATCH_SIZE
+        results = self._runBatched(GetTrackNodePropsBatch, entries)
+
+        out = dict()
+        for index, result in enumerate(results):
+            if result.payload.get('error') or 'nodes' not in result.payload:
+                print('Error in getTrackNodeProps:',
+                      result.payload.get('message'))
+                continue
+
+            nodes = result.payload['nodes']
+            for entry in entries[index*size:(index + 1)*size]:
+                out[entry['uid']] = nodes.get(entry['uid'])
+        return out
+
+#_______________________________________________________________________________
+    def updateTracksFromNodes(self, tracks):
+        """ Updates each of the specified track model instances with the
+            values of its Maya track node, as Tracks_Track.updateFromNode()
+            does for a single track, using batched remote calls. Tracks in a
+            batch that fails keep their previous nodeName. Returns the number of
+            tracks that were updated. """
+
+        nodes = self.getTrackNodeProps(tracks)
+
+        count = 0
+        for track in tracks:
+            if track.uid not in nodes:
+                continue
+
+            entry = nodes[track.uid]
+            track.nodeName = entry['nodeName'] if entry else None
+            if track.nodeName:
+                track.fromDict(entry['props'])
+                count += 1
+        return count
+
 #_______________________________________________________________________________
     def getTracksByProperties(self, **kwargs):
         """ This gets the track model instances with specified properties. """
@@ -303,7 +362,7 @@ class TrackwayManager(object):
         if track is None:
             return None
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
         result = conn.runPythonModule(
             GetTrackNodeProps,
             uid=track.uid,
@@ -381,10 +440,6 @@ class TrackwayManager(object):
             trackway number). """
 
         model   = Tracks_Track.MASTER
-        size    = 200
-        iMax    = len(uidList)/size
-        i       = 0
-        tracks  = list()
         type    = trackwayName[0]
         number  = trackwayName[1:]
 
@@ -392,22 +447,10 @@ class TrackwayManager(object):
             uidList = self.getUidList()
 
         session = self._getSession()
-        while i < iMax:
-            query   = session.query(model)
-            batch   = uidList[i*size : (i + 1)*size]
-            query   = query.filter(model.uid.in_(batch))
-            query   = query.filter(model.trackwayType == type)
-            query   = query.filter(model.trackwayNumber == number)
-            tracks += query.all()
-            i       += 1
-
-        if i*size < len(uidList):
-            query   = session.query(model)
-            batch   = uidList[i*size :]
-            query   = query.filter(model.uid.in_(batch))
-            query   = query.filter(model.trackwayType == type)
-            query   = query.filter(model.trackwayNumber == number)
-            tracks += query.all()
+        tracks  = TrackQueryUtils.queryByUids(
+            session, model, uidList,
+            model.trackwayType == type,
+            model.trackwayNumber == number)
 
         self.closeSession(commit=False)
         return tracks if len(tracks) > 0 else None
@@ -420,22 +463,19 @@ class TrackwayManager(object):
             necessary to fully qualify the trackway name with site, level, and
             sector. """
 
-        props = { TrackPropEnum.SITE.name:site, TrackPropEnum.LEVEL.name:level }
-
-        # now get all tracks in this trackway (that share this combination of
-        # site and level)
-        tracks = self.getTracksByProperties(**props)
+        model = Tracks_Track.MASTER
 
-        # that list of track instances will be used to compile all trackway
-        # names (with duplicates)
-        trackwayNames = list()
-        for track in tracks:
-            trackwayName = '%s%s' % (track.trackwayType, track.trackwayNumber)
-            trackwayNames.append(trackwayName)
+        # only the distinct trackway type and number pairs of the tracks that
+        # share this combination of site and level are loaded
+        rows = TrackQueryUtils.queryDistinct(
+            self._getSession(),
+            [model.trackwayType, model.trackwayNumber],
+            model.site == site,
+            model.level == level)
 
-        # remove the duplicates, sort 'em and return 'em
-        trackwayNames = list(set(trackwayNames))
-        trackwayNames.sort()
+        # compile the sorted trackway names, where distinct type and number
+        # pairs may still concatenate to the same name
+        trackwayNames = sorted(set(['%s%s' % row for row in rows]))
 
         return trackwayNames if len(trackwayNames) > 0 else None
 
@@ -527,7 +567,7 @@ class TrackwayManager(object):
         """ Create a token in Maya, using the uid and properties specified in
             the dictionary props. """
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
         result = conn.runPythonModule(
             CreateToken,
             uid=props['uid'],
@@ -543,7 +583,7 @@ class TrackwayManager(object):
         """ Create tokens in Maya, each based on the properties specified by a
             corresponding dictionary props within the list propsList. """
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
         result = conn.runPythonModule(
             CreateTokens,
             propsList=propsList,
@@ -558,7 +598,7 @@ class TrackwayManager(object):
         """ This returns a list of URL of the currently selected tokens, or
             None. """
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
         result = conn.runPythonModule(GetSelectedUidList, runInMaya=True)
 
         # Check to see if the remote command execution was successful
@@ -586,7 +626,7 @@ class TrackwayManager(object):
     def getSelectedTokenUid(self):
         """ This returns the URL of the currently selected token, or None. """
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
         result = conn.runPythonModule(GetSelectedUidList, runInMaya=True)
 
         # Check to see if the remote command execution was successful
@@ -619,7 +659,7 @@ class TrackwayManager(object):
         if uid is None:
             return None
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
         result = conn.runPythonModule(GetTokenProps, uid=uid, runInMaya=True)
 
         if result.payload.get('error'):
@@ -634,7 +674,7 @@ class TrackwayManager(object):
             specified by the uid, or an error if it does not exist.  This
             function treats a token and a track node as equivalent. """
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
         result = conn.runPythonModule(GetTokenProps, uid=uid, runInMaya=True)
 
         if result.payload.get('error'):
@@ -648,7 +688,7 @@ class TrackwayManager(object):
         """ This sets the attributes in the Maya token based on the properties
             of the props dictionary that is passed. """
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
         result = conn.runPythonModule(
             UpdateToken,
             uid=uid,
@@ -657,22 +697,32 @@ class TrackwayManager(object):
 
         return result.success
 
+#_______________________________________________________________________________
+    def setTokenPropsList(self, entries):
+        """ This sets the attributes of many Maya tokens, where each entry is
+            a dictionary with the uid of a token and the props dictionary to
+            set on it. The tokens are updated in batches of REMOTE_BATCH_SIZE
+            entries per remote call. Returns whether every token was updated. """
+
+        success = True
+        for result in self._runBatched(UpdateTokens, entries):
+            success = success and result.success
+        return success
+
 #_______________________________________________________________________________
     def refreshTokens(self, uidList, scenario):
         """ The tokens associated with a list of UIDs are updated. """
 
-        for uid in uidList:
-            props = scenario.getProps(uid=uid)
-            self.setTokenProps(uid, props)
+        return self.setTokenPropsList([
+            {'uid':uid, 'props':scenario.getProps(uid=uid)} for uid in uidList])
 
 #_______________________________________________________________________________
     def refreshAllTokens(self, scenario):
         """ This updates the token for every UID in the scenario. """
 
-        entries = scenario.getEntries()
-        for entry in entries:
-            uid = entry['uid']
-            self.setTokenProps(uid, entry)
+        return self.setTokenPropsList([
+            {'uid':entry['uid'], 'props':entry}
+            for entry in scenario.getEntries()])
 
 #_______________________________________________________________________________
     def deleteToken(self, uid):
@@ -692,7 +742,7 @@ class TrackwayManager(object):
         """ This sets the attributes in the Maya token based on the properties
             of the props dictionary that is passed. """
 
-        conn   = nimble.getConnection()
+        conn   = self.getConnection()
         result = conn.runPythonModule(DeleteTokens, runInMaya=True)
 
         return result.success
@@ -963,6 +1013,25 @@ class TrackwayManager(object):
 #===============================================================================
 #                                                                 P R I V A T E
 #
+#_______________________________________________________________________________
+    def _runBatched(self, module, entries, **kwargs):
+        """ Runs the specified remote module in Maya once for each batch of
+            at most REMOTE_BATCH_SIZE of the specified entries, which are passed
+            to the module as its entries argument, and returns the list of the
+            results of those calls. """
+
+        conn = self.getConnection()
+        size = self.REMOTE_BATCH_SIZE
+
+        results = list()
+        for i in range(0, len(entries), size):
+            results.append(conn.runPythonModule(
+                module,
+                entries=entries[i:i + size],
+                runInMaya=True,
+                **kwargs))
+        return results
+
 #_______________________________________________________________________________
     def _getSession(self):
         """ Access to model instances is based on the current model and session,
@@ -0,0 +1,96 @@
+# test_CsvWriter.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from cadence.analysis.shared.CsvWriter import CsvWriter
+
+#*************************************************************************************************** test_CsvWriter
+class test_CsvWriter(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+#_______________________________________________________________________________
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+#_______________________________________________________________________________
+    def test_save(self):
+        """ Rows should be written in field order with the auto index and empty values. """
+
+        path = os.path.join(self.path, 'test.csv')
+        csv = self._createWriter()
+        self._addRows(csv, 3)
+        self.assertTrue(csv.save(path))
+
+        self.assertEqual(self._read(path), '\r\n'.join([
+            'Index,Name,Value,Missing',
+            '1,Tr\xe8s 0,0.0,',
+            '2,Tr\xe8s 1,1.5,',
+            '3,Tr\xe8s 2,3.0,', '' ]))
+        self.assertEqual(csv.count, 3)
+
+#_______________________________________________________________________________
+    def test_flush(self):
+        """ Flushed rows should be cleared from memory and match the buffered output. """
+
+        expected = os.path.join(self.path, 'expected.csv')
+        csv = self._createWriter()
+        self._addRows(csv, 25)
+        csv.save(expected)
+
+        actual = os.path.join(self.path, 'actual.csv')
+        csv = self._createWriter(path=actual, flushCount=10)
+        self._addRows(csv, 25)
+        self.assertEqual(len(csv.rows), 5)
+        self.assertEqual(csv.count, 25)
+        self.assertTrue(csv.save())
+
+        self.assertEqual(self._read(actual), self._read(expected))
+
+#_______________________________________________________________________________
+    def test_removeIfSavedEmpty(self):
+        """ Saving a writer without rows should remove its file. """
+
+        path = os.path.join(self.path, 'empty.csv')
+        with open(path, 'w') as f:
+            f.write('old')
+
+        csv = self._createWriter(path=path)
+        csv.save()
+        self.assertFalse(os.path.exists(path))
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _createWriter(self, **kwargs):
+        return CsvWriter(
+            autoIndexFieldName='Index',
+            fields=[('name', 'Name'), ('value', 'Value'), ('missing', 'Missing')],
+            **kwargs)
+
+#_______________________________________________________________________________
+    def _addRows(self, csv, count):
+        for i in range(count):
+            if i % 2:
+                csv.createRow(name='Tr\xe8s %s' % i, value=1.5*i)
+            else:
+                csv.addRow(dict(name='Tr\xe8s %s' % i, value=1.5*i))
+
+#_______________________________________________________________________________
+    def _read(self, path):
+        with io.open(path, 'r', encoding='latin-1', newline='') as f:
+            return f.read()
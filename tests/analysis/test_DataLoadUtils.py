@@ -0,0 +1,142 @@
+# test_DataLoadUtils.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from cadence.analysis.shared import DataLoadUtils
+
+#*************************************************************************************************** test_DataLoadUtils
+class test_DataLoadUtils(unittest.TestCase):
+    """ Tests the track cache of getTrackWithAnalysis() against stand-in database files, with the
+        reading of the database tables replaced by a counted in-memory frame. """
+
+    REPLACED = ['getDatabasePath', 'getTrackCachePath', '_readTrackWithAnalysis']
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.readCount = 0
+        self.frame = pd.DataFrame(dict(
+            uid=['a', 'b', 'c', 'd', 'e'],
+            site=['BEB', 'BEB', 'CRO', 'CRO', 'TCH'],
+            level=['500', '515', '500', '500', '1040'],
+            width=[0.1, 0.25, 0.4, 0.55, 0.7],
+            sizeClass=[0, 1, 2, 3, 4]),
+            columns=['uid', 'site', 'level', 'width', 'sizeClass'])
+
+        for analysis in [False, True]:
+            with open(self._getDatabasePath(analysis), 'wb') as f:
+                f.write(b'database')
+
+        self.originals = dict((n, getattr(DataLoadUtils, n)) for n in self.REPLACED)
+        DataLoadUtils.getDatabasePath = self._getDatabasePath
+        DataLoadUtils.getTrackCachePath = lambda: os.path.join(self.path, 'tracks.npz')
+        DataLoadUtils._readTrackWithAnalysis = self._readTrackWithAnalysis
+
+#_______________________________________________________________________________
+    def tearDown(self):
+        for name, value in self.originals.items():
+            setattr(DataLoadUtils, name, value)
+        shutil.rmtree(self.path)
+
+#_______________________________________________________________________________
+    def test_cacheReused(self):
+        """ The databases should only be read on the first call while they remain unchanged. """
+        first = DataLoadUtils.getTrackWithAnalysis()
+        second = DataLoadUtils.getTrackWithAnalysis()
+
+        self.assertEqual(self.readCount, 1)
+        self._assertFramesEqual(first, self.frame)
+        self._assertFramesEqual(second, self.frame)
+
+#_______________________________________________________________________________
+    def test_invalidateOnModifiedTime(self):
+        """ Changing the modification time of either database should regenerate the cache. """
+        DataLoadUtils.getTrackWithAnalysis()
+
+        for analysis in [False, True]:
+            path = self._getDatabasePath(analysis)
+            stat = os.stat(path)
+            os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+            self.frame.loc[0, 'width'] += 1.0
+            count = self.readCount
+            self._assertFramesEqual(DataLoadUtils.getTrackWithAnalysis(), self.frame)
+            self.assertEqual(self.readCount, count + 1)
+
+#_______________________________________________________________________________
+    def test_invalidateOnSize(self):
+        """ Changing the size of either database should regenerate the cache even when the
+            modification time is unchanged. """
+        DataLoadUtils.getTrackWithAnalysis()
+
+        for analysis in [False, True]:
+            path = self._getDatabasePath(analysis)
+            stat = os.stat(path)
+            with open(path, 'ab') as f:
+                f.write(b'more')
+            os.utime(path, (stat.st_atime, stat.st_mtime))
+
+            self.frame.loc[1, 'level'] = 'changed'
+            count = self.readCount
+            self._assertFramesEqual(DataLoadUtils.getTrackWithAnalysis(), self.frame)
+            self.assertEqual(self.readCount, count + 1)
+
+#_______________________________________________________________________________
+    def test_filters(self):
+        """ The columns, site and level filters should select the same rows and columns from the
+            cache as they do when reading the databases directly. """
+        filters = [
+            dict(columns=['uid', 'width']),
+            dict(site='CRO'),
+            dict(site=['BEB', 'TCH']),
+            dict(level='500'),
+            dict(site='CRO', level=['500', '515'], columns=['width', 'uid']),
+            dict(site='XYZ') ]
+
+        for kwargs in filters:
+            cached = DataLoadUtils.getTrackWithAnalysis(**kwargs)
+            direct = DataLoadUtils.getTrackWithAnalysis(useCache=False, **kwargs)
+            self._assertFramesEqual(cached, direct)
+
+        df = DataLoadUtils.getTrackWithAnalysis(site='CRO', level='500', columns=['uid'])
+        self.assertEqual(list(df.columns), ['uid'])
+        self.assertEqual(df['uid'].tolist(), ['c', 'd'])
+
+        with self.assertRaises(KeyError):
+            DataLoadUtils.getTrackWithAnalysis(columns=['uid', 'missing'])
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _getDatabasePath(self, analysis =False):
+        return os.path.join(self.path, 'analysis.vdb' if analysis else 'tracks.vdb')
+
+#_______________________________________________________________________________
+    def _readTrackWithAnalysis(self):
+        self.readCount += 1
+        return self.frame.copy()
+
+#_______________________________________________________________________________
+    def _assertFramesEqual(self, df, expected):
+        self.assertEqual(list(df.columns), list(expected.columns))
+        self.assertEqual(df.values.tolist(), expected.values.tolist())
+
+####################################################################################################
+####################################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_DataLoadUtils)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,114 @@
+# test_LineSegmentArray.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import random
+import unittest
+
+import numpy as np
+from pyaid.number.PositionValue2D import PositionValue2D
+
+from cadence.analysis.shared.LineSegment2D import LineSegment2D
+from cadence.analysis.shared.LineSegmentArray import LineSegmentArray
+
+#*************************************************************************************************** test_LineSegmentArray
+class test_LineSegmentArray(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def setUp(self):
+        random.seed(4321)
+
+        self.positions = [
+            PositionValue2D(
+                x=random.uniform(-100.0, 100.0),
+                y=random.uniform(-100.0, 100.0),
+                xUnc=random.uniform(0.01, 0.2),
+                yUnc=random.uniform(0.01, 0.2))
+            for i in range(500) ]
+
+        self.lines = [
+            LineSegment2D(self.positions[i], self.positions[i + 1])
+            for i in range(len(self.positions) - 1) ]
+
+        self.array = LineSegmentArray.fromPositions(self.positions)
+
+#_______________________________________________________________________________
+    def test_lengths(self):
+        """ Confirms that segment lengths and uncertainties match the scalar class """
+        values, uncertainties = self.array.lengths
+
+        for i, line in enumerate(self.lines):
+            length = line.length
+            self.assertAlmostEqual(values[i], length.raw)
+            self.assertAlmostEqual(uncertainties[i], length.rawUncertainty)
+
+#_______________________________________________________________________________
+    def test_angles(self):
+        """ Confirms that segment angles and uncertainties match the scalar class """
+        values, uncertainties = self.array.angles
+
+        for i, line in enumerate(self.lines):
+            angle = line.angle
+            self.assertAlmostEqual(values[i], angle.radians)
+            self.assertAlmostEqual(uncertainties[i], angle.uncertainty)
+
+#_______________________________________________________________________________
+    def test_distanceToPoints(self):
+        """ Confirms that point distances and uncertainties match the scalar class """
+        point = PositionValue2D(1.3, -2.1, 0.05, 0.07)
+        values, uncertainties = self.array.distanceToPoints(
+            point.x, point.y, point.xUnc, point.yUnc)
+
+        for i, line in enumerate(self.lines):
+            distance = line.distanceToPoint(point)
+            self.assertAlmostEqual(values[i], distance.raw)
+            self.assertAlmostEqual(uncertainties[i], distance.rawUncertainty)
+
+#_______________________________________________________________________________
+    def test_closestPointsOnLines(self):
+        """ Confirms that closest points and their uncertainties, including containment, match
+            the scalar class """
+        point = PositionValue2D(1.3, -2.1, 0.05, 0.07)
+
+        for contained in [True, False]:
+            x, y, xUnc, yUnc = self.array.closestPointsOnLines(
+                point.x, point.y, point.xUnc, point.yUnc, contained=contained)
+
+            for i, line in enumerate(self.lines):
+                result = line.closestPointOnLine(point, contained=contained)
+                if result is None:
+                    self.assertTrue(np.isnan(x[i]), 'Expected no contained point at %s' % i)
+                    continue
+
+                self.assertAlmostEqual(x[i], result.x, 6)
+                self.assertAlmostEqual(y[i], result.y, 6)
+                self.assertAlmostEqual(xUnc[i], result.xUnc, 6)
+                self.assertAlmostEqual(yUnc[i], result.yUnc, 6)
+
+#_______________________________________________________________________________
+    def test_extendLines(self):
+        """ Confirms that pre and post extension match the scalar class """
+        self.array.postExtendLines(2.0)
+        self.array.preExtendLines(3.0)
+
+        for i, line in enumerate(self.lines):
+            line = line.clone()
+            line.postExtendLine(2.0)
+            line.preExtendLine(3.0)
+
+            self.assertAlmostEqual(self.array.startX[i], line.start.x, delta=1.0e-3)
+            self.assertAlmostEqual(self.array.startY[i], line.start.y, delta=1.0e-3)
+            self.assertAlmostEqual(self.array.endX[i], line.end.x, delta=1.0e-3)
+            self.assertAlmostEqual(self.array.endY[i], line.end.y, delta=1.0e-3)
+
+####################################################################################################
+####################################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_LineSegmentArray)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,119 @@
+# test_LineSegmentIndex.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import random
+import unittest
+
+from pyaid.number.PositionValue2D import PositionValue2D
+
+from cadence.analysis.curvature.CurveProjectionSegment import CurveProjectionSegment
+from cadence.analysis.curvature.CurveSeries import CurveSeries
+from cadence.analysis.shared.LineSegment2D import LineSegment2D
+from cadence.analysis.shared.LineSegmentIndex import LineSegmentIndex
+
+#*************************************************************************************************** _MockTrack
+class _MockTrack(object):
+    """ Minimal stand-in for a track model with the properties used by curve projection. """
+
+    def __init__(self, x, y):
+        self.positionValue = PositionValue2D(x, y, 0.05, 0.05)
+        self.fingerprint = 'MOCK-%s-%s' % (x, y)
+
+#*************************************************************************************************** test_LineSegmentIndex
+class test_LineSegmentIndex(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def setUp(self):
+        random.seed(1234)
+
+#_______________________________________________________________________________
+    def test_getCandidates(self):
+        """ Confirms that every segment within the search distance of a point is returned as a
+            candidate by comparing against the bounding box distance of every segment. """
+
+        index = LineSegmentIndex(self._createPolyline(200))
+
+        for i in range(500):
+            x = random.uniform(-10.0, 110.0)
+            y = random.uniform(-20.0, 20.0)
+            distance = random.uniform(0.0, 20.0)
+
+            expected = [
+                j for j in range(len(index))
+                if index.getBoundsDistance(j, x, y) <= distance + index.BOUNDS_PADDING ]
+            self.assertEqual(index.getCandidates(x, y, distance), expected)
+
+#_______________________________________________________________________________
+    def test_getNearestVertex(self):
+        """ Confirms that the nearest vertex query matches a linear search of start points. """
+
+        lines = self._createPolyline(200)
+        index = LineSegmentIndex(lines)
+
+        for i in range(500):
+            point = PositionValue2D(random.uniform(-10.0, 110.0), random.uniform(-20.0, 20.0))
+
+            expected = None
+            distanceTo = 1e10
+            for j, line in enumerate(lines):
+                d = line.start.distanceTo(point).raw
+                if d < distanceTo:
+                    distanceTo = d
+                    expected = j
+
+            self.assertEqual(index.getNearestVertex(point.x, point.y), expected)
+
+#_______________________________________________________________________________
+    def test_findSegmentMatch(self):
+        """ Confirms that indexed curve projection produces the same segment matches as the brute
+            force projection over all segments. """
+
+        lines = self._createPolyline(150)
+        segments = []
+        offset = 0.0
+        for i, line in enumerate(lines):
+            segments.append(CurveProjectionSegment(
+                index=i, track=None, line=line, offset=offset))
+            offset += line.length.raw
+        index = LineSegmentIndex([s.line for s in segments])
+
+        for i in range(300):
+            track = _MockTrack(random.uniform(-5.0, 105.0), random.uniform(-5.0, 5.0))
+
+            expected = CurveSeries._findSegmentMatch(track, segments)
+            result = CurveSeries._findSegmentMatch(track, segments, index)
+
+            self.assertIs(result['segment'], expected['segment'])
+            self.assertAlmostEqual(result['distance'], expected['distance'])
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    @classmethod
+    def _createPolyline(cls, count):
+        """ Creates a meandering series of connected line segments similar to a track series. """
+
+        lines = []
+        prev = PositionValue2D(0.0, 0.0, 0.05, 0.05)
+        for i in range(count):
+            point = PositionValue2D(
+                prev.x + random.uniform(0.2, 1.0),
+                prev.y + random.uniform(-0.5, 0.5),
+                0.05, 0.05)
+            lines.append(LineSegment2D(prev, point))
+            prev = point
+        return lines
+
+####################################################################################################
+####################################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_LineSegmentIndex)
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,89 @@
+# test_PdfReport.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from cadence.analysis.shared.plotting.PdfReport import PdfReport
+from cadence.analysis.shared.plotting.ScatterPlot import ScatterPlot
+
+#*************************************************************************************************** test_PdfReport
+class test_PdfReport(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+#_______________________________________________________________________________
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+#_______________________________________________________________________________
+    def test_addPages(self):
+        """ Each added plot and figure should be written as a page of a single report file. """
+
+        path = os.path.join(self.path, 'report', 'test.pdf')
+        report = PdfReport(path)
+        self.assertFalse(report.close())
+        self.assertFalse(os.path.exists(path))
+
+        plot = self._createPlot(10)
+        report.addPlot(plot)
+        self.assertIsNone(plot.figure)
+
+        figure = plt.figure()
+        plt.plot([0.0, 1.0], [1.0, 0.0])
+        report.addFigure()
+        plt.close(figure)
+
+        self.assertEqual(report.count, 2)
+        self.assertTrue(report.close())
+        self.assertEqual(self._getPageCount(path), 2)
+
+#_______________________________________________________________________________
+    def test_rasterizeDenseLayers(self):
+        """ Only layers with at least as many points as the threshold should be rasterized. """
+
+        report = PdfReport(os.path.join(self.path, 'test.pdf'), rasterThreshold=100)
+
+        plot = self._createPlot(100)
+        report.addPlot(plot, close=False)
+        layers = plot.figure.get_axes()[0].lines + plot.figure.get_axes()[0].collections
+        self.assertTrue(all([layer.get_rasterized() for layer in layers]))
+        plot.close()
+
+        plot = self._createPlot(99)
+        report.addPlot(plot, close=False)
+        layers = plot.figure.get_axes()[0].lines + plot.figure.get_axes()[0].collections
+        self.assertFalse(any([layer.get_rasterized() for layer in layers]))
+        plot.close()
+
+        report.close()
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    @classmethod
+    def _createPlot(cls, count):
+        return ScatterPlot(
+            data=[(float(i), float(i % 7), 0.1, 0.2) for i in range(count)],
+            title='Test')
+
+#_______________________________________________________________________________
+    @classmethod
+    def _getPageCount(cls, path):
+        with open(path, 'rb') as f:
+            return f.read().count(b'/Type /Page') - 1
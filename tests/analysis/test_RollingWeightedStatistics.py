@@ -0,0 +1,72 @@
+# test_RollingWeightedStatistics.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import random
+import unittest
+
+from pyaid.number.NumericUtils import NumericUtils
+
+from cadence.analysis.shared.RollingWeightedStatistics import RollingWeightedStatistics
+
+#*************************************************************************************************** test_RollingWeightedStatistics
+class test_RollingWeightedStatistics(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def test_push(self):
+        """ Each window's averages should match the weighted averages of a separate window of the
+            same size, as computed for each entry by the previous sampler. """
+
+        sizes = [2, 3, 5, 7, 9]
+        rolling = RollingWeightedStatistics(sizes)
+        entries = []
+
+        for i in range(30):
+            values = (
+                NumericUtils.toValueUncertainty(random.uniform(-90, 90), random.uniform(1, 5)),
+                NumericUtils.toValueUncertainty(random.uniform(0, 100), random.uniform(0.1, 2)) )
+            entries.append(values)
+
+            windows = rolling.push(*values)
+            self.assertEqual([size for size, averages in windows], [s for s in sizes if s <= i + 1])
+
+            for size, averages in windows:
+                window = entries[-size:]
+                for index in range(len(values)):
+                    expected = NumericUtils.weightedAverage(*[entry[index] for entry in window])
+                    self._assertClose(averages[index].raw, expected.raw)
+                    self._assertClose(averages[index].rawUncertainty, expected.rawUncertainty)
+
+        self.assertEqual(rolling.count, 30)
+        rolling.clear()
+        self.assertEqual(rolling.push(*entries[0]), [])
+
+#_______________________________________________________________________________
+    def test_pushLongSeries(self):
+        """ Rounding in the running sums should not accumulate over a long series of entries with
+            widely varying uncertainties. """
+
+        rolling = RollingWeightedStatistics([2, 4, 9])
+        entries = []
+
+        for i in range(5000):
+            value = NumericUtils.toValueUncertainty(
+                random.uniform(-1000, 1000), random.choice([0.01, 1.0, 50.0]))
+            entries.append(value)
+
+            for size, averages in rolling.push(value):
+                expected = NumericUtils.weightedAverage(*entries[-size:])
+                self._assertClose(averages[0].raw, expected.raw)
+                self._assertClose(averages[0].rawUncertainty, expected.rawUncertainty)
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _assertClose(self, value, expected):
+        self.assertAlmostEqual(value, expected, delta=1.0e-9*max(1.0, abs(expected)))
@@ -0,0 +1,67 @@
+# test_GaitBatchGenerator.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import unittest
+
+from cadence.config.enum.GaitConfigEnum import GaitConfigEnum
+from cadence.config.enum.GeneralConfigEnum import GeneralConfigEnum
+from cadence.generator.gait.GaitBatchGenerator import GaitBatchGenerator
+from cadence.generator.gait.GaitGenerator import GaitGenerator
+
+#*************************************************************************************************** test_GaitBatchGenerator
+class test_GaitBatchGenerator(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def setUp(self):
+        self.configs = GaitBatchGenerator.createSweepConfigs(
+            {
+                GaitConfigEnum.PHASE:[0, 25, 60],
+                GaitConfigEnum.DUTY_FACTOR_FORE:[40, 75],
+                GeneralConfigEnum.STEPS:[20, 30] },
+            overrides={GaitConfigEnum.CYCLES:2, GaitConfigEnum.DUTY_FACTOR_HIND:55})
+
+#_______________________________________________________________________________
+    def test_run(self):
+        """ Each gait of the batch should have the same channel keyframes as the same gait
+            generated by the GaitGenerator. """
+        self.assertEqual(len(self.configs), 12)
+
+        batch = GaitBatchGenerator(self.configs)
+        self.assertTrue(batch.run())
+        self._assertMatchesGenerators(batch)
+
+#_______________________________________________________________________________
+    def test_runParallel(self):
+        """ Gaits generated by worker processes should match those of the GaitGenerator. """
+        batch = GaitBatchGenerator(self.configs)
+        self.assertTrue(batch.run(processes=2))
+        self._assertMatchesGenerators(batch)
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _assertMatchesGenerators(self, batch):
+        for config, generator in zip(self.configs, batch.generators):
+            expected = GaitGenerator(**config)
+            self.assertTrue(expected.run())
+
+            for target, expectedTarget in zip(generator.targets, expected.targets):
+                self.assertEqual(
+                    sorted(target.channels.keys()), sorted(expectedTarget.channels.keys()))
+
+                for kind, channel in expectedTarget.channels.items():
+                    self.assertEqual(target.channels[kind].toDict(), channel.toDict())
+
+####################################################################################################
+####################################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_GaitBatchGenerator)
+    unittest.TextTestRunner(verbosity=2).run(suite)
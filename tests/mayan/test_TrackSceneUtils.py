@@ -0,0 +1,169 @@
+# test_TrackSceneUtils.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import unittest
+
+from cadence.enums.TrackPropEnum import TrackPropEnum
+from cadence.mayan.trackway import TrackSceneUtils as TrackSceneUtilsModule
+from cadence.mayan.trackway.TrackSceneUtils import TrackSceneUtils
+
+#*************************************************************************************************** test_TrackSceneUtils
+class test_TrackSceneUtils(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+    TRACK_SET = 'TrackSet'
+
+#_______________________________________________________________________________
+    def setUp(self):
+        self.cmds = FakeCmds()
+        for i in range(50):
+            self.cmds.addNode('Track%s' % i, 'uid-%s' % i)
+        self.cmds.addNode('Other', None)
+
+        self._cmds = TrackSceneUtilsModule.cmds
+        TrackSceneUtilsModule.cmds = self.cmds
+        TrackSceneUtils.invalidateUidIndex()
+
+#_______________________________________________________________________________
+    def tearDown(self):
+        TrackSceneUtilsModule.cmds = self._cmds
+        TrackSceneUtils.invalidateUidIndex()
+
+#_______________________________________________________________________________
+    def test_indexedLookup(self):
+        """ Only the first lookup should scan the track set members. """
+
+        self.assertEqual(self._getTrackNode('uid-10'), 'Track10')
+        self.assertEqual(self.cmds.counts['sets'], 1)
+        self.assertEqual(self.cmds.counts['getAttr'], 50)
+
+        self.cmds.resetCounts()
+        self.assertEqual(self._getTrackNode('uid-49'), 'Track49')
+        self.assertEqual(TrackSceneUtils.getTokenNode('uid-0', self.TRACK_SET), 'Track0')
+        self.assertEqual(
+            TrackSceneUtils.getNodesByUid(['uid-1', 'uid-2'], self.TRACK_SET),
+            {'uid-1':'Track1', 'uid-2':'Track2'})
+
+        # Indexed nodes are verified by their uid without scanning the track set
+        self.assertEqual(self.cmds.counts['getAttr'], 4)
+        self.assertEqual(self.cmds.counts['hasAttr'], 0)
+        self.assertEqual(self.cmds.counts['sets'], 0)
+
+        # A uid without a node reads the uids of the members again
+        self.cmds.resetCounts()
+        self.assertEqual(TrackSceneUtils.getNodesByUid(['missing'], self.TRACK_SET), dict())
+        self.assertEqual(self.cmds.counts['sets'], 2)
+        self.assertEqual(self.cmds.counts['hasAttr'], 51)
+
+#_______________________________________________________________________________
+    def test_staleIndex(self):
+        """ Deleted, renamed and new members should be found by scanning only what changed. """
+
+        self._getTrackNode('uid-0')
+
+        self.cmds.removeNode('Track1')
+        self.cmds.renameNode('Track2', 'Renamed2')
+        self.cmds.addNode('Track50', 'uid-50')
+        self.cmds.resetCounts()
+
+        self.assertEqual(self._getTrackNode('uid-2'), 'Renamed2')
+        self.assertEqual(self._getTrackNode('uid-50'), 'Track50')
+        self.assertEqual(self.cmds.counts['hasAttr'], 2)
+        self.assertIsNone(self._getTrackNode('uid-1'))
+
+        # Nodes created through TrackSceneUtils are added to the index directly
+        self.cmds.addNode('Track51', 'uid-51')
+        TrackSceneUtils._addToUidIndex('Track51', self.TRACK_SET)
+        self.cmds.resetCounts()
+
+        self.assertEqual(self._getTrackNode('uid-51'), 'Track51')
+        self.assertEqual(self.cmds.counts['sets'], 0)
+
+#_______________________________________________________________________________
+    def test_changedUid(self):
+        """ Indexed nodes whose uid attributes were changed should be found by their new uids and
+            no longer by their old ones. """
+
+        self._getTrackNode('uid-0')
+
+        self.cmds.attrs['Track5'][FakeCmds.UID_ATTR] = 'uid-changed'
+        self.cmds.attrs['Track6'][FakeCmds.UID_ATTR] = 'uid-60'
+
+        self.assertEqual(self._getTrackNode('uid-changed'), 'Track5')
+        self.assertIsNone(self._getTrackNode('uid-5'))
+        self.assertIsNone(self._getTrackNode('uid-6'))
+        self.assertEqual(
+            TrackSceneUtils.getNodesByUid(['uid-60', 'uid-changed'], self.TRACK_SET),
+            {'uid-60':'Track6', 'uid-changed':'Track5'})
+
+        # Once re-indexed, the changed nodes are found without scanning the track set
+        self.cmds.resetCounts()
+        self.assertEqual(self._getTrackNode('uid-changed'), 'Track5')
+        self.assertEqual(self.cmds.counts['sets'], 0)
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _getTrackNode(self, uid):
+        return TrackSceneUtils.getTrackNode(uid, trackSetNode=self.TRACK_SET)
+
+####################################################################################################
+####################################################################################################
+
+#*************************************************************************************************** FakeCmds
+class FakeCmds(object):
+    """ A mock of the Maya cmds module for a single track set, which counts the calls made to each
+        of its commands. """
+
+    UID_ATTR = TrackPropEnum.UID.maya
+
+#_______________________________________________________________________________
+    def __init__(self):
+        self.members = []
+        self.attrs   = dict()
+        self.counts  = dict()
+        self.resetCounts()
+
+#_______________________________________________________________________________
+    def resetCounts(self):
+        self.counts = {'sets':0, 'hasAttr':0, 'getAttr':0}
+
+#_______________________________________________________________________________
+    def addNode(self, node, uid):
+        self.members.append(node)
+        self.attrs[node] = {} if uid is None else {self.UID_ATTR:uid}
+
+#_______________________________________________________________________________
+    def removeNode(self, node):
+        self.members.remove(node)
+        del self.attrs[node]
+
+#_______________________________________________________________________________
+    def renameNode(self, node, name):
+        self.members[self.members.index(node)] = name
+        self.attrs[name] = self.attrs.pop(node)
+
+#_______________________________________________________________________________
+    def sets(self, setNode, query =False, **kwargs):
+        self.counts['sets'] += 1
+        return list(self.members)
+
+#_______________________________________________________________________________
+    def hasAttr(self, path):
+        self.counts['hasAttr'] += 1
+        node, attr = path.split('.')
+        return attr in self.attrs.get(node, {})
+
+#_______________________________________________________________________________
+    def getAttr(self, path):
+        self.counts['getAttr'] += 1
+        node, attr = path.split('.')
+        if attr not in self.attrs.get(node, {}):
+            raise ValueError('No object matches name: %s' % path)
+        return self.attrs[node][attr]
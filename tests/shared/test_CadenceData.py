@@ -0,0 +1,114 @@
+# test_CadenceData.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from cadence.shared.enum.ChannelsEnum import ChannelsEnum
+from cadence.shared.enum.KeyEventEnum import KeyEventEnum
+from cadence.shared.enum.TangentsEnum import TangentsEnum
+from cadence.shared.io.CadenceData import CadenceData
+from cadence.shared.io.channel.DataChannel import DataChannel
+
+#*************************************************************************************************** test_CadenceData
+class test_CadenceData(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+#_______________________________________________________________________________
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+#_______________________________________________________________________________
+    def test_binaryRoundTrip(self):
+        """ Binary files should convert losslessly to and from the JSON format. """
+
+        cd = self._createData()
+        expected = json.loads(cd.write())
+
+        path = cd.writeBinary(self.path)
+        self.assertEqual(path, os.path.join(self.path, 'test' + CadenceData.BINARY_EXTENSION))
+
+        loaded = CadenceData()
+        self.assertTrue(loaded.loadFile(path))
+        self.assertEqual(loaded.name, 'test')
+        self.assertEqual(json.loads(loaded.write()), expected)
+
+        # Converting the binary file back to JSON and then binary again should not change it
+        converted = CadenceData()
+        self.assertTrue(converted.load(loaded.write()))
+        with open(path, 'rb') as f:
+            original = f.read()
+        with open(converted.writeBinary(self.path, name='converted'), 'rb') as f:
+            self.assertEqual(f.read(), original)
+
+#_______________________________________________________________________________
+    def test_lazyLoading(self):
+        """ Only the requested channels of a binary file should be loaded. """
+
+        path = self._createData().writeBinary(self.path)
+        cd = CadenceData()
+        self.assertTrue(cd.loadFile(path))
+
+        channel = cd.getChannelByName('position')
+        self.assertEqual(len(channel.keys), 3)
+        self.assertEqual(channel.keys[1].value.toList(), [1.5, 0.25, 20.0])
+        self.assertEqual(channel.keys[1].event, KeyEventEnum.AERIAL)
+        self.assertEqual(self._getLoadedNames(cd), ['position'])
+
+        self.assertEqual(len(cd.getChannelsByKind(ChannelsEnum.GAIT_PHASE)), 1)
+        self.assertEqual(self._getLoadedNames(cd), ['gait', 'position'])
+
+        self.assertIsNone(cd.getChannelsByKind('missing'))
+        self.assertEqual(len(cd.channels), 3)
+        self.assertEqual(self._getLoadedNames(cd), ['gait', 'position', 'mixed'])
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _createData(self):
+        cd = CadenceData(name='test')
+        cd.addChannel(DataChannel(
+            name='gait',
+            kind=ChannelsEnum.GAIT_PHASE,
+            target='left_hind',
+            times=[0.0, 0.5, 1.0, 1.5],
+            values=[1.0, 1.0, 0.0, 0.0],
+            tangents=TangentsEnum.STEPPED ))
+
+        cd.addChannel(DataChannel(
+            name='position',
+            kind=ChannelsEnum.POSITION,
+            target='left_hind',
+            keys=[
+                {'t':0.0, 'v':[1.0, 0.0, 10.0], 'dt':'v', 'e':KeyEventEnum.LAND,
+                 'it':TangentsEnum.FLAT, 'ot':TangentsEnum.FLAT},
+                {'t':0.5, 'v':[1.5, 0.25, 20.0], 'dt':'v', 'e':KeyEventEnum.AERIAL,
+                 'it':[TangentsEnum.LINEAR, TangentsEnum.FLAT, TangentsEnum.SPLINE],
+                 'ot':[TangentsEnum.LINEAR, TangentsEnum.FLAT, TangentsEnum.SPLINE]},
+                {'t':1.0, 'v':[2.0, 0.0, 30.0], 'dt':'v', 'e':KeyEventEnum.LIFT, 'n':'end'} ]))
+
+        # Integer and enum keys cannot be stored as float arrays and are stored as dictionaries
+        cd.addChannel(DataChannel(
+            name='mixed',
+            kind='other',
+            target='right_hind',
+            keys=[{'t':0, 'v':1}, {'t':1.0, 'v':'a'}] ))
+
+        return cd
+
+#_______________________________________________________________________________
+    def _getLoadedNames(self, cd):
+        return [c.name for c in cd._channels if isinstance(c, DataChannel)]
@@ -0,0 +1,65 @@
+# test_DataChannel.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import random
+import unittest
+
+from cadence.shared.enum.TangentsEnum import TangentsEnum
+from cadence.shared.io.channel.DataChannel import DataChannel
+
+#*************************************************************************************************** test_DataChannel
+class test_DataChannel(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def test_addKeyframe(self):
+        """ Keyframes added in any order should be stored sorted by time. """
+
+        times = list(range(50))
+        random.shuffle(times)
+
+        dc = DataChannel(name='test')
+        for t in times:
+            dc.addKeyframe({'t':t, 'v':float(t)})
+            # Access the cached lists to make sure later inserts update them
+            self.assertEqual(dc.values, sorted(dc.values))
+
+        self.assertEqual(dc.times, list(range(50)))
+        self.assertEqual([k.time for k in dc.keys], list(range(50)))
+        self.assertEqual(dc.getKeyIndex(-1), -1)
+        self.assertEqual(dc.getKeyIndex(10.5), 10)
+
+#_______________________________________________________________________________
+    def test_sample(self):
+        """ Sampling should follow the out tangent of the previous keyframe by default. """
+
+        dc = DataChannel(keys=[
+            {'t':0.0, 'v':0.0, 'ot':TangentsEnum.LINEAR},
+            {'t':2.0, 'v':4.0, 'ot':TangentsEnum.STEPPED},
+            {'t':4.0, 'v':0.0, 'ot':TangentsEnum.STEPPED_NEXT},
+            {'t':6.0, 'v':2.0} ])
+
+        result = dc.sample([-1.0, 0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 8.0])
+        self.assertEqual(list(result), [0.0, 0.0, 2.0, 4.0, 4.0, 0.0, 2.0, 2.0, 2.0])
+
+        self.assertEqual(list(dc.sample([1.0, 3.0], mode=TangentsEnum.STEPPED)), [0.0, 4.0])
+        self.assertEqual(list(dc.sample([1.0, 3.0], mode=TangentsEnum.STEPPED_NEXT)), [4.0, 0.0])
+        self.assertEqual(list(dc.sample([1.0, 3.0], mode=TangentsEnum.LINEAR)), [2.0, 2.0])
+
+#_______________________________________________________________________________
+    def test_sampleVector(self):
+        """ Vector channels should be sampled per component. """
+
+        dc = DataChannel(keys=[
+            {'t':0.0, 'v':[0.0, 0.0, 0.0], 'dt':'v'},
+            {'t':2.0, 'v':[2.0, 4.0, 6.0], 'dt':'v'} ])
+
+        result = dc.sample([1.0, 3.0])
+        self.assertEqual(result.shape, (2, 3))
+        self.assertEqual(list(result[0]), [1.0, 2.0, 3.0])
+        self.assertEqual(list(result[1]), [2.0, 4.0, 6.0])
@@ -0,0 +1,57 @@
+# test_TargetData.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import math
+import unittest
+
+import numpy as np
+
+from cadence.shared.data.TargetData import TargetData
+
+#*************************************************************************************************** test_TargetData
+class test_TargetData(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def test_computeGaitPhases(self):
+        """ Each row should match the gait phases computed one step at a time. """
+
+        dutyFactors = [0.25, 0.5, 0.75, 0.6]
+        stepOffsets = [0, 50, 13, -7]
+
+        phases = TargetData.computeGaitPhases(300, 3, dutyFactors, stepOffsets)
+        self.assertEqual(phases.shape, (4, 300))
+
+        for row, dutyFactor, offset in zip(phases, dutyFactors, stepOffsets):
+            expected = self._computeGaitPhases(300, 3, dutyFactor, offset)
+            self.assertEqual(list(row), list(expected))
+
+#_______________________________________________________________________________
+    def test_findGaitEvents(self):
+        """ Lifts and lands should be found per row, wrapping from the last step to the first. """
+
+        events = TargetData.findGaitEvents([
+            [1.0, 1.0, 0.0, 0.0, 1.0, 0.0],
+            [0.0, 1.0, 1.0, 0.0, 0.0, 0.0],
+            [1.0, 1.0, 1.0, 1.0, 1.0, 1.0] ])
+
+        self.assertEqual(len(events), 3)
+        self.assertEqual([list(e) for e in events[0]], [[2, 5], [0, 4]])
+        self.assertEqual([list(e) for e in events[1]], [[3], [1]])
+        self.assertEqual([list(e) for e in events[2]], [[], []])
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _computeGaitPhases(self, steps, cycles, dutyFactor, offset):
+        d = np.zeros(steps)
+        for i in range(0, steps):
+            cyclePhase = math.modf(float(i)*float(cycles)/float(steps))[0]
+            d[i]       = int(cyclePhase <= dutyFactor)
+        return np.roll(d, offset)
@@ -0,0 +1,101 @@
+# test_SvgRenderService.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from cadence.svg.SvgRenderService import SvgRenderService
+
+# A stand-in for Inkscape that copies the SVG file to the PDF path, or fails for SVG files that
+# contain the word FAIL
+STUB_SCRIPT = '; '.join([
+    'import shutil, sys',
+    'sys.exit(1) if b"FAIL" in open(sys.argv[1], "rb").read() else None',
+    'shutil.copyfile(sys.argv[1], sys.argv[2])' ])
+
+STUB_COMMAND = [sys.executable, '-c', STUB_SCRIPT, '{svg}', '{pdf}']
+
+#*************************************************************************************************** test_SvgRenderService
+class test_SvgRenderService(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+#_______________________________________________________________________________
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+#_______________________________________________________________________________
+    def test_render(self):
+        """ Every submitted SVG file should be rendered to a PDF file with latencies reported. """
+
+        service = SvgRenderService(command=STUB_COMMAND, workerCount=3)
+        for i in range(6):
+            service.submit(self._createSvg('drawing-%s' % i, '<svg id="%s"/>' % i))
+
+        results = service.close()
+        self.assertEqual(len(results), 6)
+        for result in results:
+            self.assertIsNone(result['error'])
+            self.assertIsNone(result['source'])
+            self.assertTrue(os.path.exists(result['pdfPath']))
+            self.assertGreaterEqual(result['renderTime'], 0.0)
+            self.assertGreaterEqual(result['queueTime'], 0.0)
+
+        self.assertLessEqual(len(service._workers), 3)
+        self.assertEqual(service.pendingCount, 0)
+
+#_______________________________________________________________________________
+    def test_dedupe(self):
+        """ SVG files with identical content should be rendered once and copied otherwise. """
+
+        service = SvgRenderService(command=STUB_COMMAND)
+        first = service.submit(self._createSvg('first', '<svg id="same"/>'))
+        second = service.submit(self._createSvg('second', '<svg id="same"/>'))
+        service.wait()
+
+        third = service.submit(self._createSvg('third', '<svg id="same"/>'))
+        service.close()
+
+        self.assertIsNone(first['source'])
+        for result in [second, third]:
+            self.assertEqual(result['source'], first['pdfPath'])
+            self.assertIsNone(result['error'])
+            with open(result['pdfPath'], 'rb') as f:
+                self.assertEqual(f.read(), b'<svg id="same"/>')
+
+#_______________________________________________________________________________
+    def test_failure(self):
+        """ A failed render should be reported on the result and its duplicates. """
+
+        service = SvgRenderService(command=STUB_COMMAND)
+        first = service.submit(self._createSvg('first', '<svg id="FAIL"/>'))
+        second = service.submit(self._createSvg('second', '<svg id="FAIL"/>'))
+        service.close()
+
+        self.assertIsNotNone(first['error'])
+        self.assertEqual(second['error'], first['error'])
+        self.assertFalse(os.path.exists(first['pdfPath']))
+
+        report = SvgRenderService.createReport([first, second])
+        self.assertEqual(len(report), 3)
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _createSvg(self, name, content):
+        path = os.path.join(self.path, name + '.svg')
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
@@ -0,0 +1,98 @@
+# test_SvgStreamDrawing.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import svgwrite
+
+from cadence.svg.SvgStreamDrawing import SvgStreamDrawing
+
+#*************************************************************************************************** test_SvgStreamDrawing
+class test_SvgStreamDrawing(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+#_______________________________________________________________________________
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+#_______________________________________________________________________________
+    def test_identicalOutput(self):
+        """ The saved and written output should match that of the svgwrite.Drawing. """
+
+        expected = self._createDrawing(svgwrite.Drawing, 'expected')
+        actual = self._createDrawing(SvgStreamDrawing, 'actual')
+        self.assertEqual(actual.streamedCount, 32)
+
+        for drawing in [expected, actual]:
+            drawing.save()
+
+        with open(expected.filename, 'rb') as f:
+            expectedBytes = f.read()
+        with open(actual.filename, 'rb') as f:
+            self.assertEqual(f.read(), expectedBytes)
+
+        expectedText = io.StringIO()
+        expected.write(expectedText)
+
+        # Read the stream in small chunks to split the multi-byte characters in the labels
+        actual.CHUNK_SIZE = 5
+        actualText = io.StringIO()
+        actual.write(actualText)
+        self.assertEqual(actualText.getvalue(), expectedText.getvalue())
+
+#_______________________________________________________________________________
+    def test_emptyDrawing(self):
+        """ A drawing without elements should match the empty svgwrite.Drawing. """
+
+        expected = svgwrite.Drawing(os.path.join(self.path, 'expected.svg'), profile='tiny')
+        actual = SvgStreamDrawing(os.path.join(self.path, 'actual.svg'), profile='tiny')
+
+        expectedText = io.StringIO()
+        expected.write(expectedText)
+        actualText = io.StringIO()
+        actual.write(actualText)
+        self.assertEqual(actualText.getvalue(), expectedText.getvalue())
+
+#===============================================================================
+#                                                                               P R O T E C T E D
+
+#_______________________________________________________________________________
+    def _createDrawing(self, DrawingClass, name):
+        drawing = DrawingClass(
+            os.path.join(self.path, name + '.svg'),
+            profile='tiny',
+            size=('100mm', '50mm'),
+            stroke=svgwrite.rgb(0, 0, 0))
+        drawing.add(drawing.rect((0, 0), ('100mm', '50mm'), opacity='0'))
+
+        # Groups are populated after they are added to the defs
+        group = drawing.g(id='mark')
+        drawing.defs.add(group)
+        group.add(drawing.line((-2, 0), (2, 0)))
+        group.add(drawing.line((0, -2), (0, 2)))
+
+        for i in range(10):
+            instance = drawing.use(group, stroke='red')
+            instance.translate(10*i, 5*i)
+            instance.rotate(-45)
+            instance.scale(2, sy=3)
+            drawing.add(instance)
+
+            drawing.add(drawing.circle((10*i, 5*i), 1.5, fill='none'))
+            drawing.add(drawing.text('S%s éè' % i, (10*i, 5*i), font_size='4'))
+
+        drawing.add(drawing.polyline([(0, 0), (10, 20), (30, 40)], fill='none'))
+        return drawing
@@ -0,0 +1,97 @@
+# test_TrackQueryUtils.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import unittest
+
+import sqlalchemy as sqla
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+from cadence.views.tools.trackwayManager.TrackQueryUtils import TrackQueryUtils
+
+Base = declarative_base()
+
+#*************************************************************************************************** test_TrackQueryUtils
+class test_TrackQueryUtils(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def setUp(self):
+        self.engine = sqla.create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.session.add_all([
+            QueryTrack(
+                uid='uid-%s' % i,
+                site='BEB' if i % 2 else 'CRO',
+                trackwayType='S' if i % 3 else 'N',
+                trackwayNumber=str(i % 4))
+            for i in range(3000) ])
+        self.session.commit()
+
+        self._threshold = TrackQueryUtils.TEMP_TABLE_THRESHOLD
+
+#_______________________________________________________________________________
+    def tearDown(self):
+        TrackQueryUtils.TEMP_TABLE_THRESHOLD = self._threshold
+        self.session.close()
+        self.engine.dispose()
+
+#_______________________________________________________________________________
+    def test_getChunkSize(self):
+        """ Chunks should fit within the SQLite variable limit with room for other filters. """
+
+        limit = TrackQueryUtils.getVariableLimit(self.session)
+        self.assertGreaterEqual(limit, TrackQueryUtils.SQLITE_VARIABLE_LIMIT)
+        self.assertEqual(
+            TrackQueryUtils.getChunkSize(self.session),
+            limit - TrackQueryUtils.RESERVED_VARIABLE_COUNT)
+
+#_______________________________________________________________________________
+    def test_queryByUids(self):
+        """ Chunked and temporary table queries should return the same filtered tracks. """
+
+        uids = ['uid-%s' % i for i in range(0, 3000, 2)] + ['uid-0', 'missing']
+        expected = set(['uid-%s' % i for i in range(0, 3000, 6)])
+
+        for threshold in [len(uids), 10]:
+            TrackQueryUtils.TEMP_TABLE_THRESHOLD = threshold
+            tracks = TrackQueryUtils.queryByUids(
+                self.session, QueryTrack, uids, QueryTrack.trackwayType == 'N')
+            self.assertEqual(len(tracks), len(expected))
+            self.assertEqual(set([t.uid for t in tracks]), expected)
+
+        # The temporary tables should be removed once their queries complete
+        names = self.session.execute(sqla.text(
+            'SELECT name FROM sqlite_temp_master WHERE type = \'table\'')).fetchall()
+        self.assertEqual(names, [])
+        self.assertEqual(TrackQueryUtils.queryByUids(self.session, QueryTrack, []), [])
+
+#_______________________________________________________________________________
+    def test_queryDistinct(self):
+        """ Distinct column values should be returned sorted for the filtered rows. """
+
+        rows = TrackQueryUtils.queryDistinct(
+            self.session,
+            [QueryTrack.trackwayType, QueryTrack.trackwayNumber],
+            QueryTrack.site == 'CRO')
+        self.assertEqual(rows, [
+            ('N', '0'), ('N', '2'), ('S', '0'), ('S', '2') ])
+
+####################################################################################################
+####################################################################################################
+
+#*************************************************************************************************** QueryTrack
+class QueryTrack(Base):
+    __tablename__ = 'tracks'
+
+    id              = sqla.Column(sqla.Integer, primary_key=True)
+    uid             = sqla.Column(sqla.Unicode, index=True)
+    site            = sqla.Column(sqla.Unicode)
+    trackwayType    = sqla.Column(sqla.Unicode)
+    trackwayNumber  = sqla.Column(sqla.Unicode)
@@ -0,0 +1,136 @@
+# test_TrackwayManager.py [UNIT TEST]
+# (C)2016
+# Scott Ernst
+
+from __future__ import print_function, absolute_import, unicode_literals, division
+
+import unittest
+
+from cadence.views.tools.trackwayManager.TrackwayManager import TrackwayManager
+
+#*************************************************************************************************** test_TrackwayManager
+class test_TrackwayManager(unittest.TestCase):
+
+#===============================================================================
+#                                                                                       C L A S S
+
+#_______________________________________________________________________________
+    def test_refreshTokens(self):
+        """ Token updates should be sent to Maya in batches of the remote batch size. """
+
+        uids = ['uid-%s' % i for i in range(7)]
+        conn = FakeNimbleConnection(UpdateTokens=lambda entries: {
+            'success':all([e['uid'] in uids for e in entries]),
+            'nodeNames':dict([(e['uid'], 'Token_%s' % e['uid']) for e in entries]) })
+
+        manager = TrackwayManager(connection=conn)
+        manager.REMOTE_BATCH_SIZE = 3
+
+        self.assertTrue(manager.refreshTokens(uids, FakeScenario()))
+        self.assertEqual([call[0] for call in conn.calls], ['UpdateTokens']*3)
+
+        entries = [entry for call in conn.calls for entry in call[1]['entries']]
+        self.assertEqual([entry['uid'] for entry in entries], uids)
+        self.assertEqual(entries[4]['props'], {'uid':'uid-4', 'x':4.0})
+
+        self.assertFalse(manager.refreshTokens(['uid-9'], FakeScenario()))
+        self.assertEqual(len(conn.calls), 4)
+
+#_______________________________________________________________________________
+    def test_updateTracksFromNodes(self):
+        """ Tracks should be updated from their nodes in batched remote calls. """
+
+        tracks = [FakeTrack('uid-%s' % i) for i in range(5)]
+        conn = FakeNimbleConnection(GetTrackNodePropsBatch=lambda entries: {
+            'success':True,
+            'nodes':dict([
+                (e['uid'], {'nodeName':'Track_%s' % e['uid'], 'props':{'uid':e['uid']}})
+                for e in entries if e['uid'] != 'uid-3' ]) })
+
+        manager = TrackwayManager(connection=conn)
+        manager.REMOTE_BATCH_SIZE = 2
+
+        self.assertEqual(manager.updateTracksFromNodes(tracks), 4)
+        self.assertEqual(len(conn.calls), 3)
+        self.assertEqual(tracks[0].nodeName, 'Track_uid-0')
+        self.assertEqual(tracks[0].props, {'uid':'uid-0'})
+        self.assertIsNone(tracks[3].nodeName)
+        self.assertIsNone(tracks[3].props)
+
+#_______________________________________________________________________________
+    def test_updateTracksFromNodesBatchError(self):
+        """ Tracks in a batch that fails should keep their previous node names while the tracks
+            of the other batches are updated. """
+
+        tracks = [FakeTrack('uid-%s' % i) for i in range(6)]
+        for track in tracks:
+            track.nodeName = 'Old_%s' % track.uid
+
+        def getNodes(entries):
+            if 'uid-2' in [e['uid'] for e in entries]:
+                return {'success':False, 'error':True, 'message':'Remote failure'}
+            return {
+                'success':True,
+                'nodes':dict([
+                    (e['uid'], {'nodeName':'Track_%s' % e['uid'], 'props':{'uid':e['uid']}})
+                    for e in entries if e['uid'] != 'uid-5' ]) }
+
+        conn = FakeNimbleConnection(GetTrackNodePropsBatch=getNodes)
+        manager = TrackwayManager(connection=conn)
+        manager.REMOTE_BATCH_SIZE = 2
+
+        self.assertEqual(manager.updateTracksFromNodes(tracks), 3)
+        self.assertEqual(len(conn.calls), 3)
+
+        self.assertEqual(
+            [track.nodeName for track in tracks],
+            ['Track_uid-0', 'Track_uid-1', 'Old_uid-2', 'Old_uid-3', 'Track_uid-4', None])
+        self.assertIsNone(tracks[2].props)
+        self.assertIsNone(tracks[3].props)
+
+####################################################################################################
+####################################################################################################
+
+#*************************************************************************************************** FakeNimbleConnection
+class FakeNimbleConnection(object):
+    """ Records each remote call and returns the payload of the handler for the called module
+        instead of running the module in Maya. """
+
+#_______________________________________________________________________________
+    def __init__(self, **handlers):
+        self.handlers = handlers
+        self.calls    = []
+
+#_______________________________________________________________________________
+    def runPythonModule(self, module, runInMaya =None, **kwargs):
+        name = module.__name__.split('.')[-1]
+        self.calls.append((name, kwargs))
+        return FakeNimbleResult(self.handlers[name](**kwargs))
+
+#*************************************************************************************************** FakeNimbleResult
+class FakeNimbleResult(object):
+
+#_______________________________________________________________________________
+    def __init__(self, payload):
+        self.payload = payload
+        self.success = payload.get('success', True)
+
+#*************************************************************************************************** FakeScenario
+class FakeScenario(object):
+
+#_______________________________________________________________________________
+    def getProps(self, uid):
+        return {'uid':uid, 'x':float(uid.split('-')[-1])}
+
+#*************************************************************************************************** FakeTrack
+class FakeTrack(object):
+
+#_______________________________________________________________________________
+    def __init__(self, uid):
+        self.uid      = uid
+        self.nodeName = None
+        self.props    = None
+
+#_______________________________________________________________________________
+    def fromDict(self, props):
+        self.props = props